@@ -0,0 +1,74 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import Connection, engine_from_config, pool
+
+from app.features.reviews.infrastructure.tables import metadata
+from app.shared.infrastructure.database import validate_database_url
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+config.set_main_option("sqlalchemy.url", validate_database_url().replace("%", "%%"))
+
+target_metadata = metadata
+
+# Tablas de otras features referenciadas por llaves foráneas de reseñas.
+EXTERNAL_TABLES = frozenset({"users", "records"})
+
+
+def _include_object(
+    _object: object, name: str | None, type_: str, _reflected: bool, _compare_to: object
+) -> bool:
+    return type_ != "table" or name not in EXTERNAL_TABLES
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_with_connection(connection: Connection) -> None:
+    target_metadata.reflect(connection, only=lambda name, _: name in EXTERNAL_TABLES)
+    # La reflexión abre una transacción implícita; alembic debe controlar la suya.
+    connection.rollback()
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=_include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # Permite que comandos como ``seed`` migren usando su propia conexión.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        _run_with_connection(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,74 @@
+"""Tablas base de reseñas.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # ``users`` y ``records`` pertenecen a sus propias features y deben existir antes.
+    op.create_table(
+        "reviews",
+        sa.Column("id", PGUUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "record_id", PGUUID(as_uuid=True), sa.ForeignKey("records.id", ondelete="CASCADE")
+        ),
+        sa.Column("user_id", PGUUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("rent_amount", sa.Numeric(10, 2)),
+        sa.Column("review_text", sa.Text, nullable=False),
+        sa.Column("rating", sa.SmallInteger, nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "review_images",
+        sa.Column("id", PGUUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "review_id", PGUUID(as_uuid=True), sa.ForeignKey("reviews.id", ondelete="CASCADE")
+        ),
+        sa.Column("image_url", sa.Text, nullable=False),
+        sa.Column("uploaded_at", sa.DateTime, nullable=False),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "review_comments",
+        sa.Column("id", PGUUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "review_id", PGUUID(as_uuid=True), sa.ForeignKey("reviews.id", ondelete="CASCADE")
+        ),
+        sa.Column("user_id", PGUUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("comment_text", sa.Text, nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "review_votes",
+        sa.Column("id", PGUUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "review_id", PGUUID(as_uuid=True), sa.ForeignKey("reviews.id", ondelete="CASCADE")
+        ),
+        sa.Column("user_id", PGUUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("useful", sa.Boolean, nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("review_votes")
+    op.drop_table("review_comments")
+    op.drop_table("review_images")
+    op.drop_table("reviews")
@@ -0,0 +1,46 @@
+"""Contadores de votos por reseña.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_vote_counts",
+        sa.Column(
+            "review_id",
+            PGUUID(as_uuid=True),
+            sa.ForeignKey("reviews.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("useful_votes", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("not_useful_votes", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        INSERT INTO review_vote_counts (review_id, useful_votes, not_useful_votes)
+        SELECT review_id,
+               count(*) FILTER (WHERE useful),
+               count(*) FILTER (WHERE NOT useful)
+        FROM review_votes
+        GROUP BY review_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("review_vote_counts")
@@ -0,0 +1,64 @@
+"""Índices para las consultas de PostgresReviewRepository.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from app.shared.infrastructure.migrations import create_index_concurrently
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (nombre, tabla, columnas, único). Cada índice corresponde a una consulta del repositorio.
+INDEXES: tuple[tuple[str, str, list[str], bool], ...] = (
+    # create_review: verificación de reseña duplicada por (user_id, record_id).
+    ("uq_reviews_user_id_record_id", "reviews", ["user_id", "record_id"], True),
+    # list_reviews_for_record: filtro por record_id, orden y keyset por (created_at, id).
+    ("ix_reviews_record_id_created_at_id", "reviews", ["record_id", "created_at", "id"], False),
+    # list_images: filtro por review_id ordenado por uploaded_at.
+    (
+        "ix_review_images_review_id_uploaded_at",
+        "review_images",
+        ["review_id", "uploaded_at"],
+        False,
+    ),
+    # list_comments: filtro por review_id, orden y keyset por (created_at, id).
+    (
+        "ix_review_comments_review_id_created_at_id",
+        "review_comments",
+        ["review_id", "created_at", "id"],
+        False,
+    ),
+    # upsert_vote: árbitro del ON CONFLICT (review_id, user_id).
+    ("uq_review_votes_review_id_user_id", "review_votes", ["review_id", "user_id"], True),
+    # ON DELETE CASCADE desde users.
+    ("ix_review_comments_user_id", "review_comments", ["user_id"], False),
+    ("ix_review_votes_user_id", "review_votes", ["user_id"], False),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY no bloquea escrituras, pero no puede ejecutarse dentro de una transacción.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            create_index_concurrently(name, table, columns, unique=unique)
+
+    # Creada por review.sql; el índice único anterior la reemplaza.
+    op.execute("ALTER TABLE reviews DROP CONSTRAINT IF EXISTS unique_review_per_user")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE reviews ADD CONSTRAINT unique_review_per_user UNIQUE (user_id, record_id)"
+    )
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""Marca de versión updated_at en reseñas.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.shared.infrastructure.migrations import create_index_concurrently
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # now() es estable: Postgres guarda el valor por defecto sin reescribir la tabla.
+    op.add_column(
+        "reviews",
+        sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    # ETag del listado por vivienda: count(*) y max(updated_at) con un index-only scan.
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_reviews_record_id_updated_at", "reviews", ["record_id", "updated_at"]
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_reviews_record_id_updated_at",
+            table_name="reviews",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_column("reviews", "updated_at")
@@ -0,0 +1,63 @@
+"""Agregados de reseñas por vivienda.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "record_review_stats",
+        sa.Column(
+            "record_id",
+            PGUUID(as_uuid=True),
+            sa.ForeignKey("records.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("review_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_1", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_2", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_3", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_4", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_5", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rating_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rent_total", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("rent_count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        INSERT INTO record_review_stats (
+            record_id, review_count, rating_1, rating_2, rating_3, rating_4, rating_5,
+            rating_total, rent_total, rent_count
+        )
+        SELECT record_id,
+               count(*),
+               count(*) FILTER (WHERE rating = 1),
+               count(*) FILTER (WHERE rating = 2),
+               count(*) FILTER (WHERE rating = 3),
+               count(*) FILTER (WHERE rating = 4),
+               count(*) FILTER (WHERE rating = 5),
+               sum(rating),
+               coalesce(sum(rent_amount), 0),
+               count(rent_amount)
+        FROM reviews
+        GROUP BY record_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("record_review_stats")
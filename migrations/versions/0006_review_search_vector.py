@@ -0,0 +1,50 @@
+"""Búsqueda de texto completo sobre review_text.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.shared.infrastructure.migrations import create_index_concurrently
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Una columna generada STORED reescribe la tabla bajo ACCESS EXCLUSIVE: programar en
+    # una ventana de mantenimiento en bases grandes. Las bases creadas con review.sql
+    # admiten review_text NULL: coalesce evita que la columna NOT NULL falle al agregarse.
+    op.add_column(
+        "reviews",
+        sa.Column(
+            "search_vector",
+            TSVECTOR,
+            sa.Computed("to_tsvector('spanish', coalesce(review_text, ''))", persisted=True),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_reviews_search_vector", "reviews", ["search_vector"], postgresql_using="gin"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_reviews_search_vector",
+            table_name="reviews",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_column("reviews", "search_vector")
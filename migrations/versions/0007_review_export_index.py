@@ -0,0 +1,35 @@
+"""Índice para la exportación de reseñas.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from app.shared.infrastructure.migrations import create_index_concurrently
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # stream_reviews: rango sobre created_at y orden (created_at, id) sin ordenar en memoria.
+    # Por usuario alcanza con uq_reviews_user_id_record_id y por vivienda con el del listado.
+    with op.get_context().autocommit_block():
+        create_index_concurrently("ix_reviews_created_at_id", "reviews", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_reviews_created_at_id",
+            table_name="reviews",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
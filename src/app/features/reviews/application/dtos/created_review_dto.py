@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+
+
+@dataclass(slots=True, frozen=True)
+class CreatedReviewDTO:
+    """Reseña recién creada junto con las imágenes insertadas en la misma transacción."""
+
+    id: UUID
+    record_id: UUID
+    user_id: UUID
+    rent_amount: Decimal | None
+    review_text: str
+    rating: int
+    created_at: datetime
+    images: list[ReviewImageDTO]
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
+from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+from app.features.reviews.domain.expansion import ReviewExpansion
+
+
+@dataclass(slots=True, frozen=True)
+class ExpandedReviewDTO:
+    """Reseña con los recursos hijos pedidos; los no pedidos quedan en ``None``."""
+
+    id: UUID
+    record_id: UUID
+    user_id: UUID
+    rent_amount: Decimal | None
+    review_text: str
+    rating: int
+    created_at: datetime
+    images: list[ReviewImageDTO] | None = None
+    comments: list[ReviewCommentDTO] | None = None
+    useful_votes: int | None = None
+    not_useful_votes: int | None = None
+
+
+# Campos de ``ExpandedReviewDTO`` que aporta cada expansión.
+EXPANSION_FIELDS: dict[ReviewExpansion, tuple[str, ...]] = {
+    ReviewExpansion.IMAGES: ("images",),
+    ReviewExpansion.COMMENTS: ("comments",),
+    ReviewExpansion.VOTES: ("useful_votes", "not_useful_votes"),
+}
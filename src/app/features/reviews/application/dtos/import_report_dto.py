@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class ImportRowErrorDTO:
+    line: int
+    error: str
+
+
+@dataclass(slots=True, frozen=True)
+class ImportReportDTO:
+    received: int
+    imported: int
+    failed: int
+    errors: list[ImportRowErrorDTO]
+    elapsed_seconds: float
+    rows_per_second: float
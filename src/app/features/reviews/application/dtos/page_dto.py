@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class PageDTO[T]:
+    items: list[T]
+    next_cursor: str | None
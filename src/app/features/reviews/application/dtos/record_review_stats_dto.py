@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class RecordReviewStatsDTO:
+    record_id: UUID
+    review_count: int
+    average_rating: float | None
+    rating_histogram: dict[int, int]
+    average_rent: Decimal | None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.features.reviews.application.dtos.review_dto import ReviewDTO
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewLookupDTO:
+    """Resultado de buscar un id en un lote; ``review`` es ``None`` si no existe."""
+
+    id: UUID
+    review: ReviewDTO | None
@@ -1,14 +1,21 @@
 from uuid import UUID
 
+from app.features.reviews.application.dtos.created_review_dto import CreatedReviewDTO
+from app.features.reviews.application.dtos.expanded_review_dto import ExpandedReviewDTO
+from app.features.reviews.application.dtos.record_review_stats_dto import RecordReviewStatsDTO
 from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
 from app.features.reviews.application.dtos.review_dto import ReviewDTO
 from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+from app.features.reviews.application.dtos.review_match_dto import ReviewMatchDTO
 from app.features.reviews.application.dtos.review_vote_dto import ReviewVoteDTO
 from app.features.reviews.application.dtos.review_vote_summary_dto import ReviewVoteSummaryDTO
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
 from app.features.reviews.domain.entities.review import Review
 from app.features.reviews.domain.entities.review_comment import ReviewComment
 from app.features.reviews.domain.entities.review_image import ReviewImage
 from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.expansion import ExpandedReview
+from app.features.reviews.domain.search import ReviewMatch
 
 
 def to_review_dto(review: Review) -> ReviewDTO:
@@ -23,6 +30,59 @@ def to_review_dto(review: Review) -> ReviewDTO:
     )
 
 
+def to_review_match_dto(match: ReviewMatch) -> ReviewMatchDTO:
+    review = match.review
+    return ReviewMatchDTO(
+        id=review.id,
+        record_id=review.record_id,
+        user_id=review.user_id,
+        rent_amount=review.rent_amount,
+        review_text=review.review_text,
+        rating=review.rating,
+        created_at=review.created_at,
+        rank=match.rank,
+    )
+
+
+def to_created_review_dto(review: Review, images: list[ReviewImage]) -> CreatedReviewDTO:
+    return CreatedReviewDTO(
+        id=review.id,
+        record_id=review.record_id,
+        user_id=review.user_id,
+        rent_amount=review.rent_amount,
+        review_text=review.review_text,
+        rating=review.rating,
+        created_at=review.created_at,
+        images=[to_review_image_dto(image) for image in images],
+    )
+
+
+def to_expanded_review_dto(expanded: ExpandedReview) -> ExpandedReviewDTO:
+    review = expanded.review
+    useful, not_useful = expanded.votes if expanded.votes is not None else (None, None)
+    return ExpandedReviewDTO(
+        id=review.id,
+        record_id=review.record_id,
+        user_id=review.user_id,
+        rent_amount=review.rent_amount,
+        review_text=review.review_text,
+        rating=review.rating,
+        created_at=review.created_at,
+        images=(
+            None
+            if expanded.images is None
+            else [to_review_image_dto(image) for image in expanded.images]
+        ),
+        comments=(
+            None
+            if expanded.comments is None
+            else [to_review_comment_dto(comment) for comment in expanded.comments]
+        ),
+        useful_votes=useful,
+        not_useful_votes=not_useful,
+    )
+
+
 def to_review_image_dto(image: ReviewImage) -> ReviewImageDTO:
     return ReviewImageDTO(
         id=image.id,
@@ -56,3 +116,14 @@ def to_vote_summary_dto(review_id: UUID, useful: int, not_useful: int) -> Review
     return ReviewVoteSummaryDTO(
         review_id=review_id, useful_votes=useful, not_useful_votes=not_useful
     )
+
+
+def to_record_review_stats_dto(stats: RecordReviewStats) -> RecordReviewStatsDTO:
+    average_rating = stats.average_rating
+    return RecordReviewStatsDTO(
+        record_id=stats.record_id,
+        review_count=stats.review_count,
+        average_rating=round(average_rating, 2) if average_rating is not None else None,
+        rating_histogram=dict(stats.rating_histogram),
+        average_rent=stats.average_rent,
+    )
@@ -0,0 +1,63 @@
+import base64
+import binascii
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from app.features.reviews.domain.exceptions import InvalidCursorError
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.search import ReviewMatch
+
+
+class _Keyed(Protocol):
+    @property
+    def id(self) -> UUID: ...
+
+    @property
+    def created_at(self) -> datetime: ...
+
+
+def encode_cursor(cursor: PageCursor) -> str:
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> PageCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, _, review_id = raw.partition("|")
+        return PageCursor(created_at=datetime.fromisoformat(created_at), id=UUID(review_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
+def next_page_cursor(items: Sequence[_Keyed], limit: int) -> str | None:
+    """Retorna el cursor de la siguiente página si el repositorio entregó ``limit + 1`` filas."""
+    if len(items) <= limit:
+        return None
+    last = items[limit - 1]
+    return encode_cursor(PageCursor(created_at=last.created_at, id=last.id))
+
+
+def encode_search_cursor(cursor: SearchCursor) -> str:
+    # repr de un float se vuelve a leer exacto: la página siguiente empieza justo después.
+    raw = f"{cursor.rank!r}|{cursor.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(token: str) -> SearchCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        rank, _, review_id = raw.partition("|")
+        return SearchCursor(rank=float(rank), id=UUID(review_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
+def next_search_cursor(matches: Sequence[ReviewMatch], limit: int) -> str | None:
+    """Como ``next_page_cursor``, con la posición ``(rank, id)`` de la última coincidencia."""
+    if len(matches) <= limit:
+        return None
+    last = matches[limit - 1]
+    return encode_search_cursor(SearchCursor(rank=last.rank, id=last.review.id))
@@ -0,0 +1,35 @@
+from collections.abc import Mapping, Sequence
+from uuid import UUID
+
+from app.features.reviews.application.dtos.review_lookup_dto import ReviewLookupDTO
+from app.features.reviews.application.mappers import to_review_dto
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+
+def _in_request_order(
+    review_ids: Sequence[UUID], found: Mapping[UUID, Review]
+) -> list[ReviewLookupDTO]:
+    dtos = {review_id: to_review_dto(review) for review_id, review in found.items()}
+    return [ReviewLookupDTO(id=review_id, review=dtos.get(review_id)) for review_id in review_ids]
+
+
+class BatchGetReviewsUseCase:
+    def __init__(self, repository: ReviewRepository) -> None:
+        self._repository = repository
+
+    def execute(self, review_ids: Sequence[UUID]) -> list[ReviewLookupDTO]:
+        found = self._repository.get_reviews(list(dict.fromkeys(review_ids)))
+        return _in_request_order(review_ids, found)
+
+
+class AsyncBatchGetReviewsUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, review_ids: Sequence[UUID]) -> list[ReviewLookupDTO]:
+        found = await self._repository.get_reviews(list(dict.fromkeys(review_ids)))
+        return _in_request_order(review_ids, found)
@@ -3,21 +3,46 @@ from uuid import UUID
 from app.features.reviews.application.dtos.review_vote_dto import ReviewVoteDTO
 from app.features.reviews.application.mappers import to_review_vote_dto
 from app.features.reviews.domain.entities.review_vote import ReviewVote
-from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+from app.features.reviews.domain.vote_queue import VoteQueue
 
 
 class CastReviewVoteUseCase:
     def __init__(
         self,
         repository: ReviewRepository,
+        queue: VoteQueue | None = None,
     ) -> None:
         self._repository = repository
+        self._queue = queue
 
     def execute(self, review_id: UUID, user_id: UUID, useful: bool) -> ReviewVoteDTO:
-        if self._repository.get_review(review_id) is None:
-            raise ReviewNotFoundError(f"Review {review_id} was not found")
         vote = ReviewVote(review_id=review_id, user_id=user_id, useful=useful)
+        if self._queue is not None:
+            # Escritura diferida: se retorna el voto aceptado antes de guardarlo.
+            self._queue.enqueue(vote)
+            return to_review_vote_dto(vote)
         saved = self._repository.upsert_vote(vote)
         dto = to_review_vote_dto(saved)
         return dto
+
+
+class AsyncCastReviewVoteUseCase:
+    def __init__(
+        self,
+        repository: AsyncReviewRepository,
+        queue: VoteQueue | None = None,
+    ) -> None:
+        self._repository = repository
+        self._queue = queue
+
+    async def execute(self, review_id: UUID, user_id: UUID, useful: bool) -> ReviewVoteDTO:
+        vote = ReviewVote(review_id=review_id, user_id=user_id, useful=useful)
+        if self._queue is not None:
+            self._queue.enqueue(vote)
+            return to_review_vote_dto(vote)
+        saved = await self._repository.upsert_vote(vote)
+        return to_review_vote_dto(saved)
@@ -1,9 +1,24 @@
 from app.features.reviews.application.dtos.create_review_dto import CreateReviewDTO
-from app.features.reviews.application.dtos.review_dto import ReviewDTO
-from app.features.reviews.application.mappers import to_review_dto
+from app.features.reviews.application.dtos.created_review_dto import CreatedReviewDTO
+from app.features.reviews.application.mappers import to_created_review_dto
 from app.features.reviews.domain.entities.review import Review
 from app.features.reviews.domain.entities.review_image import ReviewImage
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+
+def _build(dto: CreateReviewDTO) -> tuple[Review, list[ReviewImage]]:
+    review = Review(
+        record_id=dto.record_id,
+        user_id=dto.user_id,
+        rent_amount=dto.rent_amount,
+        review_text=dto.review_text,
+        rating=dto.rating,
+    )
+    images = [ReviewImage(review_id=review.id, image_url=url) for url in dto.image_urls]
+    return review, images
 
 
 class CreateReviewUseCase:
@@ -13,18 +28,20 @@ class CreateReviewUseCase:
     ) -> None:
         self._repository = repository
 
-    def execute(self, dto: CreateReviewDTO) -> ReviewDTO:
-        review = Review(
-            record_id=dto.record_id,
-            user_id=dto.user_id,
-            rent_amount=dto.rent_amount,
-            review_text=dto.review_text,
-            rating=dto.rating,
-        )
-        created = self._repository.create_review(review)
-
-        for image_url in dto.image_urls:
-            self._repository.add_image(ReviewImage(review_id=created.id, image_url=image_url))
-
-        review_dto = to_review_dto(created)
-        return review_dto
+    def execute(self, dto: CreateReviewDTO) -> CreatedReviewDTO:
+        review, images = _build(dto)
+        created, created_images = self._repository.create_review_with_images(review, images)
+        return to_created_review_dto(created, created_images)
+
+
+class AsyncCreateReviewUseCase:
+    def __init__(
+        self,
+        repository: AsyncReviewRepository,
+    ) -> None:
+        self._repository = repository
+
+    async def execute(self, dto: CreateReviewDTO) -> CreatedReviewDTO:
+        review, images = _build(dto)
+        created, created_images = await self._repository.create_review_with_images(review, images)
+        return to_created_review_dto(created, created_images)
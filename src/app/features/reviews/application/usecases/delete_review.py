@@ -1,7 +1,9 @@
 from uuid import UUID
 
-from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
 
 
 class DeleteReviewUseCase:
@@ -9,7 +11,12 @@ class DeleteReviewUseCase:
         self._repository = repository
 
     def execute(self, review_id: UUID) -> None:
-        review = self._repository.get_review(review_id)
-        if review is None:
-            raise ReviewNotFoundError(f"Review {review_id} was not found")
         self._repository.delete_review(review_id)
+
+
+class AsyncDeleteReviewUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, review_id: UUID) -> None:
+        await self._repository.delete_review(review_id)
@@ -0,0 +1,37 @@
+from collections.abc import AsyncGenerator, Generator
+from contextlib import aclosing, closing
+
+from app.features.reviews.application.dtos.expanded_review_dto import ExpandedReviewDTO
+from app.features.reviews.application.mappers import to_expanded_review_dto
+from app.features.reviews.domain.expansion import ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+
+class ExportReviewsUseCase:
+    def __init__(self, repository: ReviewRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self, filters: ReviewFilter, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReviewDTO]]:
+        with closing(self._repository.stream_reviews(filters, expand=expand)) as batches:
+            for batch in batches:
+                yield [to_expanded_review_dto(item) for item in batch]
+
+
+class AsyncExportReviewsUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, filters: ReviewFilter, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReviewDTO]]:
+        # Cerrar el generador del repositorio libera el cursor del servidor en cuanto el
+        # consumidor se detiene, sin esperar al recolector.
+        async with aclosing(self._repository.stream_reviews(filters, expand=expand)) as batches:
+            async for batch in batches:
+                yield [to_expanded_review_dto(item) for item in batch]
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from app.features.reviews.application.dtos.record_review_stats_dto import RecordReviewStatsDTO
+from app.features.reviews.application.mappers import to_record_review_stats_dto
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+
+class GetRecordReviewStatsUseCase:
+    def __init__(self, repository: ReviewRepository) -> None:
+        self._repository = repository
+
+    def execute(self, record_id: UUID) -> RecordReviewStatsDTO:
+        return to_record_review_stats_dto(self._repository.get_record_stats(record_id))
+
+
+class AsyncGetRecordReviewStatsUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, record_id: UUID) -> RecordReviewStatsDTO:
+        return to_record_review_stats_dto(await self._repository.get_record_stats(record_id))
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+from app.features.reviews.domain.versions import VersionedResource
+
+
+class GetResourceVersionUseCase:
+    def __init__(self, repository: ReviewRepository) -> None:
+        self._repository = repository
+
+    def execute(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return self._repository.get_version(resource, resource_id)
+
+
+class AsyncGetResourceVersionUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return await self._repository.get_version(resource, resource_id)
@@ -3,7 +3,10 @@ from uuid import UUID
 from app.features.reviews.application.dtos.review_dto import ReviewDTO
 from app.features.reviews.application.mappers import to_review_dto
 from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
 
 
 class GetReviewUseCase:
@@ -15,3 +18,14 @@ class GetReviewUseCase:
         if review is None:
             raise ReviewNotFoundError(f"Review {review_id} was not found")
         return to_review_dto(review)
+
+
+class AsyncGetReviewUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, review_id: UUID) -> ReviewDTO:
+        review = await self._repository.get_review(review_id)
+        if review is None:
+            raise ReviewNotFoundError(f"Review {review_id} was not found")
+        return to_review_dto(review)
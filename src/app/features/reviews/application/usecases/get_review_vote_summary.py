@@ -2,8 +2,10 @@ from uuid import UUID
 
 from app.features.reviews.application.dtos.review_vote_summary_dto import ReviewVoteSummaryDTO
 from app.features.reviews.application.mappers import to_vote_summary_dto
-from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
 
 
 class GetReviewVoteSummaryUseCase:
@@ -11,7 +13,14 @@ class GetReviewVoteSummaryUseCase:
         self._repository = repository
 
     def execute(self, review_id: UUID) -> ReviewVoteSummaryDTO:
-        if self._repository.get_review(review_id) is None:
-            raise ReviewNotFoundError(f"Review {review_id} was not found")
         useful, not_useful = self._repository.get_votes_summary(review_id)
         return to_vote_summary_dto(review_id, useful, not_useful)
+
+
+class AsyncGetReviewVoteSummaryUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, review_id: UUID) -> ReviewVoteSummaryDTO:
+        useful, not_useful = await self._repository.get_votes_summary(review_id)
+        return to_vote_summary_dto(review_id, useful, not_useful)
@@ -0,0 +1,206 @@
+import json
+import time
+from collections.abc import AsyncIterable, Iterable, Mapping
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from app.features.reviews.application.dtos.import_report_dto import (
+    ImportReportDTO,
+    ImportRowErrorDTO,
+)
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.exceptions import ReviewError
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+DEFAULT_IMPORT_BATCH_SIZE = 5_000
+# Más allá de este número de errores solo se cuentan; el reporte no crece sin límite.
+MAX_REPORTED_ERRORS = 1_000
+MAX_REVIEW_TEXT_LENGTH = 10_000
+# Una fila válida cabe holgada aun con review_text escapado en JSON (``\uXXXX``); más larga
+# se rechaza sin leerla completa.
+MAX_IMPORT_LINE_BYTES = 8 * MAX_REVIEW_TEXT_LENGTH
+# rent_amount es NUMERIC(10, 2): un valor mayor haría fallar el lote completo en la base.
+MAX_RENT_AMOUNT = Decimal("100000000")
+_CENTS = Decimal("0.01")
+
+_REJECTION_MESSAGES = {
+    ImportRejection.DUPLICATE: "User already submitted a review for this record",
+    ImportRejection.UNKNOWN_RECORD: "Record does not exist",
+    ImportRejection.UNKNOWN_USER: "User does not exist",
+}
+
+_Batch = list[tuple[int, Review]]
+
+
+def _required(row: dict[str, Any], name: str) -> object:
+    value = row.get(name)
+    if value is None:
+        raise ValueError(f"Missing field {name}")
+    return value
+
+
+def _rent_amount(value: object) -> Decimal | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        raise ValueError("rent_amount must be a number")
+    amount = Decimal(str(value))
+    if not amount.is_finite() or abs(amount) >= MAX_RENT_AMOUNT:
+        raise ValueError(f"rent_amount must be below {MAX_RENT_AMOUNT}")
+    # Con más de 2 decimales la base redondearía (99999999.995 -> 100000000.00) y el valor
+    # guardado ya no cumpliría el límite: se rechaza en lugar de redondear.
+    cents = amount.quantize(_CENTS)
+    if cents != amount:
+        raise ValueError("rent_amount must have at most 2 decimal places")
+    return cents
+
+
+def _created_at(value: object) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError("created_at must be an ISO 8601 string")
+    created_at = datetime.fromisoformat(value)
+    # created_at se guarda sin zona horaria y en UTC: una fecha con offset se convierte
+    # aquí para que ambos adaptadores guarden el mismo instante.
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(UTC).replace(tzinfo=None)
+    return created_at
+
+
+def parse_review_row(line: str | bytes) -> Review:
+    """Convierte una línea NDJSON en ``Review`` con las mismas reglas que ``POST /reviews``."""
+    if len(line) > MAX_IMPORT_LINE_BYTES:
+        raise ValueError(f"Row must not exceed {MAX_IMPORT_LINE_BYTES} bytes")
+    row = json.loads(line)
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+
+    review_text = _required(row, "review_text")
+    if not isinstance(review_text, str) or not 1 <= len(review_text) <= MAX_REVIEW_TEXT_LENGTH:
+        raise ValueError(f"review_text must have 1 to {MAX_REVIEW_TEXT_LENGTH} characters")
+    if "\x00" in review_text:
+        raise ValueError("review_text must not contain NUL characters")
+    rating = _required(row, "rating")
+    if not isinstance(rating, int) or isinstance(rating, bool):
+        raise ValueError("rating must be an integer")
+
+    review = Review(
+        record_id=UUID(str(_required(row, "record_id"))),
+        user_id=UUID(str(_required(row, "user_id"))),
+        rent_amount=_rent_amount(row.get("rent_amount")),
+        review_text=review_text,
+        rating=rating,
+    )
+    # Las cargas desde otras plataformas conservan la fecha original de la reseña.
+    if (created_at := row.get("created_at")) is not None:
+        review.created_at = _created_at(created_at)
+    return review
+
+
+class _ImportProgress:
+    """Valida líneas, arma lotes y acumula el reporte de una carga."""
+
+    def __init__(self, batch_size: int) -> None:
+        self._batch_size = batch_size
+        self._started = time.perf_counter()
+        self._line = 0
+        self._pending: _Batch = []
+        self._received = 0
+        self._imported = 0
+        self._failed = 0
+        self._errors: list[ImportRowErrorDTO] = []
+
+    def add(self, line: str | bytes) -> _Batch | None:
+        """Valida la línea y retorna el lote pendiente cuando se llena."""
+        self._line += 1
+        if not line.strip():
+            return None
+
+        self._received += 1
+        try:
+            self._pending.append((self._line, parse_review_row(line)))
+        except (ValueError, TypeError, ArithmeticError, ReviewError) as exc:
+            self._fail(self._line, str(exc))
+            return None
+        return self.take() if len(self._pending) >= self._batch_size else None
+
+    def take(self) -> _Batch:
+        batch, self._pending = self._pending, []
+        return batch
+
+    def record(self, batch: _Batch, rejected: Mapping[UUID, ImportRejection]) -> None:
+        for line, review in batch:
+            reason = rejected.get(review.id)
+            if reason is None:
+                self._imported += 1
+            else:
+                self._fail(line, _REJECTION_MESSAGES[reason])
+
+    def report(self) -> ImportReportDTO:
+        elapsed = time.perf_counter() - self._started
+        return ImportReportDTO(
+            received=self._received,
+            imported=self._imported,
+            failed=self._failed,
+            errors=sorted(self._errors, key=lambda error: error.line),
+            elapsed_seconds=elapsed,
+            rows_per_second=self._received / elapsed if elapsed > 0 else 0.0,
+        )
+
+    def _fail(self, line: int, error: str) -> None:
+        self._failed += 1
+        if len(self._errors) < MAX_REPORTED_ERRORS:
+            self._errors.append(ImportRowErrorDTO(line=line, error=error))
+
+
+class ImportReviewsUseCase:
+    def __init__(
+        self,
+        repository: ReviewRepository,
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> None:
+        self._repository = repository
+        self._batch_size = batch_size
+
+    def execute(self, lines: Iterable[str | bytes]) -> ImportReportDTO:
+        progress = _ImportProgress(self._batch_size)
+        for line in lines:
+            if batch := progress.add(line):
+                self._import(progress, batch)
+        if batch := progress.take():
+            self._import(progress, batch)
+        return progress.report()
+
+    def _import(self, progress: _ImportProgress, batch: _Batch) -> None:
+        rejected = self._repository.import_reviews([review for _, review in batch])
+        progress.record(batch, rejected)
+
+
+class AsyncImportReviewsUseCase:
+    def __init__(
+        self,
+        repository: AsyncReviewRepository,
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> None:
+        self._repository = repository
+        self._batch_size = batch_size
+
+    async def execute(self, lines: AsyncIterable[str | bytes]) -> ImportReportDTO:
+        progress = _ImportProgress(self._batch_size)
+        async for line in lines:
+            if batch := progress.add(line):
+                await self._import(progress, batch)
+        if batch := progress.take():
+            await self._import(progress, batch)
+        return progress.report()
+
+    async def _import(self, progress: _ImportProgress, batch: _Batch) -> None:
+        rejected = await self._repository.import_reviews([review for _, review in batch])
+        progress.record(batch, rejected)
@@ -1,9 +1,13 @@
 from uuid import UUID
 
+from app.features.reviews.application.dtos.page_dto import PageDTO
 from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
 from app.features.reviews.application.mappers import to_review_comment_dto
-from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.application.pagination import decode_cursor, next_page_cursor
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
 
 
 class ListReviewCommentsUseCase:
@@ -11,9 +15,30 @@ class ListReviewCommentsUseCase:
         self._repository = repository
 
     def execute(
-        self, review_id: UUID, *, limit: int = 20, offset: int = 0
-    ) -> list[ReviewCommentDTO]:
-        if self._repository.get_review(review_id) is None:
-            raise ReviewNotFoundError(f"Review {review_id} was not found")
-        comments = self._repository.list_comments(review_id, limit=limit, offset=offset)
-        return [to_review_comment_dto(comment) for comment in comments]
+        self, review_id: UUID, *, limit: int = 20, offset: int = 0, cursor: str | None = None
+    ) -> PageDTO[ReviewCommentDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        comments = self._repository.list_comments(
+            review_id, limit=limit + 1, offset=offset, after=after
+        )
+        return PageDTO(
+            items=[to_review_comment_dto(comment) for comment in comments[:limit]],
+            next_cursor=next_page_cursor(comments, limit),
+        )
+
+
+class AsyncListReviewCommentsUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, review_id: UUID, *, limit: int = 20, offset: int = 0, cursor: str | None = None
+    ) -> PageDTO[ReviewCommentDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        comments = await self._repository.list_comments(
+            review_id, limit=limit + 1, offset=offset, after=after
+        )
+        return PageDTO(
+            items=[to_review_comment_dto(comment) for comment in comments[:limit]],
+            next_cursor=next_page_cursor(comments, limit),
+        )
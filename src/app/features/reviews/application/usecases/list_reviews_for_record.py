@@ -1,14 +1,66 @@
 from uuid import UUID
 
-from app.features.reviews.application.dtos.review_dto import ReviewDTO
-from app.features.reviews.application.mappers import to_review_dto
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.application.dtos.expanded_review_dto import ExpandedReviewDTO
+from app.features.reviews.application.dtos.page_dto import PageDTO
+from app.features.reviews.application.mappers import to_expanded_review_dto
+from app.features.reviews.application.pagination import decode_cursor, next_page_cursor
+from app.features.reviews.domain.expansion import ReviewExpansion
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+# Comentarios embebidos por reseña al expandir un listado; el resto se pagina aparte.
+COMMENTS_PREVIEW_LIMIT = 3
 
 
 class ListReviewsForRecordUseCase:
     def __init__(self, repository: ReviewRepository) -> None:
         self._repository = repository
 
-    def execute(self, record_id: UUID, *, limit: int = 20, offset: int = 0) -> list[ReviewDTO]:
-        reviews = self._repository.list_reviews_for_record(record_id, limit=limit, offset=offset)
-        return [to_review_dto(review) for review in reviews]
+    def execute(
+        self,
+        record_id: UUID,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: frozenset[ReviewExpansion] = frozenset(),
+    ) -> PageDTO[ExpandedReviewDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        reviews = self._repository.list_reviews_for_record(
+            record_id, limit=limit + 1, offset=offset, after=after
+        )
+        expanded = self._repository.expand_reviews(
+            reviews[:limit], expand, comments_limit=COMMENTS_PREVIEW_LIMIT
+        )
+        return PageDTO(
+            items=[to_expanded_review_dto(item) for item in expanded],
+            next_cursor=next_page_cursor(reviews, limit),
+        )
+
+
+class AsyncListReviewsForRecordUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self,
+        record_id: UUID,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: frozenset[ReviewExpansion] = frozenset(),
+    ) -> PageDTO[ExpandedReviewDTO]:
+        after = decode_cursor(cursor) if cursor else None
+        reviews = await self._repository.list_reviews_for_record(
+            record_id, limit=limit + 1, offset=offset, after=after
+        )
+        expanded = await self._repository.expand_reviews(
+            reviews[:limit], expand, comments_limit=COMMENTS_PREVIEW_LIMIT
+        )
+        return PageDTO(
+            items=[to_expanded_review_dto(item) for item in expanded],
+            next_cursor=next_page_cursor(reviews, limit),
+        )
@@ -0,0 +1,54 @@
+from uuid import UUID
+
+from app.features.reviews.application.dtos.page_dto import PageDTO
+from app.features.reviews.application.dtos.review_match_dto import ReviewMatchDTO
+from app.features.reviews.application.mappers import to_review_match_dto
+from app.features.reviews.application.pagination import decode_search_cursor, next_search_cursor
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
+
+
+class SearchReviewsUseCase:
+    def __init__(self, repository: ReviewRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> PageDTO[ReviewMatchDTO]:
+        after = decode_search_cursor(cursor) if cursor else None
+        matches = self._repository.search_reviews(
+            query, record_id=record_id, limit=limit + 1, after=after
+        )
+        return PageDTO(
+            items=[to_review_match_dto(match) for match in matches[:limit]],
+            next_cursor=next_search_cursor(matches, limit),
+        )
+
+
+class AsyncSearchReviewsUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> PageDTO[ReviewMatchDTO]:
+        after = decode_search_cursor(cursor) if cursor else None
+        matches = await self._repository.search_reviews(
+            query, record_id=record_id, limit=limit + 1, after=after
+        )
+        return PageDTO(
+            items=[to_review_match_dto(match) for match in matches[:limit]],
+            next_cursor=next_search_cursor(matches, limit),
+        )
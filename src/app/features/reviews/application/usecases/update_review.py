@@ -3,8 +3,11 @@ from uuid import UUID
 from app.features.reviews.application.dtos.review_dto import ReviewDTO
 from app.features.reviews.application.dtos.update_review_dto import UpdateReviewDTO
 from app.features.reviews.application.mappers import to_review_dto
-from app.features.reviews.domain.exceptions import ReviewNotFoundError
-from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.entities.review import validate_rating
+from app.features.reviews.domain.repositories import (
+    AsyncReviewRepository,
+    ReviewRepository,
+)
 
 
 class UpdateReviewUseCase:
@@ -12,16 +15,30 @@ class UpdateReviewUseCase:
         self._repository = repository
 
     def execute(self, review_id: UUID, dto: UpdateReviewDTO) -> ReviewDTO:
-        review = self._repository.get_review(review_id)
-        if review is None:
-            raise ReviewNotFoundError(f"Review {review_id} was not found")
-
-        if dto.rent_amount is not None:
-            review.rent_amount = dto.rent_amount
-        if dto.review_text is not None:
-            review.review_text = dto.review_text
         if dto.rating is not None:
-            review.rating = dto.rating
+            validate_rating(dto.rating)
 
-        updated = self._repository.update_review(review)
+        updated = self._repository.update_review(
+            review_id,
+            rent_amount=dto.rent_amount,
+            review_text=dto.review_text,
+            rating=dto.rating,
+        )
+        return to_review_dto(updated)
+
+
+class AsyncUpdateReviewUseCase:
+    def __init__(self, repository: AsyncReviewRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, review_id: UUID, dto: UpdateReviewDTO) -> ReviewDTO:
+        if dto.rating is not None:
+            validate_rating(dto.rating)
+
+        updated = await self._repository.update_review(
+            review_id,
+            rent_amount=dto.rent_amount,
+            review_text=dto.review_text,
+            rating=dto.rating,
+        )
         return to_review_dto(updated)
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from uuid import UUID
+
+from app.features.reviews.domain.entities.review import RATINGS
+
+
+def _empty_histogram() -> dict[int, int]:
+    return dict.fromkeys(RATINGS, 0)
+
+
+@dataclass(slots=True, kw_only=True)
+class RecordReviewStats:
+    """Agregados de las reseñas de una vivienda; se guardan sumas para actualizarlos por delta."""
+
+    record_id: UUID
+    review_count: int = 0
+    rating_histogram: dict[int, int] = field(default_factory=_empty_histogram)
+    rating_total: int = 0
+    rent_total: Decimal = Decimal(0)
+    rent_count: int = 0
+
+    @property
+    def average_rating(self) -> float | None:
+        return self.rating_total / self.review_count if self.review_count else None
+
+    @property
+    def average_rent(self) -> Decimal | None:
+        # rent_amount es opcional: el promedio solo considera las reseñas que lo informan.
+        if not self.rent_count:
+            return None
+        return (self.rent_total / self.rent_count).quantize(Decimal("0.01"))
@@ -5,6 +5,13 @@ from uuid import UUID, uuid4
 
 from app.features.reviews.domain.exceptions import InvalidReviewRatingError
 
+RATINGS = range(1, 6)
+
+
+def validate_rating(rating: int) -> None:
+    if rating not in RATINGS:
+        raise InvalidReviewRatingError("Rating must be between 1 and 5")
+
 
 @dataclass(slots=True, kw_only=True)
 class Review:
@@ -19,5 +26,4 @@ class Review:
     created_at: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self) -> None:
-        if not 1 <= self.rating <= 5:
-            raise InvalidReviewRatingError("Rating must be between 1 and 5")
+        validate_rating(self.rating)
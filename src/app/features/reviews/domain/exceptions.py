@@ -16,3 +16,11 @@ class InvalidReviewRatingError(ReviewError):
 
 class ReviewVoteError(ReviewError):
     """Error relacionado con los votos de la reseña."""
+
+
+class InvalidCursorError(ReviewError):
+    """El cursor de paginación enviado no es válido."""
+
+
+class VoteBacklogFullError(ReviewVoteError):
+    """El buffer de votos pendientes alcanzó su límite; el cliente debe reintentar."""
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+
+
+class ReviewExpansion(Enum):
+    """Recursos hijos que se pueden pedir junto con cada reseña."""
+
+    IMAGES = "images"
+    COMMENTS = "comments"
+    VOTES = "votes"
+
+
+@dataclass(slots=True, frozen=True)
+class ExpandedReview:
+    """Reseña con los hijos pedidos; un campo en ``None`` es un recurso que no se pidió."""
+
+    review: Review
+    images: list[ReviewImage] | None = None
+    comments: list[ReviewComment] | None = None
+    votes: tuple[int, int] | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewFilter:
+    """Criterios opcionales de una exportación; ``created_to`` es exclusivo."""
+
+    record_id: UUID | None = None
+    user_id: UUID | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ImportRejection(Enum):
+    """Motivo por el que la carga masiva descartó una reseña que sí pasó la validación."""
+
+    DUPLICATE = "duplicate"
+    UNKNOWN_RECORD = "unknown_record"
+    UNKNOWN_USER = "unknown_user"
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class PageCursor:
+    """Posición de keyset ``(created_at, id)`` a partir de la cual continuar un listado."""
+
+    created_at: datetime
+    id: UUID
+
+
+@dataclass(slots=True, frozen=True)
+class SearchCursor:
+    """Posición de keyset ``(rank, id)`` a partir de la cual continuar una búsqueda."""
+
+    rank: float
+    id: UUID
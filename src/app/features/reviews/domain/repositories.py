@@ -1,38 +1,175 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Generator, Sequence
+from decimal import Decimal
 from typing import Protocol
 from uuid import UUID
 
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
 from app.features.reviews.domain.entities.review import Review
 from app.features.reviews.domain.entities.review_comment import ReviewComment
 from app.features.reviews.domain.entities.review_image import ReviewImage
 from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
 
 
 class ReviewRepository(Protocol):
     """Contrato para persistir y consultar reseñas y sus recursos relacionados."""
 
-    def create_review(self, review: Review) -> Review: ...
+    def create_review(self, review: Review) -> Review:
+        """Actualiza en la misma transacción los agregados de ``get_record_stats``."""
+
+    def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]: ...
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        """Inserta un lote en bloque y retorna las descartadas con su motivo, sin abortar."""
 
     def get_review(self, review_id: UUID) -> Review | None: ...
 
+    def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        """Busca varias en una sola consulta; las que no existen no aparecen."""
+
     def list_reviews_for_record(
-        self, record_id: UUID, *, limit: int, offset: int
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
     ) -> Sequence[Review]: ...
 
-    def update_review(self, review: Review) -> Review: ...
+    def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        """Coincidencias de mayor a menor relevancia, con ``(rank, id)`` como keyset."""
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReview]]:
+        """Recorre las filtradas por ``(created_at, id)`` con un cursor del servidor, en lotes."""
+
+    def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        """Los campos en ``None`` no cambian. Lanza ``ReviewNotFoundError`` si no existe."""
 
-    def delete_review(self, review_id: UUID) -> None: ...
+    def delete_review(self, review_id: UUID) -> Review:
+        """Lanza ``ReviewNotFoundError`` si la reseña no existe."""
 
-    def add_image(self, image: ReviewImage) -> ReviewImage: ...
+    def add_image(self, image: ReviewImage) -> ReviewImage:
+        """Lanza ``ReviewNotFoundError`` si la reseña no existe."""
 
     def list_images(self, review_id: UUID) -> Sequence[ReviewImage]: ...
 
-    def add_comment(self, comment: ReviewComment) -> ReviewComment: ...
+    def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        """Lanza ``ReviewNotFoundError`` si la reseña no existe."""
 
     def list_comments(
-        self, review_id: UUID, *, limit: int, offset: int
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
     ) -> Sequence[ReviewComment]: ...
 
-    def upsert_vote(self, vote: ReviewVote) -> ReviewVote: ...
+    def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        """Lanza ``ReviewNotFoundError`` si la reseña no existe."""
+
+    def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        """Guarda un lote sin claves repetidas; omite los votos de reseñas inexistentes."""
+
+    def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        """Lanza ``ReviewNotFoundError`` si la reseña no existe."""
+
+    def get_record_stats(self, record_id: UUID) -> RecordReviewStats: ...
+
+    def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        """Carga los hijos pedidos con unas pocas consultas por lote, nunca una por reseña."""
+
+    def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        """Marca que cambia con cada escritura del recurso; ``None`` si la reseña no existe."""
+
+
+class AsyncReviewRepository(Protocol):
+    """Contrato asíncrono equivalente a ``ReviewRepository`` para drivers asyncio."""
+
+    async def create_review(self, review: Review) -> Review: ...
+
+    async def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]: ...
+
+    async def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]: ...
+
+    async def get_review(self, review_id: UUID) -> Review | None: ...
+
+    async def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]: ...
+
+    async def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]: ...
+
+    async def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]: ...
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReview]]: ...
+
+    async def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review: ...
+
+    async def delete_review(self, review_id: UUID) -> Review: ...
+
+    async def add_image(self, image: ReviewImage) -> ReviewImage: ...
+
+    async def list_images(self, review_id: UUID) -> Sequence[ReviewImage]: ...
+
+    async def add_comment(self, comment: ReviewComment) -> ReviewComment: ...
+
+    async def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]: ...
+
+    async def upsert_vote(self, vote: ReviewVote) -> ReviewVote: ...
+
+    async def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult: ...
+
+    async def get_votes_summary(self, review_id: UUID) -> tuple[int, int]: ...
+
+    async def get_record_stats(self, record_id: UUID) -> RecordReviewStats: ...
+
+    async def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]: ...
 
-    def get_votes_summary(self, review_id: UUID) -> tuple[int, int]: ...
+    async def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None: ...
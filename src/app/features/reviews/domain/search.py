@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from app.features.reviews.domain.entities.review import Review
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewMatch:
+    """Reseña encontrada por la búsqueda de texto con su relevancia (``ts_rank``)."""
+
+    review: Review
+    rank: float
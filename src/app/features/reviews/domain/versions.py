@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class VersionedResource(Enum):
+    """Recursos de lectura con una marca de versión barata para GET condicionales."""
+
+    REVIEW = "review"
+    RECORD_REVIEWS = "record_reviews"
+    REVIEW_IMAGES = "review_images"
+    REVIEW_COMMENTS = "review_comments"
+    REVIEW_VOTES = "review_votes"
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+
+
+@dataclass(slots=True, frozen=True)
+class VoteBatchResult:
+    """Resultado de ``upsert_votes``: votos que cambiaron y votos omitidos por su reseña.
+
+    Un voto para una reseña que no existe (o se borró antes de escribirlo) se omite sin
+    abortar el resto del lote.
+    """
+
+    changed: int = 0
+    skipped: int = 0
+
+
+class VoteQueue(Protocol):
+    """Cola de escritura diferida de votos.
+
+    ``enqueue`` no bloquea ni toca la base; lanza ``VoteBacklogFullError`` si la cola está llena.
+    """
+
+    def enqueue(self, vote: ReviewVote) -> None: ...
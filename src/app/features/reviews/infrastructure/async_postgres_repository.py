@@ -0,0 +1,324 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from decimal import Decimal
+from typing import Any, TypeVar, cast
+from uuid import UUID
+
+import psycopg
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.exceptions import (
+    ReviewAlreadyExistsError,
+    ReviewNotFoundError,
+)
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.repositories import AsyncReviewRepository
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.errors import review_must_exist
+from app.features.reviews.infrastructure.mappers import (
+    children_of,
+    map_comment,
+    map_expanded_reviews,
+    map_image,
+    map_import_rejections,
+    map_record_stats,
+    map_review,
+    map_review_match,
+    map_version,
+    map_vote,
+)
+from app.shared.infrastructure.database import AsyncDbHandle
+
+T = TypeVar("T")
+
+
+async def _connection(session: AsyncDbHandle) -> AsyncConnection:
+    return session if isinstance(session, AsyncConnection) else await session.connection()
+
+
+class AsyncPostgresReviewRepository(AsyncReviewRepository):
+    """Repositorio asíncrono para Postgres usando SQLAlchemy Core sobre psycopg3.
+
+    Como el síncrono, acepta una ``AsyncSession`` o una ``AsyncConnection``.
+    """
+
+    def __init__(self, session: AsyncDbHandle) -> None:
+        self._session = session
+
+    async def create_review(self, review: Review) -> Review:
+        async def _operation(session: AsyncDbHandle) -> Review:
+            return await self._insert_review(session, review)
+
+        return await self._run_in_transaction(_operation)
+
+    async def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        async def _operation(session: AsyncDbHandle) -> tuple[Review, list[ReviewImage]]:
+            created = await self._insert_review(session, review)
+            if not images:
+                return created, []
+
+            rows = (await session.execute(statements.insert_images(images))).mappings().all()
+            return created, [map_image(row) for row in statements.in_input_order(images, rows)]
+
+        return await self._run_in_transaction(_operation)
+
+    async def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        if not reviews:
+            return {}
+
+        async def _operation(session: AsyncDbHandle) -> dict[UUID, ImportRejection]:
+            await session.execute(statements.create_import_staging())
+            connection = await _connection(session)
+            raw = await connection.get_raw_connection()
+            driver = cast(psycopg.AsyncConnection[Any], raw.driver_connection)
+            async with (
+                driver.cursor() as cursor,
+                cursor.copy(statements.copy_into_import_staging()) as copy,
+            ):
+                for ordinal, review in enumerate(reviews):
+                    await copy.write_row(statements.import_staging_row(ordinal, review))
+            result = await session.execute(statements.merge_import_staging())
+            return map_import_rejections(result.all())
+
+        return await self._run_in_transaction(_operation)
+
+    async def get_review(self, review_id: UUID) -> Review | None:
+        result = await self._session.execute(*statements.select_review(review_id))
+        row = result.mappings().first()
+        return map_review(row) if row else None
+
+    async def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        if not review_ids:
+            return {}
+        result = await self._session.execute(*statements.select_reviews_by_id(review_ids))
+        return {row["id"]: map_review(row) for row in result.mappings()}
+
+    async def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        result = await self._session.execute(
+            *statements.select_reviews_for_record(
+                record_id, limit=limit, offset=offset, after=after
+            )
+        )
+
+        return [map_review(row) for row in result.mappings().all()]
+
+    async def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        statement = statements.search_reviews(query, record_id=record_id, limit=limit, after=after)
+        result = await self._session.execute(*statement)
+        return [map_review_match(row) for row in result.mappings().all()]
+
+    async def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        result = await self._session.execute(*statements.select_record_stats(record_id))
+        return map_record_stats(record_id, result.mappings().first())
+
+    async def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReview]]:
+        result = await self._session.stream(
+            statements.select_reviews(filters),
+            execution_options={"yield_per": statements.STREAM_BATCH_SIZE},
+        )
+        try:
+            async for partition in result.mappings().partitions():
+                yield await self.expand_reviews([map_review(row) for row in partition], expand)
+        finally:
+            await result.close()
+            await self._session.rollback()
+
+    async def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        if not reviews or not expand:
+            return map_expanded_reviews(reviews)
+
+        review_ids = [review.id for review in reviews]
+        images = comments = votes = None
+        if ReviewExpansion.IMAGES in expand:
+            result = await self._session.execute(*statements.select_images_for_reviews(review_ids))
+            images = result.mappings().all()
+        if ReviewExpansion.COMMENTS in expand:
+            statement = statements.select_comments_for_reviews(review_ids, limit=comments_limit)
+            comments = (await self._session.execute(*statement)).mappings().all()
+        if ReviewExpansion.VOTES in expand:
+            statement = statements.select_vote_counts_for_reviews(review_ids)
+            votes = (await self._session.execute(*statement)).mappings().all()
+        return map_expanded_reviews(reviews, images=images, comments=comments, votes=votes)
+
+    async def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        statement = statements.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+
+        async def _operation(session: AsyncDbHandle) -> Review:
+            # Solo rating y rent_amount mueven los agregados; el bloqueo evita leer valores
+            # previos que otra transacción esté cambiando.
+            previous = None
+            if rating is not None or rent_amount is not None:
+                locked = await session.execute(*statements.select_review_for_update(review_id))
+                previous = locked.mappings().first()
+            result = await session.execute(*statement)
+            row = result.mappings().first()
+
+            if row is None:
+                raise ReviewNotFoundError(f"Review {review_id} was not found")
+
+            updated = map_review(row)
+            if previous is not None:
+                await self._apply_record_stats(
+                    session, updated.record_id, added=[updated], removed=[map_review(previous)]
+                )
+            return updated
+
+        return await self._run_in_transaction(_operation)
+
+    async def delete_review(self, review_id: UUID) -> Review:
+        async def _operation(session: AsyncDbHandle) -> Review:
+            result = await session.execute(*statements.delete_review(review_id))
+            row = result.mappings().first()
+
+            if row is None:
+                raise ReviewNotFoundError(f"Review {review_id} was not found")
+
+            deleted = map_review(row)
+            await self._apply_record_stats(session, deleted.record_id, removed=[deleted])
+            return deleted
+
+        return await self._run_in_transaction(_operation)
+
+    async def add_image(self, image: ReviewImage) -> ReviewImage:
+        async def _operation(session: AsyncDbHandle) -> ReviewImage:
+            with review_must_exist(image.review_id):
+                result = await session.execute(*statements.insert_image(image))
+            return map_image(result.mappings().one())
+
+        return await self._run_in_transaction(_operation)
+
+    async def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        result = await self._session.execute(*statements.select_images(review_id))
+        return [map_image(row) for row in children_of(review_id, result.mappings().all())]
+
+    async def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        async def _operation(session: AsyncDbHandle) -> ReviewComment:
+            with review_must_exist(comment.review_id):
+                result = await session.execute(*statements.insert_comment(comment))
+            return map_comment(result.mappings().one())
+
+        return await self._run_in_transaction(_operation)
+
+    async def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        result = await self._session.execute(
+            *statements.select_comments(review_id, limit=limit, offset=offset, after=after)
+        )
+        return [map_comment(row) for row in children_of(review_id, result.mappings().all())]
+
+    async def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        async def _operation(session: AsyncDbHandle) -> ReviewVote:
+            with review_must_exist(vote.review_id):
+                result = await session.execute(*statements.upsert_vote(vote))
+            row = result.mappings().first()
+
+            if row is None:
+                existing = await session.execute(
+                    *statements.select_vote(vote.review_id, vote.user_id)
+                )
+                return map_vote(existing.mappings().one())
+
+            await session.execute(*statements.increment_vote_counts(vote, inserted=row["inserted"]))
+            return map_vote(row)
+
+        return await self._run_in_transaction(_operation)
+
+    async def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        if not votes:
+            return VoteBatchResult()
+
+        async def _operation(session: AsyncDbHandle) -> VoteBatchResult:
+            result = await session.execute(statements.upsert_votes(votes))
+            changed, skipped = statements.split_vote_rows(result.all())
+            if changed:
+                deltas = statements.vote_count_deltas(changed)
+                await session.execute(statements.increment_vote_counts_many(deltas))
+            return VoteBatchResult(changed=len(changed), skipped=skipped)
+
+        return await self._run_in_transaction(_operation)
+
+    async def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        result = await self._session.execute(*statements.select_votes_summary(review_id))
+        row = result.first()
+
+        if row is None:
+            raise ReviewNotFoundError(f"Review {review_id} was not found")
+
+        useful, not_useful = row
+        return int(useful), int(not_useful)
+
+    async def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        result = await self._session.execute(*statements.select_version(resource, resource_id))
+        return map_version(result.first())
+
+    async def _insert_review(self, session: AsyncDbHandle, review: Review) -> Review:
+        # ON CONFLICT DO NOTHING no retorna fila cuando ya existe (user_id, record_id).
+        result = await session.execute(*statements.insert_review(review))
+        row = result.mappings().first()
+
+        if row is None:
+            raise ReviewAlreadyExistsError("User already submitted a review for this record")
+
+        created = map_review(row)
+        await self._apply_record_stats(session, created.record_id, added=[created])
+        return created
+
+    async def _apply_record_stats(
+        self,
+        session: AsyncDbHandle,
+        record_id: UUID,
+        *,
+        added: Sequence[Review] = (),
+        removed: Sequence[Review] = (),
+    ) -> None:
+        delta = statements.record_stats_delta(added=added, removed=removed)
+        if any(delta.values()):
+            await session.execute(*statements.increment_record_stats(record_id, delta))
+
+    async def _run_in_transaction(self, operation: Callable[[AsyncDbHandle], Awaitable[T]]) -> T:
+        try:
+            result = await operation(self._session)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+        return result
@@ -0,0 +1,439 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from statistics import fmean, quantiles
+from uuid import UUID
+
+import httpx
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy import Connection, func, select, text, tuple_
+
+from app.features.reviews.infrastructure.fastapi.ndjson import NDJSON_MEDIA_TYPE
+from app.features.reviews.infrastructure.fastapi.pagination import NEXT_CURSOR_HEADER
+from app.features.reviews.infrastructure.fastapi.router import reviews_router
+from app.features.reviews.infrastructure.tables import review_votes_table, reviews_table
+from app.shared.infrastructure.settings import settings
+
+# Recorre cada ruta de ``reviews_router`` a través de la app ASGI completa (middlewares,
+# dependencias, pool y serialización) contra una base sembrada con ``seed``. Las lecturas usan
+# datos sembrados; las escrituras solo tocan reseñas que el propio benchmark crea y borra al
+# final, para que dos corridas seguidas midan la misma base.
+
+IMPORT_ROWS_PER_REQUEST = 10
+BATCH_GET_IDS = 50
+
+# Pares (usuario, vivienda) sin reseña: cada creación o importación necesita uno distinto.
+_FREE_PAIRS = text(
+    """
+    SELECT u.id AS user_id, r.id AS record_id
+    FROM records AS r CROSS JOIN users AS u
+    WHERE NOT EXISTS (
+        SELECT 1 FROM reviews AS rv WHERE rv.user_id = u.id AND rv.record_id = r.id
+    )
+    LIMIT :pairs
+    """
+)
+
+
+@dataclass(slots=True, frozen=True)
+class EndpointResult:
+    name: str
+    method: str
+    route: str
+    requests: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass(slots=True, frozen=True)
+class _Request:
+    url: str
+    body: object = None
+    content: bytes | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class _Step:
+    name: str
+    method: str
+    route: str
+    expected: frozenset[int]
+    build: Callable[[int], _Request]
+    on_response: Callable[[httpx.Response], None] | None = None
+
+
+@dataclass(slots=True)
+class _Sample:
+    record_id: UUID
+    review_id: UUID
+    page_ids: list[UUID]
+    voter_id: UUID
+    create_pairs: list[tuple[UUID, UUID]]
+    import_pairs: list[tuple[UUID, UUID]]
+    created: list[UUID] = field(default_factory=list)
+    review_etag: str = ""
+    page_cursor: str = ""
+    comments_cursor: str = ""
+
+
+def _load_sample(connection: Connection, invocations: int) -> _Sample:
+    """Vivienda con más reseñas, una reseña con votos y pares libres para las escrituras."""
+    record_id = connection.execute(
+        select(reviews_table.c.record_id)
+        .group_by(reviews_table.c.record_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).scalar_one()
+    page_ids = list(
+        connection.execute(
+            select(reviews_table.c.id)
+            .where(reviews_table.c.record_id == record_id)
+            .order_by(reviews_table.c.created_at.desc(), reviews_table.c.id.desc())
+            .limit(BATCH_GET_IDS)
+        ).scalars()
+    )
+    review_id = page_ids[0]
+    voter_id = connection.execute(
+        select(review_votes_table.c.user_id)
+        .where(review_votes_table.c.review_id == review_id)
+        .limit(1)
+    ).scalar_one()
+    needed = invocations * (1 + IMPORT_ROWS_PER_REQUEST)
+    pairs = [
+        (row.user_id, row.record_id) for row in connection.execute(_FREE_PAIRS, {"pairs": needed})
+    ]
+    if len(pairs) < needed:
+        raise RuntimeError(f"The seeded database has {len(pairs)} free (user, record) pairs")
+    return _Sample(
+        record_id=record_id,
+        review_id=review_id,
+        page_ids=page_ids,
+        voter_id=voter_id,
+        create_pairs=pairs[:invocations],
+        import_pairs=pairs[invocations:],
+    )
+
+
+def _import_body(pairs: list[tuple[UUID, UUID]]) -> bytes:
+    return b"\n".join(
+        json.dumps(
+            {
+                "record_id": str(record_id),
+                "user_id": str(user_id),
+                "review_text": "Reseña importada por el benchmark",
+                "rating": 4,
+                "rent_amount": "1200.00",
+            }
+        ).encode()
+        for user_id, record_id in pairs
+    )
+
+
+def _steps(sample: _Sample, base: str) -> Iterator[_Step]:
+    """Las escrituras van primero y el borrado al final: cada una usa la reseña ``index``."""
+    record = sample.record_id
+    review = sample.review_id
+    created = sample.created
+    ok = frozenset({200})
+
+    yield _Step(
+        "create_review",
+        "POST",
+        "/reviews/",
+        frozenset({201}),
+        lambda index: _Request(
+            f"{base}/",
+            body={
+                "record_id": str(sample.create_pairs[index][1]),
+                "user_id": str(sample.create_pairs[index][0]),
+                "review_text": "Reseña creada por el benchmark",
+                "rating": 1 + index % 5,
+                "rent_amount": "950.00",
+                "image_urls": ["https://images.example.com/bench/0.jpg"],
+            },
+        ),
+        on_response=lambda response: created.append(UUID(response.json()["id"])),
+    )
+    yield _Step(
+        "import_reviews",
+        "POST",
+        "/reviews/import",
+        ok,
+        lambda index: _Request(
+            f"{base}/import",
+            content=_import_body(
+                sample.import_pairs[
+                    index * IMPORT_ROWS_PER_REQUEST : (index + 1) * IMPORT_ROWS_PER_REQUEST
+                ]
+            ),
+            headers={"content-type": NDJSON_MEDIA_TYPE},
+        ),
+    )
+    yield _Step(
+        "get_review", "GET", "/reviews/{review_id}", ok, lambda _: _Request(f"{base}/{review}")
+    )
+    yield _Step(
+        "get_review: not modified",
+        "GET",
+        "/reviews/{review_id}",
+        frozenset({304}),
+        lambda _: _Request(f"{base}/{review}", headers={"if-none-match": sample.review_etag}),
+    )
+    yield _Step(
+        "batch_get_reviews",
+        "POST",
+        "/reviews:batchGet",
+        ok,
+        lambda _: _Request(f"{base}:batchGet", body={"ids": [str(i) for i in sample.page_ids]}),
+    )
+    yield _Step(
+        "list_reviews_for_record: offset",
+        "GET",
+        "/reviews/record/{record_id}",
+        ok,
+        lambda _: _Request(f"{base}/record/{record}?limit=20&offset=20"),
+    )
+    yield _Step(
+        "list_reviews_for_record: cursor",
+        "GET",
+        "/reviews/record/{record_id}",
+        ok,
+        lambda _: _Request(f"{base}/record/{record}?limit=20&cursor={sample.page_cursor}"),
+    )
+    yield _Step(
+        "list_reviews_for_record: expand=all",
+        "GET",
+        "/reviews/record/{record_id}",
+        ok,
+        lambda _: _Request(f"{base}/record/{record}?limit=20&expand=images,comments,votes"),
+    )
+    yield _Step(
+        "get_record_review_stats",
+        "GET",
+        "/reviews/record/{record_id}/stats",
+        ok,
+        lambda _: _Request(f"{base}/record/{record}/stats"),
+    )
+    yield _Step(
+        "search_reviews",
+        "GET",
+        "/reviews/search",
+        ok,
+        lambda index: _Request(f"{base}/search?q={17 + index % 10}"),
+    )
+    yield _Step(
+        "search_reviews: record",
+        "GET",
+        "/reviews/search",
+        ok,
+        lambda _: _Request(f"{base}/search?q=vivienda&record_id={record}"),
+    )
+    yield _Step(
+        "export_reviews: record",
+        "GET",
+        "/reviews/export",
+        ok,
+        lambda _: _Request(f"{base}/export?record_id={record}&expand=votes"),
+    )
+    yield _Step(
+        "list_images",
+        "GET",
+        "/reviews/{review_id}/images",
+        ok,
+        lambda _: _Request(f"{base}/{review}/images"),
+    )
+    yield _Step(
+        "list_comments",
+        "GET",
+        "/reviews/{review_id}/comments",
+        ok,
+        lambda _: _Request(f"{base}/{review}/comments?limit=2"),
+    )
+    yield _Step(
+        "list_comments: cursor",
+        "GET",
+        "/reviews/{review_id}/comments",
+        ok,
+        lambda _: _Request(f"{base}/{review}/comments?limit=2&cursor={sample.comments_cursor}"),
+    )
+    yield _Step(
+        "vote_summary",
+        "GET",
+        "/reviews/{review_id}/votes/summary",
+        ok,
+        lambda _: _Request(f"{base}/{review}/votes/summary"),
+    )
+    yield _Step(
+        "update_review",
+        "PUT",
+        "/reviews/{review_id}",
+        ok,
+        lambda index: _Request(
+            f"{base}/{created[index]}", body={"rating": 5, "review_text": "Reseña editada"}
+        ),
+    )
+    yield _Step(
+        "add_image",
+        "POST",
+        "/reviews/{review_id}/images",
+        frozenset({201}),
+        lambda index: _Request(
+            f"{base}/{created[index]}/images",
+            body={"image_url": "https://images.example.com/bench/1.jpg"},
+        ),
+    )
+    yield _Step(
+        "add_comment",
+        "POST",
+        "/reviews/{review_id}/comments",
+        frozenset({201}),
+        lambda index: _Request(
+            f"{base}/{created[index]}/comments",
+            body={"user_id": str(sample.voter_id), "comment_text": "Comentario del benchmark"},
+        ),
+    )
+    # Con el buffer de votos activo la respuesta es 202.
+    yield _Step(
+        "cast_vote",
+        "POST",
+        "/reviews/{review_id}/votes",
+        frozenset({201, 202}),
+        lambda index: _Request(
+            f"{base}/{created[index]}/votes",
+            body={"user_id": str(sample.voter_id), "useful": index % 2 == 0},
+        ),
+    )
+    yield _Step(
+        "delete_review",
+        "DELETE",
+        "/reviews/{review_id}",
+        frozenset({204}),
+        lambda index: _Request(f"{base}/{created[index]}"),
+    )
+
+
+def _check_coverage(steps: list[_Step]) -> None:
+    """Una ruta nueva del router sin escenario hace fallar el benchmark en lugar de omitirse."""
+    covered = {(step.method, step.route) for step in steps}
+    missing = [
+        f"{method} {route.path}"
+        for route in reviews_router.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods or ()
+        if (method, route.path) not in covered
+    ]
+    if missing:
+        raise LookupError(f"Routes without a benchmark scenario: {', '.join(missing)}")
+
+
+async def _send(client: httpx.AsyncClient, method: str, request: _Request) -> httpx.Response:
+    return await client.request(
+        method,
+        request.url,
+        json=request.body,
+        content=request.content,
+        headers=request.headers,
+    )
+
+
+async def _prepare(client: httpx.AsyncClient, sample: _Sample, base: str) -> None:
+    """ETag y cursores reales que necesitan los escenarios condicionales y de página 2."""
+    review = await client.get(f"{base}/{sample.review_id}")
+    sample.review_etag = review.headers["etag"]
+    page = await client.get(f"{base}/record/{sample.record_id}?limit=20")
+    sample.page_cursor = page.headers[NEXT_CURSOR_HEADER]
+    comments = await client.get(f"{base}/{sample.review_id}/comments?limit=2")
+    sample.comments_cursor = comments.headers[NEXT_CURSOR_HEADER]
+
+
+async def _measure(
+    client: httpx.AsyncClient, step: _Step, *, warmup: int, requests: int
+) -> EndpointResult:
+    timings: list[float] = []
+    for index in range(warmup + requests):
+        request = step.build(index)
+        started = time.perf_counter()
+        response = await _send(client, step.method, request)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if response.status_code not in step.expected:
+            raise AssertionError(
+                f"{step.name}: unexpected {response.status_code} {response.text[:200]}"
+            )
+        if step.on_response is not None:
+            step.on_response(response)
+        if index >= warmup:
+            timings.append(elapsed_ms)
+
+    percentiles = quantiles(timings, n=100, method="inclusive")
+    return EndpointResult(
+        name=step.name,
+        method=step.method,
+        route=step.route,
+        requests=requests,
+        mean_ms=fmean(timings),
+        p50_ms=percentiles[49],
+        p95_ms=percentiles[94],
+        p99_ms=percentiles[98],
+        max_ms=max(timings),
+    )
+
+
+async def _cleanup(
+    client: httpx.AsyncClient, connection: Connection, sample: _Sample, base: str
+) -> None:
+    # Por la API y no con SQL directo, para que estadísticas y caché queden consistentes.
+    imported = connection.execute(
+        select(reviews_table.c.id).where(
+            tuple_(reviews_table.c.user_id, reviews_table.c.record_id).in_(sample.import_pairs)
+        )
+    ).scalars()
+    for review_id in [*sample.created, *imported]:
+        await client.delete(f"{base}/{review_id}")
+
+
+async def _run(
+    app: FastAPI, connection: Connection, *, warmup: int, requests: int
+) -> list[EndpointResult]:
+    sample = _load_sample(connection, warmup + requests)
+    connection.rollback()
+    base = f"{settings.app.api_prefix}{reviews_router.prefix}"
+    steps = list(_steps(sample, base))
+    _check_coverage(steps)
+
+    # httpx registra cada petición en INFO; con miles de peticiones tapa el resumen.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client,
+    ):
+        await _prepare(client, sample, base)
+        try:
+            return [
+                await _measure(client, step, warmup=warmup, requests=requests) for step in steps
+            ]
+        finally:
+            await _cleanup(client, connection, sample, base)
+            connection.rollback()
+
+
+def run_endpoint_benchmark(
+    app: FastAPI, connection: Connection, *, warmup: int, requests: int
+) -> list[EndpointResult]:
+    """Latencia de extremo a extremo de cada ruta, una petición a la vez, sobre la app ASGI.
+
+    ``connection`` solo se usa para elegir los datos de prueba y limpiar lo importado.
+    """
+    if settings.database.in_memory:
+        raise RuntimeError("The endpoint benchmark needs a seeded Postgres database")
+    if requests < 2:
+        raise ValueError("requests must be at least 2 to compute percentiles")
+    return asyncio.run(_run(app, connection, warmup=warmup, requests=requests))
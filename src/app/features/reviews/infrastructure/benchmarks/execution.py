@@ -0,0 +1,189 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy import Connection, func, select
+
+from app.features.reviews.domain.repositories import AsyncReviewRepository, ReviewRepository
+from app.features.reviews.infrastructure.async_postgres_repository import (
+    AsyncPostgresReviewRepository,
+)
+from app.features.reviews.infrastructure.postgres_repository import PostgresReviewRepository
+from app.features.reviews.infrastructure.tables import reviews_table
+from app.shared.infrastructure.database import (
+    AsyncDbHandle,
+    AsyncLazyConnection,
+    DbHandle,
+    LazyConnection,
+    get_async_engine,
+    get_async_session_factory,
+    get_engine,
+    get_session_factory,
+)
+from app.shared.infrastructure.settings import settings
+
+# Compara, por petición, lo que cuesta darle al repositorio Postgres una ``Session`` del ORM
+# frente a una ``LazyConnection`` del engine: abrir, una lectura del repositorio y cerrar, igual
+# que una petición de la API pero sin HTTP ni serialización. Las dos formas ejecutan las
+# mismas sentencias, así que la diferencia es el costo de la sesión. Solo lecturas: el
+# benchmark no modifica la base sembrada.
+
+PAGE_SIZE = 20
+
+# Se alternan rondas de cada forma para que la deriva de la base (caché, autovacuum) no
+# favorezca a la que corre primero.
+ROUNDS = 5
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionResult:
+    name: str
+    driver: str
+    requests: int
+    session_us: float
+    connection_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.session_us / self.connection_us
+
+
+@dataclass(slots=True, frozen=True)
+class _Scenario:
+    name: str
+    load: Callable[[ReviewRepository], object]
+    load_async: Callable[[AsyncReviewRepository], Awaitable[object]]
+
+
+def _scenarios(connection: Connection) -> list[_Scenario]:
+    record_id = connection.execute(
+        select(reviews_table.c.record_id)
+        .group_by(reviews_table.c.record_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).scalar_one_or_none()
+    if record_id is None:
+        raise RuntimeError("The execution benchmark needs a seeded database")
+    review_id: UUID = connection.execute(
+        select(reviews_table.c.id).where(reviews_table.c.record_id == record_id).limit(1)
+    ).scalar_one()
+    return [
+        _Scenario(
+            name="get_review",
+            load=lambda repository: repository.get_review(review_id),
+            load_async=lambda repository: repository.get_review(review_id),
+        ),
+        _Scenario(
+            name="list_reviews_for_record",
+            load=lambda repository: repository.list_reviews_for_record(record_id, limit=PAGE_SIZE),
+            load_async=lambda repository: repository.list_reviews_for_record(
+                record_id, limit=PAGE_SIZE
+            ),
+        ),
+        _Scenario(
+            name="get_record_stats",
+            load=lambda repository: repository.get_record_stats(record_id),
+            load_async=lambda repository: repository.get_record_stats(record_id),
+        ),
+    ]
+
+
+def _sync_seconds(
+    open_db: Callable[[], DbHandle], load: Callable[[ReviewRepository], object], requests: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        db = open_db()
+        try:
+            load(PostgresReviewRepository(db))
+        finally:
+            db.close()
+    return time.perf_counter() - started
+
+
+async def _async_seconds(
+    open_db: Callable[[], AsyncDbHandle],
+    load: Callable[[AsyncReviewRepository], Awaitable[object]],
+    requests: int,
+) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        db = open_db()
+        try:
+            await load(AsyncPostgresReviewRepository(db))
+        finally:
+            await db.close()
+    return time.perf_counter() - started
+
+
+def _measure_sync(scenario: _Scenario, *, warmup: int, requests: int) -> ExecutionResult:
+    sessions = get_session_factory()
+    connect = partial(LazyConnection, get_engine())
+    _sync_seconds(sessions, scenario.load, warmup)
+    _sync_seconds(connect, scenario.load, warmup)
+    per_round = max(requests // ROUNDS, 1)
+    session = connection = 0.0
+    for _ in range(ROUNDS):
+        session += _sync_seconds(sessions, scenario.load, per_round)
+        connection += _sync_seconds(connect, scenario.load, per_round)
+    total = per_round * ROUNDS
+    return ExecutionResult(
+        name=scenario.name,
+        driver="sync",
+        requests=total,
+        session_us=session / total * 1_000_000,
+        connection_us=connection / total * 1_000_000,
+    )
+
+
+async def _measure_async(scenario: _Scenario, *, warmup: int, requests: int) -> ExecutionResult:
+    load = scenario.load_async
+    sessions = get_async_session_factory()
+    connect = partial(AsyncLazyConnection, get_async_engine())
+    await _async_seconds(sessions, load, warmup)
+    await _async_seconds(connect, load, warmup)
+    per_round = max(requests // ROUNDS, 1)
+    session = connection = 0.0
+    for _ in range(ROUNDS):
+        session += await _async_seconds(sessions, load, per_round)
+        connection += await _async_seconds(connect, load, per_round)
+    total = per_round * ROUNDS
+    return ExecutionResult(
+        name=scenario.name,
+        driver="async",
+        requests=total,
+        session_us=session / total * 1_000_000,
+        connection_us=connection / total * 1_000_000,
+    )
+
+
+async def _run_async(
+    scenarios: list[_Scenario], *, warmup: int, requests: int
+) -> list[ExecutionResult]:
+    try:
+        return [
+            await _measure_async(scenario, warmup=warmup, requests=requests)
+            for scenario in scenarios
+        ]
+    finally:
+        # El pool asíncrono queda atado a este event loop.
+        await get_async_engine().dispose()
+
+
+def run_execution_benchmark(
+    connection: Connection, *, warmup: int, requests: int
+) -> list[ExecutionResult]:
+    """Tiempo por petición con sesión y con conexión, en los repositorios sync y async.
+
+    ``connection`` solo se usa para elegir los datos de prueba.
+    """
+    if settings.database.in_memory:
+        raise RuntimeError("The execution benchmark needs a seeded Postgres database")
+    scenarios = _scenarios(connection)
+    connection.rollback()
+    results = [_measure_sync(scenario, warmup=warmup, requests=requests) for scenario in scenarios]
+    results += asyncio.run(_run_async(scenarios, warmup=warmup, requests=requests))
+    return results
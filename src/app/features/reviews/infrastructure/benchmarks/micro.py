@@ -0,0 +1,247 @@
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from sqlalchemy.sql.cache_key import HasCacheKey
+
+from app.features.reviews.application.mappers import (
+    to_expanded_review_dto,
+    to_record_review_stats_dto,
+    to_review_comment_dto,
+    to_review_dto,
+    to_review_image_dto,
+    to_review_match_dto,
+    to_review_vote_dto,
+)
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.expansion import ExpandedReview
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.fastapi import controller
+from app.features.reviews.infrastructure.mappers import map_expanded_reviews, map_review
+from app.features.reviews.infrastructure.seed import SeedSize
+
+# Funciones puras del camino de una petición, sin base de datos ni HTTP: el costo por
+# operación de mapear filas, construir entidades y DTO, validarlos como modelos de respuesta
+# y preparar cada sentencia del repositorio para ``execute``.
+
+# Como en ``timeit``, de varias repeticiones se toma la mejor para descontar el ruido.
+_REPEATS = 5
+
+_EPOCH = datetime(2024, 1, 1)
+_REVIEW_COLUMNS = (
+    "id",
+    "record_id",
+    "user_id",
+    "rent_amount",
+    "review_text",
+    "rating",
+    "created_at",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class MicroResult:
+    name: str
+    loops: int
+    ns_per_op: float
+
+
+def _rows(keys: tuple[str, ...], values: list[tuple[object, ...]]) -> list[RowMapping]:
+    # Filas reales de SQLAlchemy: un dict tendría un acceso por clave más barato que RowMapping.
+    result: IteratorResult[tuple[object, ...]] = IteratorResult(
+        SimpleResultMetaData(keys), iter(values)
+    )
+    return list(result.mappings())
+
+
+def _review(index: int) -> Review:
+    return Review(
+        id=UUID(int=index),
+        record_id=UUID(int=1_000_000),
+        user_id=UUID(int=2_000_000 + index),
+        rent_amount=Decimal(500 + index % 1500).quantize(Decimal("0.01")),
+        review_text=f"Reseña de prueba {index} para la vivienda 1",
+        rating=1 + index % 5,
+        created_at=_EPOCH + timedelta(minutes=index),
+    )
+
+
+def _review_row(review: Review) -> tuple[object, ...]:
+    return (
+        review.id,
+        review.record_id,
+        review.user_id,
+        review.rent_amount,
+        review.review_text,
+        review.rating,
+        review.created_at,
+    )
+
+
+def _image(review: Review, index: int) -> ReviewImage:
+    return ReviewImage(
+        id=UUID(int=3_000_000 + index),
+        review_id=review.id,
+        image_url=f"https://images.example.com/{review.id}/{index}.jpg",
+        uploaded_at=review.created_at + timedelta(seconds=index),
+    )
+
+
+def _comment(review: Review, index: int) -> ReviewComment:
+    return ReviewComment(
+        id=UUID(int=4_000_000 + index),
+        review_id=review.id,
+        user_id=UUID(int=2_000_000 + index),
+        comment_text=f"Comentario {index}",
+        created_at=review.created_at + timedelta(hours=index),
+    )
+
+
+def _cache_key(bound: statements.BoundStatement) -> object:
+    # Lo que paga cada ``execute`` antes de llegar a la caché de SQL compilado.
+    return cast(HasCacheKey, bound.statement)._generate_cache_key()
+
+
+def _statement_cases(review: Review) -> list[tuple[str, Callable[[], object]]]:
+    cursor = PageCursor(created_at=review.created_at, id=review.id)
+    vote = ReviewVote(review_id=review.id, user_id=UUID(int=5), useful=True, created_at=_EPOCH)
+    return [
+        ("statement: select_review", lambda: _cache_key(statements.select_review(review.id))),
+        (
+            "statement: select_reviews_for_record cursor",
+            lambda: _cache_key(
+                statements.select_reviews_for_record(
+                    review.record_id, limit=21, offset=0, after=cursor
+                )
+            ),
+        ),
+        (
+            "statement: search_reviews cursor",
+            lambda: _cache_key(
+                statements.search_reviews(
+                    "cocina", record_id=None, limit=21, after=SearchCursor(rank=0.06, id=review.id)
+                )
+            ),
+        ),
+        (
+            "statement: select_comments cursor",
+            lambda: _cache_key(
+                statements.select_comments(review.id, limit=21, offset=0, after=cursor)
+            ),
+        ),
+        ("statement: insert_review", lambda: _cache_key(statements.insert_review(review))),
+        (
+            "statement: update_review",
+            lambda: _cache_key(
+                statements.update_review(
+                    review.id, rent_amount=None, review_text="editada", rating=4
+                )
+            ),
+        ),
+        ("statement: upsert_vote", lambda: _cache_key(statements.upsert_vote(vote))),
+        (
+            "statement: select_version review_votes",
+            lambda: _cache_key(
+                statements.select_version(VersionedResource.REVIEW_VOTES, review.id)
+            ),
+        ),
+    ]
+
+
+def _cases(page_size: int) -> list[tuple[str, Callable[[], object]]]:
+    size = SeedSize()
+    review = _review(1)
+    page = [_review(index) for index in range(page_size)]
+    row = _rows(_REVIEW_COLUMNS, [_review_row(review)])[0]
+    page_rows = _rows(_REVIEW_COLUMNS, [_review_row(item) for item in page])
+    image_rows = _rows(
+        ("id", "review_id", "image_url", "uploaded_at"),
+        [
+            (UUID(int=3_000_000 + index), item.id, f"https://x/{index}.jpg", item.created_at)
+            for index, item in enumerate(page)
+            for _ in range(size.images_per_review)
+        ],
+    )
+    vote_rows = _rows(
+        ("review_id", "useful_votes", "not_useful_votes"),
+        [(item.id, size.votes_per_review - 2, 2) for item in page],
+    )
+    image = _image(review, 0)
+    comment = _comment(review, 0)
+    expanded = ExpandedReview(
+        review=review,
+        images=[_image(review, index) for index in range(size.images_per_review)],
+        comments=[_comment(review, index) for index in range(size.comments_per_review)],
+        votes=(size.votes_per_review - 2, 2),
+    )
+    match = ReviewMatch(review=review, rank=0.06)
+    vote = ReviewVote(review_id=review.id, user_id=UUID(int=5), useful=True, created_at=_EPOCH)
+    stats = RecordReviewStats(
+        record_id=review.record_id,
+        review_count=50,
+        rating_histogram={1: 5, 2: 5, 3: 10, 4: 10, 5: 20},
+        rating_total=185,
+        rent_total=Decimal("50000"),
+        rent_count=50,
+    )
+    review_dto = to_review_dto(review)
+    expanded_dto = to_expanded_review_dto(expanded)
+    fields = asdict(review_dto)
+
+    return [
+        ("map_review", lambda: map_review(row)),
+        (
+            f"map_review x{page_size}",
+            lambda: [map_review(page_row) for page_row in page_rows],
+        ),
+        (
+            f"map_expanded_reviews x{page_size}: images,votes",
+            lambda: map_expanded_reviews(page, images=image_rows, votes=vote_rows),
+        ),
+        ("Review()", lambda: Review(**fields)),
+        ("Review.__post_init__", review.__post_init__),
+        ("to_review_dto", lambda: to_review_dto(review)),
+        ("to_review_match_dto", lambda: to_review_match_dto(match)),
+        ("to_expanded_review_dto: all", lambda: to_expanded_review_dto(expanded)),
+        ("to_review_image_dto", lambda: to_review_image_dto(image)),
+        ("to_review_comment_dto", lambda: to_review_comment_dto(comment)),
+        ("to_review_vote_dto", lambda: to_review_vote_dto(vote)),
+        ("to_record_review_stats_dto", lambda: to_record_review_stats_dto(stats)),
+        ("asdict(ReviewDTO)", lambda: asdict(review_dto)),
+        (
+            "asdict + ReviewResponse.model_validate",
+            lambda: controller.ReviewResponse.model_validate(asdict(review_dto)),
+        ),
+        (
+            "to_expanded_review_response: all",
+            lambda: controller.to_expanded_review_response(expanded_dto),
+        ),
+        *_statement_cases(review),
+    ]
+
+
+def _ns_per_op(operation: Callable[[], object], loops: int) -> float:
+    timer = timeit.Timer(operation)
+    best = min(timer.repeat(repeat=_REPEATS, number=loops))
+    return best / loops * 1_000_000_000
+
+
+def run_micro_benchmarks(*, loops: int, page_size: int = 20) -> list[MicroResult]:
+    """Nanosegundos por operación (la mejor de varias repeticiones) de cada función pura."""
+    return [
+        MicroResult(name=name, loops=loops, ns_per_op=_ns_per_op(operation, loops))
+        for name, operation in _cases(page_size)
+    ]
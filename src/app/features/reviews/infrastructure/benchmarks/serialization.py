@@ -0,0 +1,229 @@
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.routing import APIRoute, serialize_response
+from pydantic.main import IncEx
+
+from app.features.reviews.application.dtos.expanded_review_dto import ExpandedReviewDTO
+from app.features.reviews.application.dtos.page_dto import PageDTO
+from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
+from app.features.reviews.application.dtos.review_dto import ReviewDTO
+from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+from app.features.reviews.application.dtos.review_lookup_dto import ReviewLookupDTO
+from app.features.reviews.application.dtos.review_match_dto import ReviewMatchDTO
+from app.features.reviews.domain.expansion import ReviewExpansion
+from app.features.reviews.infrastructure.fastapi import controller
+from app.features.reviews.infrastructure.fastapi.router import reviews_router
+from app.features.reviews.infrastructure.fastapi.serialization import encode_dto
+from app.features.reviews.infrastructure.seed import SeedSize
+
+# Compara, por petición y sin base de datos, el CPU de serializar un mismo resultado de caso
+# de uso por los dos caminos: el de los modelos (asdict + model_validate en el handler y
+# luego la validación y serialización de FastAPI con el response_model de la ruta) y el
+# rápido (los DTO directo al encoder compilado). Los handlers síncronos pagan además, en el
+# camino de los modelos, el salto al threadpool para validar, que aquí no se mide.
+
+
+@dataclass(slots=True, frozen=True)
+class SerializationResult:
+    name: str
+    items: int
+    models_us: float
+    fast_us: float
+    body_bytes: int
+
+    @property
+    def speedup(self) -> float:
+        return self.models_us / self.fast_us
+
+
+@dataclass(slots=True, frozen=True)
+class _Scenario:
+    name: str
+    path: str
+    method: str
+    build_models: Callable[[], object]
+    value: object
+    value_type: type[object]
+    exclude: IncEx | None = None
+
+
+_EPOCH = datetime(2024, 1, 1)
+
+
+def _review_fields(index: int) -> dict[str, Any]:
+    return {
+        "id": UUID(int=index),
+        "record_id": UUID(int=1_000_000),
+        "user_id": UUID(int=2_000_000 + index),
+        "rent_amount": Decimal(500 + index % 1500).quantize(Decimal("0.01")),
+        "review_text": f"Reseña de prueba {index} para la vivienda 1",
+        "rating": 1 + index % 5,
+        "created_at": _EPOCH + timedelta(minutes=index),
+    }
+
+
+def _expanded_review(index: int, size: SeedSize) -> ExpandedReviewDTO:
+    review_id = UUID(int=index)
+    created_at = _EPOCH + timedelta(minutes=index)
+    return ExpandedReviewDTO(
+        **_review_fields(index),
+        images=[
+            ReviewImageDTO(
+                id=UUID(int=3_000_000 + index * 10 + image),
+                review_id=review_id,
+                image_url=f"https://images.example.com/{review_id}/{image}.jpg",
+                uploaded_at=created_at + timedelta(seconds=image),
+            )
+            for image in range(size.images_per_review)
+        ],
+        comments=[
+            ReviewCommentDTO(
+                id=UUID(int=4_000_000 + index * 10 + comment),
+                review_id=review_id,
+                user_id=UUID(int=2_000_000 + comment),
+                comment_text=f"Comentario {comment}",
+                created_at=created_at + timedelta(hours=comment),
+            )
+            for comment in range(size.comments_per_review)
+        ],
+        useful_votes=size.votes_per_review - index % 4,
+        not_useful_votes=index % 4,
+    )
+
+
+def _scenarios(items: int) -> list[_Scenario]:
+    size = SeedSize()
+    plain = [ExpandedReviewDTO(**_review_fields(i)) for i in range(items)]
+    expanded = [_expanded_review(i, size) for i in range(items)]
+    matches = PageDTO(
+        items=[ReviewMatchDTO(**_review_fields(i), rank=0.06 + i / 1000) for i in range(items)],
+        next_cursor="cursor",
+    )
+    lookups = [
+        ReviewLookupDTO(
+            id=UUID(int=i), review=None if i % 10 == 0 else ReviewDTO(**_review_fields(i))
+        )
+        for i in range(items)
+    ]
+    everything = frozenset(ReviewExpansion)
+    return [
+        _Scenario(
+            name="list_reviews_for_record",
+            path="/reviews/record/{record_id}",
+            method="GET",
+            build_models=lambda: [controller.to_expanded_review_response(dto) for dto in plain],
+            value=plain,
+            value_type=list[ExpandedReviewDTO],
+            exclude=controller.unexpanded_fields(frozenset()),
+        ),
+        _Scenario(
+            name="list_reviews_for_record: expand=all",
+            path="/reviews/record/{record_id}",
+            method="GET",
+            build_models=lambda: [controller.to_expanded_review_response(dto) for dto in expanded],
+            value=expanded,
+            value_type=list[ExpandedReviewDTO],
+            exclude=controller.unexpanded_fields(everything),
+        ),
+        _Scenario(
+            name="search_reviews",
+            path="/reviews/search",
+            method="GET",
+            build_models=lambda: controller.ReviewSearchPageResponse(
+                items=[
+                    controller.ReviewMatchResponse.model_validate(asdict(dto))
+                    for dto in matches.items
+                ],
+                next_cursor=matches.next_cursor,
+            ),
+            value=matches,
+            value_type=PageDTO[ReviewMatchDTO],
+        ),
+        _Scenario(
+            name="batch_get_reviews",
+            path="/reviews:batchGet",
+            method="POST",
+            build_models=lambda: controller.BatchGetReviewsResponse(
+                results=[
+                    controller.ReviewLookupResponse(
+                        id=lookup.id,
+                        found=lookup.review is not None,
+                        review=(
+                            None
+                            if lookup.review is None
+                            else controller.ReviewResponse.model_validate(asdict(lookup.review))
+                        ),
+                    )
+                    for lookup in lookups
+                ]
+            ),
+            value=controller.lookup_rows(lookups),
+            value_type=dict[str, list[controller.ReviewLookupRow]],
+        ),
+    ]
+
+
+def _route(path: str, method: str) -> APIRoute:
+    for route in reviews_router.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in (route.methods or ()):
+            return route
+    raise LookupError(f"{method} {path} is not a reviews route")
+
+
+async def _models_body(route: APIRoute, scenario: _Scenario) -> bytes:
+    # Lo mismo que hace FastAPI con lo que devuelve un handler async.
+    body: bytes = await serialize_response(
+        field=route.response_field,
+        response_content=scenario.build_models(),
+        exclude_unset=route.response_model_exclude_unset,
+        dump_json=True,
+    )
+    return body
+
+
+def _fast_body(scenario: _Scenario) -> bytes:
+    return encode_dto(scenario.value, scenario.value_type, exclude=scenario.exclude)
+
+
+async def _cpu_per_request_us(render: Callable[[], object], requests: int) -> float:
+    started = time.process_time()
+    for _ in range(requests):
+        result = render()
+        if asyncio.iscoroutine(result):
+            await result
+    return (time.process_time() - started) / requests * 1_000_000
+
+
+async def _measure(scenario: _Scenario, items: int, requests: int) -> SerializationResult:
+    route = _route(scenario.path, scenario.method)
+    models_body = await _models_body(route, scenario)
+    fast_body = _fast_body(scenario)
+    if models_body != fast_body:
+        raise AssertionError(f"{scenario.name}: the fast path changes the response body")
+
+    warmup = max(requests // 10, 1)
+    await _cpu_per_request_us(lambda: _models_body(route, scenario), warmup)
+    await _cpu_per_request_us(lambda: _fast_body(scenario), warmup)
+    return SerializationResult(
+        name=scenario.name,
+        items=items,
+        models_us=await _cpu_per_request_us(lambda: _models_body(route, scenario), requests),
+        fast_us=await _cpu_per_request_us(lambda: _fast_body(scenario), requests),
+        body_bytes=len(fast_body),
+    )
+
+
+def run_serialization_benchmark(*, items: int, requests: int) -> list[SerializationResult]:
+    """CPU por petición de cada camino, tras comprobar que ambos producen el mismo JSON."""
+
+    async def run() -> list[SerializationResult]:
+        return [await _measure(scenario, items, requests) for scenario in _scenarios(items)]
+
+    return asyncio.run(run())
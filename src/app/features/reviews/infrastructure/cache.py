@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Protocol
+
+from app.shared.infrastructure.metrics import (
+    CACHE_ENTRIES,
+    CACHE_EVICTIONS,
+    CACHE_HITS,
+    CACHE_INVALIDATIONS,
+    CACHE_MISSES,
+)
+from app.shared.infrastructure.settings import SharedCacheBackend, settings
+
+# Cada entrada pertenece a una sola etiqueta ("review:<id>", "record:<id>", ...) y se
+# distingue dentro de ella por una variante (p. ej. los parámetros de paginación). Las
+# escrituras invalidan etiquetas completas, nunca la caché entera.
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class SharedCache(Protocol):
+    """Nivel compartido entre procesos (p. ej. un hash de Redis por etiqueta)."""
+
+    def get(self, tag: str, variant: str) -> object | None: ...
+
+    def set(self, tag: str, variant: str, value: object, *, ttl_seconds: float) -> None: ...
+
+    def invalidate(self, tags: Iterable[str]) -> None: ...
+
+
+class InMemorySharedCache(SharedCache):
+    """Nivel compartido local al proceso, para pruebas y desarrollo sin un servidor de caché."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, tuple[float, object]]] = {}
+
+    def get(self, tag: str, variant: str) -> object | None:
+        with self._lock:
+            entry = self._entries.get(tag, {}).get(variant)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[tag][variant]
+                return None
+            return value
+
+    def set(self, tag: str, variant: str, value: object, *, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries.setdefault(tag, {})[variant] = (time.monotonic() + ttl_seconds, value)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._entries.pop(tag, None)
+
+
+@dataclass(slots=True)
+class _Entry:
+    expires_at: float
+    value: object
+
+
+class ReviewCache:
+    """LRU acotada con TTL en memoria, opcionalmente respaldada por un ``SharedCache``.
+
+    El nivel local de otros procesos no se entera de las invalidaciones; su TTL acota
+    cuánto tiempo pueden servir un valor viejo.
+    """
+
+    def __init__(
+        self, *, max_entries: int, ttl_seconds: float, shared: SharedCache | None = None
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._variants: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def generation(self, tag: str) -> int:
+        """Marca a pasar a ``set`` para descartar lecturas que se cruzaron con una escritura."""
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def get(self, tag: str, variant: str = "") -> object | None:
+        with self._lock:
+            entry = self._entries.get((tag, variant))
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end((tag, variant))
+                self._stats.hits += 1
+                return entry.value
+            if entry is not None:
+                self._remove((tag, variant))
+            generation = self._generations.get(tag, 0)
+
+        value = self._shared.get(tag, variant) if self._shared is not None else None
+        with self._lock:
+            if value is None:
+                self._stats.misses += 1
+                return None
+            self._stats.shared_hits += 1
+            if self._generations.get(tag, 0) == generation:
+                self._store(tag, variant, value)
+        return value
+
+    def set(self, tag: str, variant: str, value: object, *, generation: int) -> None:
+        if value is None:
+            return
+        with self._lock:
+            if self._generations.get(tag, 0) != generation:
+                return
+            self._store(tag, variant, value)
+        if self._shared is not None:
+            self._shared.set(tag, variant, value, ttl_seconds=self._ttl_seconds)
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for variant in self._variants.pop(tag, set()):
+                    del self._entries[(tag, variant)]
+                self._stats.invalidations += 1
+        if self._shared is not None:
+            self._shared.invalidate(tags)
+
+    def _store(self, tag: str, variant: str, value: object) -> None:
+        self._entries[(tag, variant)] = _Entry(time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end((tag, variant))
+        self._variants.setdefault(tag, set()).add(variant)
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        tag, variant = key
+        del self._entries[key]
+        variants = self._variants.get(tag)
+        if variants is not None:
+            variants.discard(variant)
+            if not variants:
+                del self._variants[tag]
+
+
+def _observe(cache: ReviewCache) -> None:
+    # Se leen de ``stats`` al exportar: la caché no paga nada extra por cada lectura.
+    CACHE_HITS.set_function("local", function=lambda: cache.stats.hits)
+    CACHE_HITS.set_function("shared", function=lambda: cache.stats.shared_hits)
+    CACHE_MISSES.set_function(function=lambda: cache.stats.misses)
+    CACHE_EVICTIONS.set_function(function=lambda: cache.stats.evictions)
+    CACHE_INVALIDATIONS.set_function(function=lambda: cache.stats.invalidations)
+    CACHE_ENTRIES.set_function(function=lambda: cache.stats.size)
+
+
+@lru_cache
+def get_review_cache() -> ReviewCache:
+    shared = InMemorySharedCache() if settings.cache.shared is SharedCacheBackend.MEMORY else None
+    cache = ReviewCache(
+        max_entries=settings.cache.max_entries,
+        ttl_seconds=settings.cache.ttl_seconds,
+        shared=shared,
+    )
+    if settings.metrics.enabled:
+        _observe(cache)
+    return cache
@@ -0,0 +1,468 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping, Sequence
+from decimal import Decimal
+from typing import Protocol, TypeVar, cast
+from uuid import UUID
+
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.repositories import AsyncReviewRepository, ReviewRepository
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.features.reviews.infrastructure.cache import ReviewCache
+
+T = TypeVar("T")
+
+
+def _review_tag(review_id: UUID) -> str:
+    return f"review:{review_id}"
+
+
+def _record_tag(record_id: UUID) -> str:
+    return f"record:{record_id}"
+
+
+def _images_tag(review_id: UUID) -> str:
+    return f"images:{review_id}"
+
+
+def _comments_tag(review_id: UUID) -> str:
+    return f"comments:{review_id}"
+
+
+def _votes_tag(review_id: UUID) -> str:
+    return f"votes:{review_id}"
+
+
+def _page_variant(limit: int, offset: int, after: PageCursor | None) -> str:
+    if after is None:
+        return f"{limit}:{offset}"
+    return f"{limit}:{after.created_at.isoformat()}:{after.id}"
+
+
+_VERSION_TAGS: dict[VersionedResource, Callable[[UUID], str]] = {
+    VersionedResource.REVIEW: _review_tag,
+    VersionedResource.RECORD_REVIEWS: _record_tag,
+    VersionedResource.REVIEW_IMAGES: _images_tag,
+    VersionedResource.REVIEW_COMMENTS: _comments_tag,
+    VersionedResource.REVIEW_VOTES: _votes_tag,
+}
+
+
+def _deleted_tags(review: Review) -> tuple[str, ...]:
+    return (
+        _review_tag(review.id),
+        _record_tag(review.record_id),
+        _images_tag(review.id),
+        _comments_tag(review.id),
+        _votes_tag(review.id),
+    )
+
+
+def _imported_tags(reviews: Sequence[Review], rejected: Mapping[UUID, ImportRejection]) -> set[str]:
+    return {_record_tag(review.record_id) for review in reviews if review.id not in rejected}
+
+
+class ReadRouting(Protocol):
+    """De dónde lee el repositorio envuelto; lo implementan los repositorios con réplicas."""
+
+    @property
+    def reads_from_replica(self) -> bool: ...
+
+
+# Con réplicas, la caché solo guarda lo leído del primario: una réplica atrasada la volvería a
+# llenar con la fila anterior a una escritura ya invalidada. Y las lecturas atadas al primario
+# (read-your-writes tras escribir, la propia escritura o réplicas caídas) no la consultan:
+# el nivel local de otros procesos no se entera de las invalidaciones.
+
+
+def _reads_cache(routing: ReadRouting | None) -> bool:
+    return routing is None or routing.reads_from_replica
+
+
+def _fills_cache(routing: ReadRouting | None) -> bool:
+    return routing is None or not routing.reads_from_replica
+
+
+def _cached_reviews(
+    cache: ReviewCache, review_ids: Sequence[UUID], *, read: bool = True
+) -> tuple[dict[UUID, Review], dict[UUID, int]]:
+    """Reseñas ya en caché y, para las demás, la generación a pasar a ``_store_reviews``."""
+    found: dict[UUID, Review] = {}
+    missing: dict[UUID, int] = {}
+    for review_id in dict.fromkeys(review_ids):
+        cached = cache.get(_review_tag(review_id)) if read else None
+        if cached is not None:
+            found[review_id] = cast(Review, cached)
+        else:
+            missing[review_id] = cache.generation(_review_tag(review_id))
+    return found, missing
+
+
+def _store_reviews(
+    cache: ReviewCache, loaded: Mapping[UUID, Review], generations: Mapping[UUID, int]
+) -> None:
+    for review_id, review in loaded.items():
+        cache.set(_review_tag(review_id), "", review, generation=generations[review_id])
+
+
+class CachingReviewRepository(ReviewRepository):
+    """Decorador de lectura con caché sobre cualquier ``ReviewRepository``.
+
+    Las lecturas pasan por ``ReviewCache``; cada escritura invalida solo las etiquetas de
+    la reseña, vivienda o recurso hijo que modificó, después de confirmarse. Con ``routing``
+    no guarda lo leído de una réplica ni atiende desde la caché las lecturas del primario.
+    """
+
+    def __init__(
+        self,
+        repository: ReviewRepository,
+        cache: ReviewCache,
+        *,
+        routing: ReadRouting | None = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._routing = routing
+
+    def create_review(self, review: Review) -> Review:
+        created = self._repository.create_review(review)
+        self._cache.invalidate(_record_tag(created.record_id))
+        return created
+
+    def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        created, created_images = self._repository.create_review_with_images(review, images)
+        self._cache.invalidate(_record_tag(created.record_id))
+        return created, created_images
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        rejected = self._repository.import_reviews(reviews)
+        self._cache.invalidate(*_imported_tags(reviews, rejected))
+        return rejected
+
+    def get_review(self, review_id: UUID) -> Review | None:
+        return self._read_through(
+            _review_tag(review_id), "", lambda: self._repository.get_review(review_id)
+        )
+
+    def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        # Las que faltan se piden en una sola consulta y se guardan por separado, con la
+        # misma etiqueta que ``get_review``.
+        found, missing = _cached_reviews(self._cache, review_ids, read=_reads_cache(self._routing))
+        if missing:
+            loaded = self._repository.get_reviews(list(missing))
+            if _fills_cache(self._routing):
+                _store_reviews(self._cache, loaded, missing)
+            found.update(loaded)
+        return found
+
+    def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        return self._read_through(
+            _record_tag(record_id),
+            _page_variant(limit, offset, after),
+            lambda: tuple(
+                self._repository.list_reviews_for_record(
+                    record_id, limit=limit, offset=offset, after=after
+                )
+            ),
+        )
+
+    def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        # Sin caché: cada texto buscado sería una variante distinta que casi no se repite.
+        return self._repository.search_reviews(query, record_id=record_id, limit=limit, after=after)
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReview]]:
+        # Las exportaciones no pasan por la caché: la recorrerían y desalojarían entera.
+        return self._repository.stream_reviews(filters, expand=expand)
+
+    def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        updated = self._repository.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+        self._cache.invalidate(_review_tag(updated.id), _record_tag(updated.record_id))
+        return updated
+
+    def delete_review(self, review_id: UUID) -> Review:
+        deleted = self._repository.delete_review(review_id)
+        self._cache.invalidate(*_deleted_tags(deleted))
+        return deleted
+
+    def add_image(self, image: ReviewImage) -> ReviewImage:
+        created = self._repository.add_image(image)
+        self._cache.invalidate(_images_tag(image.review_id))
+        return created
+
+    def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        return self._read_through(
+            _images_tag(review_id), "", lambda: tuple(self._repository.list_images(review_id))
+        )
+
+    def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        created = self._repository.add_comment(comment)
+        self._cache.invalidate(_comments_tag(comment.review_id))
+        return created
+
+    def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        return self._read_through(
+            _comments_tag(review_id),
+            _page_variant(limit, offset, after),
+            lambda: tuple(
+                self._repository.list_comments(review_id, limit=limit, offset=offset, after=after)
+            ),
+        )
+
+    def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        saved = self._repository.upsert_vote(vote)
+        self._cache.invalidate(_votes_tag(vote.review_id))
+        return saved
+
+    def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        result = self._repository.upsert_votes(votes)
+        self._cache.invalidate(*{_votes_tag(vote.review_id) for vote in votes})
+        return result
+
+    def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        return self._read_through(
+            _votes_tag(review_id), "", lambda: self._repository.get_votes_summary(review_id)
+        )
+
+    def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        # Mismas invalidaciones que el listado: toda escritura de reseñas toca su vivienda.
+        return self._read_through(
+            _record_tag(record_id), "stats", lambda: self._repository.get_record_stats(record_id)
+        )
+
+    def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        # Sin caché: los hijos de varias reseñas no caben bajo una sola etiqueta.
+        return self._repository.expand_reviews(reviews, expand, comments_limit=comments_limit)
+
+    def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        # Misma etiqueta que los datos: la invalidación de una escritura cubre ambos.
+        return self._read_through(
+            _VERSION_TAGS[resource](resource_id),
+            "version",
+            lambda: self._repository.get_version(resource, resource_id),
+        )
+
+    def _read_through(self, tag: str, variant: str, load: Callable[[], T]) -> T:
+        if _reads_cache(self._routing):
+            cached = self._cache.get(tag, variant)
+            if cached is not None:
+                return cast(T, cached)
+
+        generation = self._cache.generation(tag)
+        value = load()
+        # Después de ``load``: si la réplica falló, la lectura se repitió en el primario.
+        if _fills_cache(self._routing):
+            self._cache.set(tag, variant, value, generation=generation)
+        return value
+
+
+class AsyncCachingReviewRepository(AsyncReviewRepository):
+    """Equivalente asíncrono de ``CachingReviewRepository``; comparte la misma ``ReviewCache``."""
+
+    def __init__(
+        self,
+        repository: AsyncReviewRepository,
+        cache: ReviewCache,
+        *,
+        routing: ReadRouting | None = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._routing = routing
+
+    async def create_review(self, review: Review) -> Review:
+        created = await self._repository.create_review(review)
+        self._cache.invalidate(_record_tag(created.record_id))
+        return created
+
+    async def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        created, created_images = await self._repository.create_review_with_images(review, images)
+        self._cache.invalidate(_record_tag(created.record_id))
+        return created, created_images
+
+    async def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        rejected = await self._repository.import_reviews(reviews)
+        self._cache.invalidate(*_imported_tags(reviews, rejected))
+        return rejected
+
+    async def get_review(self, review_id: UUID) -> Review | None:
+        return await self._read_through(
+            _review_tag(review_id), "", lambda: self._repository.get_review(review_id)
+        )
+
+    async def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        found, missing = _cached_reviews(self._cache, review_ids, read=_reads_cache(self._routing))
+        if missing:
+            loaded = await self._repository.get_reviews(list(missing))
+            if _fills_cache(self._routing):
+                _store_reviews(self._cache, loaded, missing)
+            found.update(loaded)
+        return found
+
+    async def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        async def _load() -> Sequence[Review]:
+            return tuple(
+                await self._repository.list_reviews_for_record(
+                    record_id, limit=limit, offset=offset, after=after
+                )
+            )
+
+        return await self._read_through(
+            _record_tag(record_id), _page_variant(limit, offset, after), _load
+        )
+
+    async def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        return await self._repository.search_reviews(
+            query, record_id=record_id, limit=limit, after=after
+        )
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReview]]:
+        return self._repository.stream_reviews(filters, expand=expand)
+
+    async def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        updated = await self._repository.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+        self._cache.invalidate(_review_tag(updated.id), _record_tag(updated.record_id))
+        return updated
+
+    async def delete_review(self, review_id: UUID) -> Review:
+        deleted = await self._repository.delete_review(review_id)
+        self._cache.invalidate(*_deleted_tags(deleted))
+        return deleted
+
+    async def add_image(self, image: ReviewImage) -> ReviewImage:
+        created = await self._repository.add_image(image)
+        self._cache.invalidate(_images_tag(image.review_id))
+        return created
+
+    async def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        async def _load() -> Sequence[ReviewImage]:
+            return tuple(await self._repository.list_images(review_id))
+
+        return await self._read_through(_images_tag(review_id), "", _load)
+
+    async def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        created = await self._repository.add_comment(comment)
+        self._cache.invalidate(_comments_tag(comment.review_id))
+        return created
+
+    async def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        async def _load() -> Sequence[ReviewComment]:
+            return tuple(
+                await self._repository.list_comments(
+                    review_id, limit=limit, offset=offset, after=after
+                )
+            )
+
+        return await self._read_through(
+            _comments_tag(review_id), _page_variant(limit, offset, after), _load
+        )
+
+    async def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        saved = await self._repository.upsert_vote(vote)
+        self._cache.invalidate(_votes_tag(vote.review_id))
+        return saved
+
+    async def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        result = await self._repository.upsert_votes(votes)
+        self._cache.invalidate(*{_votes_tag(vote.review_id) for vote in votes})
+        return result
+
+    async def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        return await self._read_through(
+            _votes_tag(review_id), "", lambda: self._repository.get_votes_summary(review_id)
+        )
+
+    async def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        # Mismas invalidaciones que el listado: toda escritura de reseñas toca su vivienda.
+        return await self._read_through(
+            _record_tag(record_id), "stats", lambda: self._repository.get_record_stats(record_id)
+        )
+
+    async def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        return await self._repository.expand_reviews(reviews, expand, comments_limit=comments_limit)
+
+    async def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return await self._read_through(
+            _VERSION_TAGS[resource](resource_id),
+            "version",
+            lambda: self._repository.get_version(resource, resource_id),
+        )
+
+    async def _read_through(self, tag: str, variant: str, load: Callable[[], Awaitable[T]]) -> T:
+        if _reads_cache(self._routing):
+            cached = self._cache.get(tag, variant)
+            if cached is not None:
+                return cast(T, cached)
+
+        generation = self._cache.generation(tag)
+        value = await load()
+        if _fills_cache(self._routing):
+            self._cache.set(tag, variant, value, generation=generation)
+        return value
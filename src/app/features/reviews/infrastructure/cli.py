@@ -0,0 +1,261 @@
+import argparse
+import json
+import platform
+from collections.abc import Sequence
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.features.reviews.application.usecases.import_reviews import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    ImportReviewsUseCase,
+)
+from app.features.reviews.infrastructure.benchmarks.endpoints import run_endpoint_benchmark
+from app.features.reviews.infrastructure.benchmarks.execution import run_execution_benchmark
+from app.features.reviews.infrastructure.benchmarks.micro import run_micro_benchmarks
+from app.features.reviews.infrastructure.benchmarks.serialization import (
+    run_serialization_benchmark,
+)
+from app.features.reviews.infrastructure.maintenance import (
+    rebuild_record_stats,
+    reconcile_vote_counts,
+)
+from app.features.reviews.infrastructure.postgres_repository import PostgresReviewRepository
+from app.features.reviews.infrastructure.query_plans import explain_repository_queries
+from app.features.reviews.infrastructure.seed import SeedSize, seed_database
+from app.main import app
+from app.shared.infrastructure.database import get_engine, get_session_factory
+from app.shared.infrastructure.logger import logger
+from app.shared.infrastructure.settings import settings
+
+
+def _reconcile_votes(_: argparse.Namespace) -> None:
+    with get_session_factory()() as session:
+        touched = reconcile_vote_counts(session)
+    logger.info("Reconciled vote counters for %d reviews", touched)
+
+
+def _rebuild_record_stats(_: argparse.Namespace) -> None:
+    with get_session_factory()() as session:
+        records = rebuild_record_stats(session)
+    logger.info("Rebuilt review stats for %d records", records)
+
+
+def _import_reviews(args: argparse.Namespace) -> None:
+    with get_session_factory()() as session, open(args.path, "rb") as lines:
+        usecase = ImportReviewsUseCase(
+            PostgresReviewRepository(session), batch_size=args.batch_size
+        )
+        report = usecase.execute(lines)
+
+    for error in report.errors:
+        logger.warning("Line %d: %s", error.line, error.error)
+    logger.info(
+        "Imported %d of %d reviews (%d failed) in %.2f s, %.0f rows/s",
+        report.imported,
+        report.received,
+        report.failed,
+        report.elapsed_seconds,
+        report.rows_per_second,
+    )
+
+
+def _seed_size(args: argparse.Namespace) -> SeedSize:
+    return SeedSize(
+        records=args.records,
+        users=args.users,
+        reviews_per_record=args.reviews_per_record,
+        images_per_review=args.images_per_review,
+        comments_per_review=args.comments_per_review,
+        votes_per_review=args.votes_per_review,
+    )
+
+
+def _seed(args: argparse.Namespace) -> None:
+    with get_engine().connect() as connection:
+        seed_database(connection, _seed_size(args), alembic_ini=args.alembic_ini)
+    logger.info("Seeded database with %s", _seed_size(args))
+
+
+def _check_plans(args: argparse.Namespace) -> None:
+    if args.seed:
+        _seed(args)
+
+    with get_engine().connect() as connection:
+        plans = explain_repository_queries(connection)
+
+    for plan in plans:
+        logger.info(
+            "%-40s %8.3f ms  hit=%-5d read=%-5d %s",
+            plan.name,
+            plan.execution_ms,
+            plan.shared_hit_blocks,
+            plan.shared_read_blocks,
+            " > ".join(plan.node_types),
+        )
+
+    offenders = [
+        f"{plan.name} ({', '.join(plan.seq_scan_tables)})" for plan in plans if plan.has_seq_scan
+    ]
+    if offenders:
+        logger.error("Sequential scans found in: %s", ", ".join(offenders))
+        raise SystemExit(1)
+
+
+def _bench_serialization(args: argparse.Namespace) -> None:
+    results = run_serialization_benchmark(items=args.items, requests=args.requests)
+    for result in results:
+        logger.info(
+            "%-40s items=%-4d models=%8.1f us  fast=%8.1f us  x%.1f  %d bytes",
+            result.name,
+            result.items,
+            result.models_us,
+            result.fast_us,
+            result.speedup,
+            result.body_bytes,
+        )
+
+
+def _bench_execution(args: argparse.Namespace) -> None:
+    with get_engine().connect() as connection:
+        results = run_execution_benchmark(connection, warmup=args.warmup, requests=args.requests)
+    for result in results:
+        logger.info(
+            "%-30s %-5s session=%8.1f us  connection=%8.1f us  x%.2f",
+            result.name,
+            result.driver,
+            result.session_us,
+            result.connection_us,
+            result.speedup,
+        )
+
+
+def _bench(args: argparse.Namespace) -> None:
+    if args.seed:
+        _seed(args)
+
+    micro = run_micro_benchmarks(loops=args.loops)
+    for result in micro:
+        logger.info("%-50s %10.0f ns/op", result.name, result.ns_per_op)
+
+    with get_engine().connect() as connection:
+        endpoints = run_endpoint_benchmark(
+            app, connection, warmup=args.warmup, requests=args.requests
+        )
+    for endpoint in endpoints:
+        logger.info(
+            "%-40s %-6s mean=%7.2f ms  p50=%7.2f  p95=%7.2f  p99=%7.2f  max=%7.2f",
+            endpoint.name,
+            endpoint.method,
+            endpoint.mean_ms,
+            endpoint.p50_ms,
+            endpoint.p95_ms,
+            endpoint.p99_ms,
+            endpoint.max_ms,
+        )
+
+    # La configuración que cambia los resultados va junto a ellos para comparar corridas.
+    report = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            "database_mode": settings.database.mode.value,
+            "database_execution": settings.database.execution.value,
+            "pool_size": settings.database.pool_size,
+            "prepare_threshold": (
+                settings.database.prepare_threshold
+                if settings.database.prepared_statements
+                else None
+            ),
+            "cache": settings.cache.enabled,
+            "vote_buffer": settings.vote_buffer.enabled,
+            "fast_serialization": settings.serialization.fast,
+        },
+        "seed": asdict(_seed_size(args)) if args.seed else None,
+        "micro": [asdict(result) for result in micro],
+        "endpoints": [asdict(endpoint) for endpoint in endpoints],
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    logger.info("Wrote benchmark results to %s", args.output)
+
+
+def _add_seed_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = SeedSize()
+    parser.add_argument("--records", type=int, default=defaults.records)
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--reviews-per-record", type=int, default=defaults.reviews_per_record)
+    parser.add_argument("--images-per-review", type=int, default=defaults.images_per_review)
+    parser.add_argument("--comments-per-review", type=int, default=defaults.comments_per_review)
+    parser.add_argument("--votes-per-review", type=int, default=defaults.votes_per_review)
+    parser.add_argument("--alembic-ini", default="alembic.ini")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="reviews", description="Tareas de mantenimiento.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = commands.add_parser(
+        "reconcile-votes", help="Recalcula los contadores de votos desde review_votes"
+    )
+    reconcile.set_defaults(handler=_reconcile_votes)
+
+    rebuild_stats = commands.add_parser(
+        "rebuild-record-stats", help="Recalcula los agregados por vivienda desde reviews"
+    )
+    rebuild_stats.set_defaults(handler=_rebuild_record_stats)
+
+    import_reviews = commands.add_parser(
+        "import-reviews", help="Carga masiva de reseñas desde un archivo NDJSON usando COPY"
+    )
+    import_reviews.add_argument("path", help="Archivo NDJSON, una reseña por línea")
+    import_reviews.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE)
+    import_reviews.set_defaults(handler=_import_reviews)
+
+    seed = commands.add_parser(
+        "seed", help="Migra y siembra una base local con datos sintéticos reproducibles"
+    )
+    _add_seed_arguments(seed)
+    seed.set_defaults(handler=_seed)
+
+    check_plans = commands.add_parser(
+        "check-plans",
+        help="EXPLAIN (ANALYZE, BUFFERS) de cada consulta del repositorio; falla ante Seq Scan",
+    )
+    check_plans.add_argument("--seed", action="store_true", help="Sembrar la base antes")
+    _add_seed_arguments(check_plans)
+    check_plans.set_defaults(handler=_check_plans)
+
+    bench_serialization = commands.add_parser(
+        "bench-serialization",
+        help="CPU por petición al serializar con modelos de respuesta frente a los DTO directos",
+    )
+    bench_serialization.add_argument("--items", type=int, default=100)
+    bench_serialization.add_argument("--requests", type=int, default=500)
+    bench_serialization.set_defaults(handler=_bench_serialization)
+
+    bench_execution = commands.add_parser(
+        "bench-execution",
+        help="Tiempo por petición del repositorio con Session del ORM frente a Connection",
+    )
+    bench_execution.add_argument("--warmup", type=int, default=50)
+    bench_execution.add_argument("--requests", type=int, default=1000)
+    bench_execution.set_defaults(handler=_bench_execution)
+
+    bench = commands.add_parser(
+        "bench",
+        help="Micro-benchmarks de mapeo y latencia de cada ruta de reseñas; resultados en JSON",
+    )
+    bench.add_argument("--seed", action="store_true", help="Sembrar la base antes")
+    bench.add_argument("--loops", type=int, default=10_000)
+    bench.add_argument("--warmup", type=int, default=20)
+    bench.add_argument("--requests", type=int, default=200)
+    bench.add_argument("--output", default="bench-results.json")
+    _add_seed_arguments(bench)
+    bench.set_defaults(handler=_bench)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+from psycopg.errors import ForeignKeyViolation
+from sqlalchemy.exc import IntegrityError
+
+from app.features.reviews.domain.exceptions import ReviewNotFoundError
+
+
+def _violates_review_foreign_key(error: IntegrityError) -> bool:
+    # Postgres nombra las FK sin nombre explícito como ``<tabla>_<columna>_fkey``.
+    origin = error.orig
+    return isinstance(origin, ForeignKeyViolation) and (origin.diag.constraint_name or "").endswith(
+        "_review_id_fkey"
+    )
+
+
+@contextmanager
+def review_must_exist(review_id: UUID) -> Iterator[None]:
+    """Traduce la violación de la FK ``review_id`` de una tabla hija a ``ReviewNotFoundError``."""
+    try:
+        yield
+    except IntegrityError as exc:
+        if _violates_review_foreign_key(exc):
+            raise ReviewNotFoundError(f"Review {review_id} was not found") from exc
+        raise
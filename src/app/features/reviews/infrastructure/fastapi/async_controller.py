@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.features.reviews.application.dtos.create_review_dto import CreateReviewDTO
+from app.features.reviews.application.dtos.expanded_review_dto import ExpandedReviewDTO
+from app.features.reviews.application.dtos.page_dto import PageDTO
+from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
+from app.features.reviews.application.dtos.review_dto import ReviewDTO
+from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+from app.features.reviews.application.dtos.review_match_dto import ReviewMatchDTO
+from app.features.reviews.application.dtos.update_review_dto import UpdateReviewDTO
+from app.features.reviews.application.usecases.add_review_comment import (
+    AsyncAddReviewCommentUseCase,
+)
+from app.features.reviews.application.usecases.add_review_image import (
+    AsyncAddReviewImageUseCase,
+)
+from app.features.reviews.application.usecases.batch_get_reviews import (
+    AsyncBatchGetReviewsUseCase,
+)
+from app.features.reviews.application.usecases.cast_review_vote import (
+    AsyncCastReviewVoteUseCase,
+)
+from app.features.reviews.application.usecases.create_review import AsyncCreateReviewUseCase
+from app.features.reviews.application.usecases.delete_review import AsyncDeleteReviewUseCase
+from app.features.reviews.application.usecases.export_reviews import (
+    AsyncExportReviewsUseCase,
+)
+from app.features.reviews.application.usecases.get_record_review_stats import (
+    AsyncGetRecordReviewStatsUseCase,
+)
+from app.features.reviews.application.usecases.get_resource_version import (
+    AsyncGetResourceVersionUseCase,
+)
+from app.features.reviews.application.usecases.get_review import AsyncGetReviewUseCase
+from app.features.reviews.application.usecases.get_review_vote_summary import (
+    AsyncGetReviewVoteSummaryUseCase,
+)
+from app.features.reviews.application.usecases.import_reviews import (
+    MAX_IMPORT_LINE_BYTES,
+    AsyncImportReviewsUseCase,
+)
+from app.features.reviews.application.usecases.list_review_comments import (
+    AsyncListReviewCommentsUseCase,
+)
+from app.features.reviews.application.usecases.list_review_images import (
+    AsyncListReviewImagesUseCase,
+)
+from app.features.reviews.application.usecases.list_reviews_for_record import (
+    AsyncListReviewsForRecordUseCase,
+)
+from app.features.reviews.application.usecases.search_reviews import AsyncSearchReviewsUseCase
+from app.features.reviews.application.usecases.update_review import AsyncUpdateReviewUseCase
+from app.features.reviews.domain.exceptions import (
+    InvalidCursorError,
+    InvalidReviewRatingError,
+    ReviewAlreadyExistsError,
+    ReviewNotFoundError,
+    VoteBacklogFullError,
+)
+from app.features.reviews.domain.repositories import AsyncReviewRepository
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.infrastructure.fastapi.controller import (
+    MAX_SEARCH_QUERY_LENGTH,
+    BatchGetReviewsPayload,
+    BatchGetReviewsResponse,
+    CommentPayload,
+    CreatedReviewResponse,
+    CreateReviewPayload,
+    ExpandDep,
+    ExpandedReviewResponse,
+    ImagePayload,
+    ImportReportResponse,
+    RecordReviewStatsResponse,
+    ReviewCommentResponse,
+    ReviewFilterDep,
+    ReviewImageResponse,
+    ReviewLookupResponse,
+    ReviewLookupRow,
+    ReviewMatchResponse,
+    ReviewResponse,
+    ReviewSearchPageResponse,
+    ReviewVoteResponse,
+    UpdateReviewPayload,
+    VotePayload,
+    VoteQueueDep,
+    VoteSummaryResponse,
+    lookup_rows,
+    to_expanded_review_response,
+    unexpanded_fields,
+)
+from app.features.reviews.infrastructure.fastapi.etag import (
+    IfNoneMatch,
+    is_not_modified,
+    not_modified,
+    set_etag,
+    weak_etag,
+)
+from app.features.reviews.infrastructure.fastapi.export import (
+    ExportEncoder,
+    ExportFormat,
+    stream_export,
+)
+from app.features.reviews.infrastructure.fastapi.ndjson import ndjson_lines
+from app.features.reviews.infrastructure.fastapi.pagination import set_next_cursor
+from app.features.reviews.infrastructure.fastapi.serialization import (
+    SerializationDep,
+    SerializationMode,
+    dto_response,
+)
+from app.features.reviews.infrastructure.repository_factory import build_async_review_repository
+from app.shared.infrastructure.database import AsyncDbHandle, get_async_repository_db
+from app.shared.infrastructure.replicas import (
+    ReplicaLease,
+    get_async_replica_db,
+    pin_reads_to_primary,
+)
+
+AsyncDbSession = Annotated[AsyncDbHandle, Depends(get_async_repository_db, scope="function")]
+AsyncReplicaDbSession = Annotated[
+    ReplicaLease[AsyncDbHandle] | None, Depends(get_async_replica_db, scope="function")
+]
+
+
+async def get_async_review_repository(
+    db: AsyncDbSession, replica: AsyncReplicaDbSession, response: Response
+) -> AsyncReviewRepository:
+    return build_async_review_repository(
+        db, replica, on_write=lambda: pin_reads_to_primary(response)
+    )
+
+
+AsyncRepositoryDep = Annotated[AsyncReviewRepository, Depends(get_async_review_repository)]
+
+
+async def _resource_etag(
+    repository: AsyncReviewRepository,
+    resource: VersionedResource,
+    resource_id: UUID,
+    *variant: object,
+) -> str | None:
+    # La versión se lee antes que los datos: si una escritura se cuela entre ambas lecturas,
+    # el ETag queda más viejo que el cuerpo y el siguiente GET simplemente no coincide.
+    version = await AsyncGetResourceVersionUseCase(repository).execute(resource, resource_id)
+    return weak_etag(version, resource_id, *variant)
+
+
+async def create_review(
+    payload: CreateReviewPayload,
+    repository: AsyncRepositoryDep,
+) -> CreatedReviewResponse:
+    usecase = AsyncCreateReviewUseCase(repository)
+    try:
+        dto = await usecase.execute(
+            CreateReviewDTO(
+                record_id=payload.record_id,
+                user_id=payload.user_id,
+                rent_amount=payload.rent_amount,
+                review_text=payload.review_text,
+                rating=payload.rating,
+                image_urls=payload.image_urls,
+            )
+        )
+    except ReviewAlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except InvalidReviewRatingError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    return CreatedReviewResponse.model_validate(asdict(dto))
+
+
+async def import_reviews(request: Request, repository: AsyncRepositoryDep) -> ImportReportResponse:
+    usecase = AsyncImportReviewsUseCase(repository)
+    dto = await usecase.execute(ndjson_lines(request.stream(), MAX_IMPORT_LINE_BYTES))
+    return ImportReportResponse.model_validate(asdict(dto))
+
+
+async def export_reviews(
+    request: Request,
+    repository: AsyncRepositoryDep,
+    filters: ReviewFilterDep,
+    expand: ExpandDep,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+) -> StreamingResponse:
+    encoder = ExportEncoder(export_format, expand)
+    batches = AsyncExportReviewsUseCase(repository).execute(filters, expand)
+    return stream_export(request, encoder, batches)
+
+
+async def get_review(
+    review_id: UUID,
+    repository: AsyncRepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
+    if_none_match: IfNoneMatch = None,
+) -> ReviewResponse | Response:
+    etag = await _resource_etag(repository, VersionedResource.REVIEW, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
+    usecase = AsyncGetReviewUseCase(repository)
+    try:
+        dto = await usecase.execute(review_id)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
+    if serialization is SerializationMode.FAST:
+        return dto_response(dto, ReviewDTO, response)
+    return ReviewResponse.model_validate(asdict(dto))
+
+
+async def batch_get_reviews(
+    payload: BatchGetReviewsPayload,
+    repository: AsyncRepositoryDep,
+    serialization: SerializationDep,
+) -> BatchGetReviewsResponse | Response:
+    usecase = AsyncBatchGetReviewsUseCase(repository)
+    lookups = await usecase.execute(payload.ids)
+    if serialization is SerializationMode.FAST:
+        return dto_response(lookup_rows(lookups), dict[str, list[ReviewLookupRow]])
+    return BatchGetReviewsResponse(
+        results=[
+            ReviewLookupResponse(
+                id=lookup.id,
+                found=lookup.review is not None,
+                review=(
+                    None
+                    if lookup.review is None
+                    else ReviewResponse.model_validate(asdict(lookup.review))
+                ),
+            )
+            for lookup in lookups
+        ]
+    )
+
+
+async def list_reviews_for_record(
+    record_id: UUID,
+    repository: AsyncRepositoryDep,
+    response: Response,
+    expand: ExpandDep,
+    serialization: SerializationDep,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    if_none_match: IfNoneMatch = None,
+) -> list[ExpandedReviewResponse] | Response:
+    # Imágenes, comentarios y votos no cambian la versión del listado: sin ETag al expandir.
+    etag = (
+        None
+        if expand
+        else await _resource_etag(
+            repository, VersionedResource.RECORD_REVIEWS, record_id, limit, offset, cursor
+        )
+    )
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
+    usecase = AsyncListReviewsForRecordUseCase(repository)
+    try:
+        page = await usecase.execute(
+            record_id, limit=limit, offset=offset, cursor=cursor, expand=expand
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    set_etag(response, etag)
+    set_next_cursor(response, page.next_cursor)
+    if serialization is SerializationMode.FAST:
+        return dto_response(
+            page.items, list[ExpandedReviewDTO], response, exclude=unexpanded_fields(expand)
+        )
+    return [to_expanded_review_response(dto) for dto in page.items]
+
+
+async def search_reviews(
+    repository: AsyncRepositoryDep,
+    serialization: SerializationDep,
+    q: str = Query(min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH),
+    record_id: UUID | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+) -> ReviewSearchPageResponse | Response:
+    usecase = AsyncSearchReviewsUseCase(repository)
+    try:
+        page = await usecase.execute(q, record_id=record_id, limit=limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if serialization is SerializationMode.FAST:
+        return dto_response(page, PageDTO[ReviewMatchDTO])
+    return ReviewSearchPageResponse(
+        items=[ReviewMatchResponse.model_validate(asdict(dto)) for dto in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+async def get_record_review_stats(
+    record_id: UUID, repository: AsyncRepositoryDep
+) -> RecordReviewStatsResponse:
+    dto = await AsyncGetRecordReviewStatsUseCase(repository).execute(record_id)
+    return RecordReviewStatsResponse.model_validate(asdict(dto))
+
+
+async def update_review(
+    review_id: UUID,
+    payload: UpdateReviewPayload,
+    repository: AsyncRepositoryDep,
+) -> ReviewResponse:
+    usecase = AsyncUpdateReviewUseCase(repository)
+    try:
+        dto = await usecase.execute(
+            review_id,
+            UpdateReviewDTO(
+                rent_amount=payload.rent_amount,
+                review_text=payload.review_text,
+                rating=payload.rating,
+            ),
+        )
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except InvalidReviewRatingError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    return ReviewResponse.model_validate(asdict(dto))
+
+
+async def delete_review(review_id: UUID, repository: AsyncRepositoryDep) -> None:
+    usecase = AsyncDeleteReviewUseCase(repository)
+    try:
+        await usecase.execute(review_id)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+async def add_image(
+    review_id: UUID, payload: ImagePayload, repository: AsyncRepositoryDep
+) -> ReviewImageResponse:
+    usecase = AsyncAddReviewImageUseCase(repository)
+    try:
+        dto = await usecase.execute(review_id, payload.image_url)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return ReviewImageResponse.model_validate(asdict(dto))
+
+
+async def list_images(
+    review_id: UUID,
+    repository: AsyncRepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
+    if_none_match: IfNoneMatch = None,
+) -> Sequence[ReviewImageResponse] | Response:
+    etag = await _resource_etag(repository, VersionedResource.REVIEW_IMAGES, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
+    usecase = AsyncListReviewImagesUseCase(repository)
+    try:
+        dtos = await usecase.execute(review_id)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
+    if serialization is SerializationMode.FAST:
+        return dto_response(dtos, list[ReviewImageDTO], response)
+    return [ReviewImageResponse.model_validate(asdict(dto)) for dto in dtos]
+
+
+async def add_comment(
+    review_id: UUID,
+    payload: CommentPayload,
+    repository: AsyncRepositoryDep,
+) -> ReviewCommentResponse:
+    usecase = AsyncAddReviewCommentUseCase(repository)
+    try:
+        dto = await usecase.execute(review_id, payload.user_id, payload.comment_text)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return ReviewCommentResponse.model_validate(asdict(dto))
+
+
+async def list_comments(
+    review_id: UUID,
+    repository: AsyncRepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    if_none_match: IfNoneMatch = None,
+) -> list[ReviewCommentResponse] | Response:
+    etag = await _resource_etag(
+        repository, VersionedResource.REVIEW_COMMENTS, review_id, limit, offset, cursor
+    )
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
+    usecase = AsyncListReviewCommentsUseCase(repository)
+    try:
+        page = await usecase.execute(review_id, limit=limit, offset=offset, cursor=cursor)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    set_etag(response, etag)
+    set_next_cursor(response, page.next_cursor)
+    if serialization is SerializationMode.FAST:
+        return dto_response(page.items, list[ReviewCommentDTO], response)
+    return [ReviewCommentResponse.model_validate(asdict(dto)) for dto in page.items]
+
+
+async def cast_vote(
+    review_id: UUID,
+    payload: VotePayload,
+    repository: AsyncRepositoryDep,
+    queue: VoteQueueDep,
+    response: Response,
+) -> ReviewVoteResponse:
+    usecase = AsyncCastReviewVoteUseCase(repository, queue)
+    try:
+        dto = await usecase.execute(review_id, payload.user_id, payload.useful)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except VoteBacklogFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
+    if queue is not None:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return ReviewVoteResponse.model_validate(asdict(dto))
+
+
+async def vote_summary(
+    review_id: UUID,
+    repository: AsyncRepositoryDep,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+) -> VoteSummaryResponse | Response:
+    etag = await _resource_etag(repository, VersionedResource.REVIEW_VOTES, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
+    usecase = AsyncGetReviewVoteSummaryUseCase(repository)
+    try:
+        dto = await usecase.execute(review_id)
+    except ReviewNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
+    return VoteSummaryResponse.model_validate(asdict(dto))
@@ -4,14 +4,26 @@ from collections.abc import Sequence
 from dataclasses import asdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, TypedDict
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from pydantic.main import IncEx
 
 from app.features.reviews.application.dtos.create_review_dto import CreateReviewDTO
+from app.features.reviews.application.dtos.expanded_review_dto import (
+    EXPANSION_FIELDS,
+    ExpandedReviewDTO,
+)
+from app.features.reviews.application.dtos.page_dto import PageDTO
+from app.features.reviews.application.dtos.review_comment_dto import ReviewCommentDTO
+from app.features.reviews.application.dtos.review_dto import ReviewDTO
+from app.features.reviews.application.dtos.review_image_dto import ReviewImageDTO
+from app.features.reviews.application.dtos.review_lookup_dto import ReviewLookupDTO
+from app.features.reviews.application.dtos.review_match_dto import ReviewMatchDTO
 from app.features.reviews.application.dtos.update_review_dto import UpdateReviewDTO
 from app.features.reviews.application.usecases.add_review_comment import (
     AddReviewCommentUseCase,
@@ -19,15 +31,27 @@ from app.features.reviews.application.usecases.add_review_comment import (
 from app.features.reviews.application.usecases.add_review_image import (
     AddReviewImageUseCase,
 )
+from app.features.reviews.application.usecases.batch_get_reviews import BatchGetReviewsUseCase
 from app.features.reviews.application.usecases.cast_review_vote import (
     CastReviewVoteUseCase,
 )
 from app.features.reviews.application.usecases.create_review import CreateReviewUseCase
 from app.features.reviews.application.usecases.delete_review import DeleteReviewUseCase
+from app.features.reviews.application.usecases.export_reviews import ExportReviewsUseCase
+from app.features.reviews.application.usecases.get_record_review_stats import (
+    GetRecordReviewStatsUseCase,
+)
+from app.features.reviews.application.usecases.get_resource_version import (
+    GetResourceVersionUseCase,
+)
 from app.features.reviews.application.usecases.get_review import GetReviewUseCase
 from app.features.reviews.application.usecases.get_review_vote_summary import (
     GetReviewVoteSummaryUseCase,
 )
+from app.features.reviews.application.usecases.import_reviews import (
+    MAX_IMPORT_LINE_BYTES,
+    ImportReviewsUseCase,
+)
 from app.features.reviews.application.usecases.list_review_comments import (
     ListReviewCommentsUseCase,
 )
@@ -37,28 +61,124 @@ from app.features.reviews.application.usecases.list_review_images import (
 from app.features.reviews.application.usecases.list_reviews_for_record import (
     ListReviewsForRecordUseCase,
 )
+from app.features.reviews.application.usecases.search_reviews import SearchReviewsUseCase
 from app.features.reviews.application.usecases.update_review import UpdateReviewUseCase
 from app.features.reviews.domain.exceptions import (
+    InvalidCursorError,
     InvalidReviewRatingError,
     ReviewAlreadyExistsError,
     ReviewNotFoundError,
+    VoteBacklogFullError,
 )
+from app.features.reviews.domain.expansion import ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
 from app.features.reviews.domain.repositories import ReviewRepository
-from app.features.reviews.infrastructure.postgres_repository import (
-    PostgresReviewRepository,
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteQueue
+from app.features.reviews.infrastructure.fastapi.etag import (
+    IfNoneMatch,
+    is_not_modified,
+    not_modified,
+    set_etag,
+    weak_etag,
+)
+from app.features.reviews.infrastructure.fastapi.export import (
+    ExportEncoder,
+    ExportFormat,
+    stream_blocking_export,
+)
+from app.features.reviews.infrastructure.fastapi.ndjson import blocking_ndjson_lines
+from app.features.reviews.infrastructure.fastapi.pagination import set_next_cursor
+from app.features.reviews.infrastructure.fastapi.serialization import (
+    SerializationDep,
+    SerializationMode,
+    dto_response,
 )
-from app.shared.infrastructure.database import get_db
+from app.features.reviews.infrastructure.repository_factory import build_review_repository
+from app.shared.infrastructure.database import DbHandle, get_repository_db
+from app.shared.infrastructure.replicas import ReplicaLease, get_replica_db, pin_reads_to_primary
 
-DbSession = Annotated[Session, Depends(get_db)]
+# Tope de ids por llamada a batchGet; una página de listado usa entre 30 y 50.
+MAX_BATCH_GET_IDS = 100
 
+MAX_SEARCH_QUERY_LENGTH = 200
 
-def get_review_repository(db: DbSession) -> ReviewRepository:
-    return PostgresReviewRepository(db)
+# scope="function": la sesión se cierra, y su conexión vuelve al pool, en cuanto el handler
+# retorna, no después de serializar y enviar la respuesta.
+DbSession = Annotated[DbHandle, Depends(get_repository_db, scope="function")]
+ReplicaDbSession = Annotated[
+    ReplicaLease[DbHandle] | None, Depends(get_replica_db, scope="function")
+]
+
+
+def get_review_repository(
+    db: DbSession, replica: ReplicaDbSession, response: Response
+) -> ReviewRepository:
+    return build_review_repository(db, replica, on_write=lambda: pin_reads_to_primary(response))
 
 
 RepositoryDep = Annotated[ReviewRepository, Depends(get_review_repository)]
 
 
+# Las dependencias que no hacen I/O son ``async def`` aunque las compartan los handlers
+# síncronos: FastAPI corre las ``def`` en el threadpool y en modo asíncrono cada petición
+# pagaría ese salto.
+
+
+async def get_vote_queue(request: Request) -> VoteQueue | None:
+    # El lifespan deja aquí el buffer de votos cuando la escritura diferida está activa.
+    queue: VoteQueue | None = getattr(request.app.state, "vote_queue", None)
+    return queue
+
+
+VoteQueueDep = Annotated[VoteQueue | None, Depends(get_vote_queue)]
+
+
+async def get_review_filter(
+    record_id: UUID | None = None,
+    user_id: UUID | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> ReviewFilter:
+    return ReviewFilter(
+        record_id=record_id,
+        user_id=user_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+ReviewFilterDep = Annotated[ReviewFilter, Depends(get_review_filter)]
+
+
+async def get_expansions(
+    expand: str | None = Query(default=None, description="Lista separada por comas"),
+) -> frozenset[ReviewExpansion]:
+    names = [name.strip() for name in (expand or "").split(",") if name.strip()]
+    try:
+        return frozenset(ReviewExpansion(name) for name in names)
+    except ValueError as exc:
+        allowed = ", ".join(item.value for item in ReviewExpansion)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"expand accepts: {allowed}"
+        ) from exc
+
+
+ExpandDep = Annotated[frozenset[ReviewExpansion], Depends(get_expansions)]
+
+
+def _resource_etag(
+    repository: ReviewRepository,
+    resource: VersionedResource,
+    resource_id: UUID,
+    *variant: object,
+) -> str | None:
+    # La versión se lee antes que los datos: si una escritura se cuela entre ambas lecturas,
+    # el ETag queda más viejo que el cuerpo y el siguiente GET simplemente no coincide.
+    version = GetResourceVersionUseCase(repository).execute(resource, resource_id)
+    return weak_etag(version, resource_id, *variant)
+
+
 class ReviewResponse(BaseModel):
     id: UUID
     record_id: UUID
@@ -69,6 +189,25 @@ class ReviewResponse(BaseModel):
     created_at: datetime
 
 
+class ReviewLookupResponse(BaseModel):
+    id: UUID
+    found: bool
+    review: ReviewResponse | None
+
+
+class BatchGetReviewsResponse(BaseModel):
+    results: list[ReviewLookupResponse]
+
+
+class ReviewMatchResponse(ReviewResponse):
+    rank: float
+
+
+class ReviewSearchPageResponse(BaseModel):
+    items: list[ReviewMatchResponse]
+    next_cursor: str | None
+
+
 class ReviewImageResponse(BaseModel):
     id: UUID
     review_id: UUID
@@ -76,6 +215,10 @@ class ReviewImageResponse(BaseModel):
     uploaded_at: datetime
 
 
+class CreatedReviewResponse(ReviewResponse):
+    images: list[ReviewImageResponse]
+
+
 class ReviewCommentResponse(BaseModel):
     id: UUID
     review_id: UUID
@@ -84,6 +227,50 @@ class ReviewCommentResponse(BaseModel):
     created_at: datetime
 
 
+class ExpandedReviewResponse(ReviewResponse):
+    """Reseña de un listado; los campos de ``expand`` solo aparecen si se pidieron."""
+
+    images: list[ReviewImageResponse] | None = None
+    comments: list[ReviewCommentResponse] | None = None
+    useful_votes: int | None = None
+    not_useful_votes: int | None = None
+
+
+class ReviewLookupRow(TypedDict):
+    """Forma de ``ReviewLookupResponse`` armada sobre los DTO para el modo rápido."""
+
+    id: UUID
+    found: bool
+    review: ReviewDTO | None
+
+
+def lookup_rows(lookups: Sequence[ReviewLookupDTO]) -> dict[str, list[ReviewLookupRow]]:
+    return {
+        "results": [
+            ReviewLookupRow(id=lookup.id, found=lookup.review is not None, review=lookup.review)
+            for lookup in lookups
+        ]
+    }
+
+
+def unexpanded_fields(expand: frozenset[ReviewExpansion]) -> IncEx | None:
+    # Equivale a exclude_unset del modo con modelos: las expansiones no pedidas no aparecen.
+    hidden = {
+        name for item, names in EXPANSION_FIELDS.items() if item not in expand for name in names
+    }
+    return {"__all__": hidden} if hidden else None
+
+
+def to_expanded_review_response(dto: ExpandedReviewDTO) -> ExpandedReviewResponse:
+    # Las expansiones no pedidas quedan sin asignar para que exclude_unset las omita.
+    fields = {
+        name: value
+        for name, value in asdict(dto).items()
+        if value is not None or name in ReviewResponse.model_fields
+    }
+    return ExpandedReviewResponse.model_validate(fields)
+
+
 class ReviewVoteResponse(BaseModel):
     id: UUID
     review_id: UUID
@@ -98,6 +285,32 @@ class VoteSummaryResponse(BaseModel):
     not_useful_votes: int
 
 
+class RecordReviewStatsResponse(BaseModel):
+    record_id: UUID
+    review_count: int
+    average_rating: float | None
+    rating_histogram: dict[int, int]
+    average_rent: Decimal | None
+
+
+class ImportRowErrorResponse(BaseModel):
+    line: int
+    error: str
+
+
+class ImportReportResponse(BaseModel):
+    received: int
+    imported: int
+    failed: int
+    errors: list[ImportRowErrorResponse]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class BatchGetReviewsPayload(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
 class CreateReviewPayload(BaseModel):
     record_id: UUID
     user_id: UUID
@@ -130,7 +343,7 @@ class VotePayload(BaseModel):
 def create_review(
     payload: CreateReviewPayload,
     repository: RepositoryDep,
-) -> ReviewResponse:
+) -> CreatedReviewResponse:
     usecase = CreateReviewUseCase(repository)
     try:
         dto = usecase.execute(
@@ -149,27 +362,137 @@ def create_review(
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
         ) from exc
-    return ReviewResponse.model_validate(asdict(dto))
+    return CreatedReviewResponse.model_validate(asdict(dto))
+
+
+async def import_reviews(request: Request, repository: RepositoryDep) -> ImportReportResponse:
+    # Leer el cuerpo en streaming exige un handler async; la carga corre en el threadpool
+    # igual que el resto de los handlers síncronos.
+    usecase = ImportReviewsUseCase(repository)
+    lines = blocking_ndjson_lines(request.stream(), MAX_IMPORT_LINE_BYTES)
+    dto = await run_in_threadpool(usecase.execute, lines)
+    return ImportReportResponse.model_validate(asdict(dto))
+
+
+def export_reviews(
+    request: Request,
+    repository: RepositoryDep,
+    filters: ReviewFilterDep,
+    expand: ExpandDep,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+) -> StreamingResponse:
+    encoder = ExportEncoder(export_format, expand)
+    batches = ExportReviewsUseCase(repository).execute(filters, expand)
+    return stream_blocking_export(request, encoder, batches)
 
 
-def get_review(review_id: UUID, repository: RepositoryDep) -> ReviewResponse:
+def get_review(
+    review_id: UUID,
+    repository: RepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
+    if_none_match: IfNoneMatch = None,
+) -> ReviewResponse | Response:
+    etag = _resource_etag(repository, VersionedResource.REVIEW, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
     usecase = GetReviewUseCase(repository)
     try:
         dto = usecase.execute(review_id)
     except ReviewNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
+    if serialization is SerializationMode.FAST:
+        return dto_response(dto, ReviewDTO, response)
     return ReviewResponse.model_validate(asdict(dto))
 
 
+def batch_get_reviews(
+    payload: BatchGetReviewsPayload,
+    repository: RepositoryDep,
+    serialization: SerializationDep,
+) -> BatchGetReviewsResponse | Response:
+    usecase = BatchGetReviewsUseCase(repository)
+    lookups = usecase.execute(payload.ids)
+    if serialization is SerializationMode.FAST:
+        return dto_response(lookup_rows(lookups), dict[str, list[ReviewLookupRow]])
+    return BatchGetReviewsResponse(
+        results=[
+            ReviewLookupResponse(
+                id=lookup.id,
+                found=lookup.review is not None,
+                review=(
+                    None
+                    if lookup.review is None
+                    else ReviewResponse.model_validate(asdict(lookup.review))
+                ),
+            )
+            for lookup in lookups
+        ]
+    )
+
+
 def list_reviews_for_record(
     record_id: UUID,
     repository: RepositoryDep,
+    response: Response,
+    expand: ExpandDep,
+    serialization: SerializationDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-) -> Sequence[ReviewResponse]:
+    cursor: str | None = Query(default=None),
+    if_none_match: IfNoneMatch = None,
+) -> list[ExpandedReviewResponse] | Response:
+    # Imágenes, comentarios y votos no cambian la versión del listado: sin ETag al expandir.
+    etag = (
+        None
+        if expand
+        else _resource_etag(
+            repository, VersionedResource.RECORD_REVIEWS, record_id, limit, offset, cursor
+        )
+    )
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
     usecase = ListReviewsForRecordUseCase(repository)
-    dtos = usecase.execute(record_id, limit=limit, offset=offset)
-    return [ReviewResponse.model_validate(asdict(dto)) for dto in dtos]
+    try:
+        page = usecase.execute(record_id, limit=limit, offset=offset, cursor=cursor, expand=expand)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    set_etag(response, etag)
+    set_next_cursor(response, page.next_cursor)
+    if serialization is SerializationMode.FAST:
+        return dto_response(
+            page.items, list[ExpandedReviewDTO], response, exclude=unexpanded_fields(expand)
+        )
+    return [to_expanded_review_response(dto) for dto in page.items]
+
+
+def search_reviews(
+    repository: RepositoryDep,
+    serialization: SerializationDep,
+    q: str = Query(min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH),
+    record_id: UUID | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+) -> ReviewSearchPageResponse | Response:
+    usecase = SearchReviewsUseCase(repository)
+    try:
+        page = usecase.execute(q, record_id=record_id, limit=limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if serialization is SerializationMode.FAST:
+        return dto_response(page, PageDTO[ReviewMatchDTO])
+    return ReviewSearchPageResponse(
+        items=[ReviewMatchResponse.model_validate(asdict(dto)) for dto in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+def get_record_review_stats(
+    record_id: UUID, repository: RepositoryDep
+) -> RecordReviewStatsResponse:
+    dto = GetRecordReviewStatsUseCase(repository).execute(record_id)
+    return RecordReviewStatsResponse.model_validate(asdict(dto))
 
 
 def update_review(
@@ -215,12 +538,24 @@ def add_image(
     return ReviewImageResponse.model_validate(asdict(dto))
 
 
-def list_images(review_id: UUID, repository: RepositoryDep) -> Sequence[ReviewImageResponse]:
+def list_images(
+    review_id: UUID,
+    repository: RepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
+    if_none_match: IfNoneMatch = None,
+) -> Sequence[ReviewImageResponse] | Response:
+    etag = _resource_etag(repository, VersionedResource.REVIEW_IMAGES, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
     usecase = ListReviewImagesUseCase(repository)
     try:
         dtos = usecase.execute(review_id)
     except ReviewNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
+    if serialization is SerializationMode.FAST:
+        return dto_response(dtos, list[ReviewImageDTO], response)
     return [ReviewImageResponse.model_validate(asdict(dto)) for dto in dtos]
 
 
@@ -240,34 +575,68 @@ def add_comment(
 def list_comments(
     review_id: UUID,
     repository: RepositoryDep,
+    response: Response,
+    serialization: SerializationDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-) -> Sequence[ReviewCommentResponse]:
+    cursor: str | None = Query(default=None),
+    if_none_match: IfNoneMatch = None,
+) -> list[ReviewCommentResponse] | Response:
+    etag = _resource_etag(
+        repository, VersionedResource.REVIEW_COMMENTS, review_id, limit, offset, cursor
+    )
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
     usecase = ListReviewCommentsUseCase(repository)
     try:
-        dtos = usecase.execute(review_id, limit=limit, offset=offset)
+        page = usecase.execute(review_id, limit=limit, offset=offset, cursor=cursor)
     except ReviewNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    return [ReviewCommentResponse.model_validate(asdict(dto)) for dto in dtos]
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    set_etag(response, etag)
+    set_next_cursor(response, page.next_cursor)
+    if serialization is SerializationMode.FAST:
+        return dto_response(page.items, list[ReviewCommentDTO], response)
+    return [ReviewCommentResponse.model_validate(asdict(dto)) for dto in page.items]
 
 
 def cast_vote(
     review_id: UUID,
     payload: VotePayload,
     repository: RepositoryDep,
+    queue: VoteQueueDep,
+    response: Response,
 ) -> ReviewVoteResponse:
-    usecase = CastReviewVoteUseCase(repository)
+    usecase = CastReviewVoteUseCase(repository, queue)
     try:
         dto = usecase.execute(review_id, payload.user_id, payload.useful)
     except ReviewNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except VoteBacklogFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
+    if queue is not None:
+        response.status_code = status.HTTP_202_ACCEPTED
     return ReviewVoteResponse.model_validate(asdict(dto))
 
 
-def vote_summary(review_id: UUID, repository: RepositoryDep) -> VoteSummaryResponse:
+def vote_summary(
+    review_id: UUID,
+    repository: RepositoryDep,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+) -> VoteSummaryResponse | Response:
+    etag = _resource_etag(repository, VersionedResource.REVIEW_VOTES, review_id)
+    if is_not_modified(etag, if_none_match):
+        return not_modified(etag)
     usecase = GetReviewVoteSummaryUseCase(repository)
     try:
         dto = usecase.execute(review_id)
     except ReviewNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    set_etag(response, etag)
     return VoteSummaryResponse.model_validate(asdict(dto))
@@ -0,0 +1,33 @@
+import hashlib
+from typing import Annotated, TypeGuard
+
+from fastapi import Header, Response, status
+
+IfNoneMatch = Annotated[str | None, Header()]
+
+
+def weak_etag(version: str | None, *variant: object) -> str | None:
+    """ETag débil a partir de la versión del recurso y de los parámetros que cambian el cuerpo."""
+    if version is None:
+        return None
+    payload = "|".join([version, *(str(part) for part in variant)])
+    return f'W/"{hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()}"'
+
+
+def is_not_modified(etag: str | None, if_none_match: str | None) -> TypeGuard[str]:
+    # If-None-Match usa comparación débil: se ignora el prefijo W/ de ambos lados.
+    if etag is None or not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def set_etag(response: Response, etag: str | None) -> None:
+    if etag is not None:
+        response.headers["ETag"] = etag
@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterable, Sequence
+from contextlib import aclosing, closing
+from typing import Literal
+
+import anyio
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from app.features.reviews.application.dtos.expanded_review_dto import (
+    EXPANSION_FIELDS,
+    ExpandedReviewDTO,
+)
+from app.features.reviews.domain.expansion import ReviewExpansion
+from app.features.reviews.infrastructure.fastapi.ndjson import NDJSON_MEDIA_TYPE
+from app.shared.infrastructure.logger import logger
+
+ExportFormat = Literal["ndjson", "csv"]
+
+_row_adapter = TypeAdapter(ExpandedReviewDTO)
+
+_REVIEW_COLUMNS = ("id", "record_id", "user_id", "rent_amount", "review_text", "rating")
+
+
+class ExportEncoder:
+    """Serializa los lotes de una exportación con las columnas de los recursos pedidos.
+
+    En CSV las imágenes y comentarios van como JSON dentro de su columna.
+    """
+
+    def __init__(self, export_format: ExportFormat, expand: frozenset[ReviewExpansion]) -> None:
+        self._format = export_format
+        self._columns = [
+            *_REVIEW_COLUMNS,
+            "created_at",
+            *(
+                name
+                for item in ReviewExpansion
+                if item in expand
+                for name in EXPANSION_FIELDS[item]
+            ),
+        ]
+
+    @property
+    def media_type(self) -> str:
+        return NDJSON_MEDIA_TYPE if self._format == "ndjson" else "text/csv; charset=utf-8"
+
+    @property
+    def filename(self) -> str:
+        return f"reviews.{self._format}"
+
+    def header(self) -> bytes:
+        if self._format == "ndjson":
+            return b""
+        return self._csv_lines([self._columns])
+
+    def encode(self, batch: list[ExpandedReviewDTO]) -> bytes:
+        if self._format == "ndjson":
+            include = set(self._columns)
+            return b"".join(_row_adapter.dump_json(row, include=include) + b"\n" for row in batch)
+        rows = (_row_adapter.dump_python(row, mode="json") for row in batch)
+        return self._csv_lines([[_csv_value(row[name]) for name in self._columns] for row in rows])
+
+    @staticmethod
+    def _csv_lines(rows: Iterable[Sequence[object]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+
+
+def _csv_value(value: object) -> object:
+    return json.dumps(value) if isinstance(value, list) else value
+
+
+async def _until_disconnected(
+    request: Request, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    # Entre lotes se revisa la conexión: si el cliente se fue no se lee el siguiente FETCH.
+    async for chunk in chunks:
+        if await request.is_disconnected():
+            logger.info("Client disconnected, stopping export at %s", request.url.path)
+            return
+        yield chunk
+
+
+def _response(
+    request: Request, encoder: ExportEncoder, chunks: AsyncGenerator[bytes]
+) -> StreamingResponse:
+    async def _body() -> AsyncIterator[bytes]:
+        async with aclosing(chunks):
+            async for chunk in _until_disconnected(request, chunks):
+                yield chunk
+
+    return StreamingResponse(
+        _body(),
+        media_type=encoder.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{encoder.filename}"'},
+    )
+
+
+def stream_export(
+    request: Request, encoder: ExportEncoder, batches: AsyncGenerator[list[ExpandedReviewDTO]]
+) -> StreamingResponse:
+    async def _chunks() -> AsyncGenerator[bytes]:
+        async with aclosing(batches):
+            yield encoder.header()
+            async for batch in batches:
+                yield encoder.encode(batch)
+
+    return _response(request, encoder, _chunks())
+
+
+def stream_blocking_export(
+    request: Request, encoder: ExportEncoder, batches: Generator[list[ExpandedReviewDTO]]
+) -> StreamingResponse:
+    """Como ``stream_export``, pero leyendo y serializando cada lote en el threadpool."""
+
+    def _encoded() -> Generator[bytes]:
+        with closing(batches):
+            yield encoder.header()
+            for batch in batches:
+                yield encoder.encode(batch)
+
+    async def _chunks() -> AsyncGenerator[bytes]:
+        encoded = _encoded()
+        try:
+            async for chunk in iterate_in_threadpool(encoded):
+                yield chunk
+        finally:
+            # El cursor se cierra en un hilo aunque la tarea de la respuesta se haya cancelado.
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(encoded.close)
+
+    return _response(request, encoder, _chunks())
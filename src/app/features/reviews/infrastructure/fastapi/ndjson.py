@@ -0,0 +1,70 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+
+import anyio.from_thread
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class _LineSplitter:
+    """Parte un cuerpo recibido por trozos en líneas sin cargarlo completo en memoria.
+
+    Una línea que supera ``max_line_bytes`` se entrega recortada a ``max_line_bytes + 1``
+    bytes (el resto se descarta): quien la lee la rechaza por su largo sin que el servidor
+    tenga que acumularla completa.
+    """
+
+    def __init__(self, max_line_bytes: int) -> None:
+        self._limit = max_line_bytes + 1
+        self._pieces: list[bytes] = []
+        self._size = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        first, *rest = chunk.split(b"\n")
+        self._append(first)
+        if not rest:
+            return []
+        *complete, last = rest
+        lines = [self._take(), *(line[: self._limit] for line in complete)]
+        self._append(last)
+        return lines
+
+    def close(self) -> list[bytes]:
+        return [self._take()] if self._size else []
+
+    def _append(self, piece: bytes) -> None:
+        # Los trozos se juntan una sola vez al cerrar la línea, no en cada ``feed``.
+        room = self._limit - self._size
+        if piece and room > 0:
+            self._pieces.append(piece[:room])
+            self._size += min(len(piece), room)
+
+    def _take(self) -> bytes:
+        line = b"".join(self._pieces)
+        self._pieces, self._size = [], 0
+        return line
+
+
+async def ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    splitter = _LineSplitter(max_line_bytes)
+    async for chunk in chunks:
+        for line in splitter.feed(chunk):
+            yield line
+    for line in splitter.close():
+        yield line
+
+
+async def _next_chunk(iterator: AsyncIterator[bytes]) -> bytes | None:
+    return await anext(iterator, None)
+
+
+def blocking_ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> Iterator[bytes]:
+    """Versión para código síncrono corriendo en el threadpool de AnyIO.
+
+    Cada trozo del cuerpo se pide al event loop con ``anyio.from_thread``; el cuerpo sigue
+    llegando en streaming mientras el hilo escribe en la base.
+    """
+    iterator = aiter(chunks)
+    splitter = _LineSplitter(max_line_bytes)
+    while (chunk := anyio.from_thread.run(_next_chunk, iterator)) is not None:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
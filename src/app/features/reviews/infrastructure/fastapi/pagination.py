@@ -0,0 +1,10 @@
+from fastapi import Response
+
+# Los listados responden un arreglo JSON; el cursor de la página siguiente va en cabecera
+# para no cambiar la forma del cuerpo que ya consumen los clientes.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -1,51 +1,96 @@
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
 
-from app.features.reviews.infrastructure.fastapi import controller
+from app.features.reviews.infrastructure.fastapi import async_controller, controller
+from app.features.reviews.infrastructure.fastapi.ndjson import NDJSON_MEDIA_TYPE
+from app.features.reviews.infrastructure.fastapi.serialization import route_class_for
+from app.shared.infrastructure.settings import settings
 
-reviews_router = APIRouter(prefix="/reviews", tags=["reviews"])
+# Los modelos de respuesta se comparten; solo cambia el modo de ejecución de los handlers.
+handlers = async_controller if settings.database.is_async else controller
 
-reviews_router.post(
-    "/", response_model=controller.ReviewResponse, status_code=status.HTTP_201_CREATED
-)(controller.create_review)
+# La clase de ruta decide si las lecturas serializan los DTO directamente (modo rápido).
+reviews_router = APIRouter(
+    prefix="/reviews",
+    tags=["reviews"],
+    route_class=route_class_for(settings.serialization.fast),
+)
 
-reviews_router.get("/{review_id}", response_model=controller.ReviewResponse)(controller.get_review)
+reviews_router.post(
+    "/", response_model=controller.CreatedReviewResponse, status_code=status.HTTP_201_CREATED
+)(handlers.create_review)
 
-reviews_router.get("/record/{record_id}", response_model=list[controller.ReviewResponse])(
-    controller.list_reviews_for_record
+# Método personalizado al estilo AIP-136: "/reviews:batchGet" no choca con "/{review_id}".
+reviews_router.post(":batchGet", response_model=controller.BatchGetReviewsResponse)(
+    handlers.batch_get_reviews
 )
 
-reviews_router.put("/{review_id}", response_model=controller.ReviewResponse)(
-    controller.update_review
+reviews_router.post(
+    "/import",
+    response_model=controller.ImportReportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
+        }
+    },
+)(handlers.import_reviews)
+
+# Antes de "/{review_id}" para que "export" y "search" no se tomen como un id.
+reviews_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}, "text/csv": {}}},
+    },
+)(handlers.export_reviews)
+
+reviews_router.get("/search", response_model=controller.ReviewSearchPageResponse)(
+    handlers.search_reviews
 )
+
+reviews_router.get("/{review_id}", response_model=controller.ReviewResponse)(handlers.get_review)
+
+reviews_router.get(
+    "/record/{record_id}",
+    response_model=list[controller.ExpandedReviewResponse],
+    response_model_exclude_unset=True,
+)(handlers.list_reviews_for_record)
+
+reviews_router.get(
+    "/record/{record_id}/stats", response_model=controller.RecordReviewStatsResponse
+)(handlers.get_record_review_stats)
+
+reviews_router.put("/{review_id}", response_model=controller.ReviewResponse)(handlers.update_review)
 reviews_router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)(
-    controller.delete_review
+    handlers.delete_review
 )
 
 reviews_router.post(
     "/{review_id}/images",
     response_model=controller.ReviewImageResponse,
     status_code=status.HTTP_201_CREATED,
-)(controller.add_image)
+)(handlers.add_image)
 reviews_router.get("/{review_id}/images", response_model=list[controller.ReviewImageResponse])(
-    controller.list_images
+    handlers.list_images
 )
 
 reviews_router.post(
     "/{review_id}/comments",
     response_model=controller.ReviewCommentResponse,
     status_code=status.HTTP_201_CREATED,
-)(controller.add_comment)
+)(handlers.add_comment)
 
 reviews_router.get(
     "/{review_id}/comments",
     response_model=list[controller.ReviewCommentResponse],
-)(controller.list_comments)
+)(handlers.list_comments)
 
 reviews_router.post(
     "/{review_id}/votes",
     response_model=controller.ReviewVoteResponse,
     status_code=status.HTTP_201_CREATED,
-)(controller.cast_vote)
+)(handlers.cast_vote)
 reviews_router.get("/{review_id}/votes/summary", response_model=controller.VoteSummaryResponse)(
-    controller.vote_summary
+    handlers.vote_summary
 )
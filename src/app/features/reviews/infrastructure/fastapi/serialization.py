@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from pydantic.main import IncEx
+
+# Las rutas de un router con ``DTOSerializationRoute`` devuelven los DTO serializados
+# directamente con el encoder compilado de pydantic-core: sin ``asdict`` ni modelos de
+# respuesta intermedios y sin la segunda validación de FastAPI. El ``response_model``
+# de la ruta se mantiene solo para OpenAPI; el JSON resultante es el mismo byte a byte.
+
+
+class SerializationMode(Enum):
+    MODELS = "models"
+    FAST = "fast"
+
+
+class DTOSerializationRoute(APIRoute):
+    """Clase de ruta que activa ``SerializationMode.FAST`` en los handlers del router."""
+
+
+def route_class_for(fast: bool) -> type[APIRoute]:
+    return DTOSerializationRoute if fast else APIRoute
+
+
+async def get_serialization_mode(request: Request) -> SerializationMode:
+    if isinstance(request.scope.get("route"), DTOSerializationRoute):
+        return SerializationMode.FAST
+    return SerializationMode.MODELS
+
+
+SerializationDep = Annotated[SerializationMode, Depends(get_serialization_mode)]
+
+
+# Construir el esquema es caro; cada forma de respuesta se compila una sola vez. Dos hilos
+# pueden compilar la misma a la vez; el segundo simplemente reemplaza al primero.
+_adapters: dict[type[object], TypeAdapter[object]] = {}
+
+
+def _adapter(value_type: type[object]) -> TypeAdapter[object]:
+    adapter = _adapters.get(value_type)
+    if adapter is None:
+        adapter = _adapters[value_type] = TypeAdapter(value_type)
+    return adapter
+
+
+def encode_dto(value: object, value_type: type[object], *, exclude: IncEx | None = None) -> bytes:
+    return _adapter(value_type).dump_json(value, exclude=exclude)
+
+
+def dto_response(
+    value: object,
+    value_type: type[object],
+    response: Response | None = None,
+    *,
+    exclude: IncEx | None = None,
+) -> Response:
+    """Respuesta JSON a partir del DTO, con las cabeceras ya puestas en ``response``.
+
+    FastAPI solo copia las cabeceras del ``Response`` inyectado cuando el handler no
+    devuelve uno propio, así que se copian aquí (p. ej. el ETag).
+    """
+    encoded = Response(
+        encode_dto(value, value_type, exclude=exclude), media_type="application/json"
+    )
+    if response is not None:
+        encoded.headers.raw.extend(response.headers.raw)
+    return encoded
@@ -0,0 +1,62 @@
+from sqlalchemy import Integer, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.tables import (
+    record_review_stats_table,
+    review_vote_counts_table,
+    review_votes_table,
+    reviews_table,
+)
+
+
+def reconcile_vote_counts(session: Session) -> int:
+    """Recalcula ``review_vote_counts`` desde ``review_votes`` y retorna las reseñas tocadas.
+
+    Bloquea escrituras sobre ``review_votes`` mientras dura el recálculo para que ningún
+    incremento concurrente quede pisado por el conteo.
+    """
+    counts = (
+        select(
+            reviews_table.c.id,
+            func.count(review_votes_table.c.id)
+            .filter(review_votes_table.c.useful.is_(True))
+            .cast(Integer),
+            func.count(review_votes_table.c.id)
+            .filter(review_votes_table.c.useful.is_(False))
+            .cast(Integer),
+        )
+        .select_from(
+            reviews_table.outerjoin(
+                review_votes_table, review_votes_table.c.review_id == reviews_table.c.id
+            )
+        )
+        .group_by(reviews_table.c.id)
+    )
+    statement = pg_insert(review_vote_counts_table).from_select(
+        ["review_id", "useful_votes", "not_useful_votes"], counts
+    )
+    upsert = statement.on_conflict_do_update(
+        index_elements=[review_vote_counts_table.c.review_id],
+        set_={
+            "useful_votes": statement.excluded.useful_votes,
+            "not_useful_votes": statement.excluded.not_useful_votes,
+        },
+    ).returning(review_vote_counts_table.c.review_id)
+
+    with session.begin():
+        session.execute(text("LOCK TABLE review_votes IN SHARE MODE"))
+        return len(session.execute(upsert).scalars().all())
+
+
+def rebuild_record_stats(session: Session) -> int:
+    """Recalcula ``record_review_stats`` desde ``reviews`` y retorna las viviendas con reseñas.
+
+    Corrige la deriva que dejan los borrados en cascada (p. ej. de usuarios), que no pasan
+    por el repositorio. Bloquea escrituras sobre ``reviews`` mientras dura el recálculo.
+    """
+    with session.begin():
+        session.execute(text("LOCK TABLE reviews IN SHARE MODE"))
+        session.execute(delete(record_review_stats_table))
+        return len(session.execute(statements.insert_record_stats()).scalars().all())
@@ -1,9 +1,26 @@
-from sqlalchemy.engine import RowMapping
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import Any
+from uuid import UUID
 
-from app.features.reviews.domain.entities.review import Review
+from sqlalchemy.engine import Row, RowMapping
+
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import RATINGS, Review
 from app.features.reviews.domain.entities.review_comment import ReviewComment
 from app.features.reviews.domain.entities.review_image import ReviewImage
 from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.exceptions import ReviewNotFoundError
+from app.features.reviews.domain.expansion import ExpandedReview
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.search import ReviewMatch
+
+
+def children_of(review_id: UUID, rows: Sequence[RowMapping]) -> list[RowMapping]:
+    """Filas de una consulta ``statements._scoped_to_review``: sin filas, la reseña no existe."""
+    if not rows:
+        raise ReviewNotFoundError(f"Review {review_id} was not found")
+    return [row for row in rows if row["id"] is not None]
 
 
 def map_review(row: RowMapping) -> Review:
@@ -18,6 +35,24 @@ def map_review(row: RowMapping) -> Review:
     )
 
 
+def map_review_match(row: RowMapping) -> ReviewMatch:
+    return ReviewMatch(review=map_review(row), rank=row["rank"])
+
+
+def map_record_stats(record_id: UUID, row: RowMapping | None) -> RecordReviewStats:
+    """Sin fila la vivienda aún no tiene reseñas y todos los agregados son cero."""
+    if row is None:
+        return RecordReviewStats(record_id=record_id)
+    return RecordReviewStats(
+        record_id=record_id,
+        review_count=row["review_count"],
+        rating_histogram={rating: row[f"rating_{rating}"] for rating in RATINGS},
+        rating_total=row["rating_total"],
+        rent_total=row["rent_total"],
+        rent_count=row["rent_count"],
+    )
+
+
 def map_image(row: RowMapping) -> ReviewImage:
     return ReviewImage(
         id=row["id"],
@@ -45,3 +80,47 @@ def map_vote(row: RowMapping) -> ReviewVote:
         useful=row["useful"],
         created_at=row["created_at"],
     )
+
+
+def map_version(row: Row[Any] | None) -> str | None:
+    return None if row is None else ":".join(str(value) for value in row)
+
+
+def map_import_rejections(rows: Sequence[Row[Any]]) -> dict[UUID, ImportRejection]:
+    return {row.id: ImportRejection(row.reason) for row in rows}
+
+
+def _group_by_review[T: (ReviewImage, ReviewComment)](items: Iterable[T]) -> dict[UUID, list[T]]:
+    grouped: defaultdict[UUID, list[T]] = defaultdict(list)
+    for item in items:
+        grouped[item.review_id].append(item)
+    return grouped
+
+
+def map_expanded_reviews(
+    reviews: Sequence[Review],
+    *,
+    images: Sequence[RowMapping] | None = None,
+    comments: Sequence[RowMapping] | None = None,
+    votes: Sequence[RowMapping] | None = None,
+) -> list[ExpandedReview]:
+    """Reparte las filas de las consultas de hijos por lote entre sus reseñas.
+
+    Un argumento en ``None`` es un recurso que no se pidió y queda en ``None`` en el resultado.
+    """
+    images_by_review = None if images is None else _group_by_review(map(map_image, images))
+    comments_by_review = None if comments is None else _group_by_review(map(map_comment, comments))
+    votes_by_review = (
+        None
+        if votes is None
+        else {row["review_id"]: (row["useful_votes"], row["not_useful_votes"]) for row in votes}
+    )
+    return [
+        ExpandedReview(
+            review=review,
+            images=None if images_by_review is None else images_by_review.get(review.id, []),
+            comments=None if comments_by_review is None else comments_by_review.get(review.id, []),
+            votes=None if votes_by_review is None else votes_by_review.get(review.id, (0, 0)),
+        )
+        for review in reviews
+    ]
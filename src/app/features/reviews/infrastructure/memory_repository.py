@@ -0,0 +1,577 @@
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import AsyncGenerator, Generator, Iterable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from decimal import Decimal
+from itertools import count, islice
+from uuid import UUID
+
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.exceptions import (
+    ReviewAlreadyExistsError,
+    ReviewNotFoundError,
+)
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.repositories import AsyncReviewRepository, ReviewRepository
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.features.reviews.infrastructure.statements import STREAM_BATCH_SIZE
+
+# Claves de orden ``(created_at, id)`` / ``(uploaded_at, id)``: los índices se guardan en orden
+# ascendente con ``insort`` y los listados los recorren al revés, igual que los índices
+# btree ``(..., created_at, id)`` de Postgres.
+type _Key = tuple[datetime, UUID]
+
+_WORD = re.compile(r"\w+")
+_CENTS = Decimal("0.01")
+
+
+def _not_found(review_id: UUID) -> ReviewNotFoundError:
+    return ReviewNotFoundError(f"Review {review_id} was not found")
+
+
+def _rent(amount: Decimal | None) -> Decimal | None:
+    # Como la columna NUMERIC(10, 2): el valor guardado siempre lleva dos decimales.
+    return None if amount is None else amount.quantize(_CENTS)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Las fechas se guardan sin zona horaria, en UTC, como la columna TIMESTAMP. Postgres
+    # compara un filtro o cursor con offset convirtiéndolo; aquí se hace lo mismo en lugar
+    # de fallar con TypeError al comparar fechas con y sin zona.
+    return value if value.tzinfo is None else value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _terms(text: str) -> list[str]:
+    # Sin diccionario de Postgres: minúsculas y sin tildes, sin stemming ni stopwords.
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    return _WORD.findall("".join(char for char in folded if not unicodedata.combining(char)))
+
+
+@dataclass(slots=True)
+class _SearchClause:
+    required: list[str] = field(default_factory=list)
+    excluded: list[str] = field(default_factory=list)
+
+
+def _parse_search(query: str) -> list[_SearchClause]:
+    """Subconjunto de ``websearch_to_tsquery``: términos con AND, ``-término`` y ``or``.
+
+    Las frases entre comillas se tratan como sus palabras con AND.
+    """
+    clauses = [_SearchClause()]
+    for raw in query.replace('"', " ").split():
+        if raw.casefold() == "or":
+            clauses.append(_SearchClause())
+            continue
+        negated = raw.startswith("-")
+        target = clauses[-1].excluded if negated else clauses[-1].required
+        target.extend(_terms(raw.removeprefix("-")))
+    return [clause for clause in clauses if clause.required]
+
+
+def _page[T](
+    items: Sequence[T], keys: Sequence[_Key], *, limit: int, offset: int, after: PageCursor | None
+) -> list[T]:
+    """Página descendente sobre ``items`` ordenados de forma ascendente por ``keys``."""
+    end = (
+        len(items) - offset
+        if after is None
+        else bisect_left(keys, (_naive_utc(after.created_at), after.id))
+    )
+    end = max(end, 0)
+    return list(reversed(items[max(end - limit, 0) : end]))
+
+
+class InMemoryReviewRepository(ReviewRepository):
+    """Adaptador en memoria de ``ReviewRepository``, seguro entre hilos.
+
+    Mantiene los mismos índices que usa Postgres: reseñas por vivienda en orden
+    ``(created_at, id)``, unicidad por ``(user_id, record_id)``, hijos y votos por reseña y un
+    índice invertido de términos para la búsqueda. Cada método corre completo bajo un único
+    lock, así que se comporta como una transacción. Las entidades retornadas se comparten con
+    el almacén (como las de la caché) y no deben modificarse. No hay tablas ``users`` ni
+    ``records``: cualquier id de usuario o vivienda existe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._reviews: dict[UUID, Review] = {}
+        self._by_user_record: dict[tuple[UUID, UUID], UUID] = {}
+        self._by_record: defaultdict[UUID, list[_Key]] = defaultdict(list)
+        self._by_created: list[_Key] = []
+        self._terms: defaultdict[str, set[UUID]] = defaultdict(set)
+        self._term_counts: dict[UUID, Counter[str]] = {}
+        self._images: defaultdict[UUID, list[ReviewImage]] = defaultdict(list)
+        self._comments: defaultdict[UUID, list[ReviewComment]] = defaultdict(list)
+        self._comment_keys: defaultdict[UUID, list[_Key]] = defaultdict(list)
+        self._votes: defaultdict[UUID, dict[UUID, ReviewVote]] = defaultdict(dict)
+        self._vote_counts: dict[UUID, tuple[int, int]] = {}
+        self._record_stats: dict[UUID, RecordReviewStats] = {}
+        # Cada escritura toma un valor nuevo del reloj; get_version lo expone como marca.
+        self._clock = count(1)
+        self._revisions: dict[tuple[VersionedResource, UUID], int] = {}
+
+    def create_review(self, review: Review) -> Review:
+        with self._lock:
+            return self._insert_review(review)
+
+    def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        with self._lock:
+            created = self._insert_review(review)
+            return created, [self._insert_image(image) for image in images]
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        # Como en merge_import_staging, dentro del lote gana la primera de cada
+        # (user_id, record_id) y contra lo ya guardado decide la unicidad.
+        rejected: dict[UUID, ImportRejection] = {}
+        with self._lock:
+            for review in reviews:
+                if (review.user_id, review.record_id) in self._by_user_record:
+                    rejected[review.id] = ImportRejection.DUPLICATE
+                else:
+                    self._insert_review(review)
+        return rejected
+
+    def get_review(self, review_id: UUID) -> Review | None:
+        with self._lock:
+            return self._reviews.get(review_id)
+
+    def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        with self._lock:
+            return {
+                review_id: self._reviews[review_id]
+                for review_id in review_ids
+                if review_id in self._reviews
+            }
+
+    def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        with self._lock:
+            keys = self._by_record.get(record_id, [])
+            page = _page(keys, keys, limit=limit, offset=offset, after=after)
+            return [self._reviews[review_id] for _, review_id in page]
+
+    def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        """Relevancia: apariciones de los términos pedidos sobre el largo de la reseña."""
+        clauses = _parse_search(query)
+        with self._lock:
+            matched: set[UUID] = set()
+            for clause in clauses:
+                ids = set.intersection(*(self._terms.get(term, set()) for term in clause.required))
+                for term in clause.excluded:
+                    ids -= self._terms.get(term, set())
+                matched |= ids
+            if record_id is not None:
+                matched = {
+                    review_id
+                    for review_id in matched
+                    if self._reviews[review_id].record_id == record_id
+                }
+            scored = [(self._rank(review_id, clauses), review_id) for review_id in matched]
+            if after is not None:
+                scored = [position for position in scored if position < (after.rank, after.id)]
+            scored.sort(reverse=True)
+            return [
+                ReviewMatch(review=self._reviews[review_id], rank=rank)
+                for rank, review_id in scored[:limit]
+            ]
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReview]]:
+        # Se toma una foto de las reseñas al empezar, como el cursor de una transacción.
+        with self._lock:
+            snapshot = [self._reviews[review_id] for review_id in self._filtered_ids(filters)]
+        batches = iter(snapshot)
+        while batch := list(islice(batches, STREAM_BATCH_SIZE)):
+            yield self.expand_reviews(batch, expand)
+
+    def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        with self._lock:
+            previous = self._reviews.get(review_id)
+            if previous is None:
+                raise _not_found(review_id)
+            if rent_amount is None and review_text is None and rating is None:
+                return previous
+
+            updated = replace(
+                previous,
+                rent_amount=previous.rent_amount if rent_amount is None else _rent(rent_amount),
+                review_text=previous.review_text if review_text is None else review_text,
+                rating=previous.rating if rating is None else rating,
+            )
+            self._reviews[review_id] = updated
+            if review_text is not None:
+                self._unindex_terms(review_id)
+                self._index_terms(updated)
+            if rating is not None or rent_amount is not None:
+                self._apply_record_stats(updated.record_id, added=[updated], removed=[previous])
+            self._touch(VersionedResource.REVIEW, review_id)
+            self._touch(VersionedResource.RECORD_REVIEWS, updated.record_id)
+            return updated
+
+    def delete_review(self, review_id: UUID) -> Review:
+        with self._lock:
+            deleted = self._reviews.pop(review_id, None)
+            if deleted is None:
+                raise _not_found(review_id)
+
+            key = (deleted.created_at, deleted.id)
+            del self._by_user_record[(deleted.user_id, deleted.record_id)]
+            self._remove_key(self._by_record[deleted.record_id], key)
+            self._remove_key(self._by_created, key)
+            self._unindex_terms(review_id)
+            # ON DELETE CASCADE de imágenes, comentarios y votos.
+            for children in (self._images, self._comments, self._comment_keys, self._votes):
+                children.pop(review_id, None)
+            self._vote_counts.pop(review_id, None)
+            for resource in VersionedResource:
+                self._revisions.pop((resource, review_id), None)
+            self._apply_record_stats(deleted.record_id, removed=[deleted])
+            self._touch(VersionedResource.RECORD_REVIEWS, deleted.record_id)
+            return deleted
+
+    def add_image(self, image: ReviewImage) -> ReviewImage:
+        with self._lock:
+            self._require_review(image.review_id)
+            return self._insert_image(image)
+
+    def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        with self._lock:
+            self._require_review(review_id)
+            return list(reversed(self._images.get(review_id, [])))
+
+    def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        with self._lock:
+            self._require_review(comment.review_id)
+            stored = replace(comment)
+            key = (stored.created_at, stored.id)
+            position = bisect_left(self._comment_keys[stored.review_id], key)
+            self._comment_keys[stored.review_id].insert(position, key)
+            self._comments[stored.review_id].insert(position, stored)
+            self._touch(VersionedResource.REVIEW_COMMENTS, stored.review_id)
+            return stored
+
+    def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        with self._lock:
+            self._require_review(review_id)
+            return _page(
+                self._comments.get(review_id, []),
+                self._comment_keys.get(review_id, []),
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
+
+    def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        with self._lock:
+            self._require_review(vote.review_id)
+            return self._upsert_vote(vote)[0]
+
+    def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        with self._lock:
+            # Como el INSERT ... JOIN reviews: los votos de reseñas inexistentes se omiten.
+            existing = [vote for vote in votes if vote.review_id in self._reviews]
+            changed = sum(self._upsert_vote(vote)[1] for vote in existing)
+            return VoteBatchResult(changed=changed, skipped=len(votes) - len(existing))
+
+    def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        with self._lock:
+            self._require_review(review_id)
+            return self._vote_counts.get(review_id, (0, 0))
+
+    def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        with self._lock:
+            stats = self._record_stats.get(record_id)
+            if stats is None:
+                return RecordReviewStats(record_id=record_id)
+            return replace(stats, rating_histogram=dict(stats.rating_histogram))
+
+    def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        with self._lock:
+            return [
+                ExpandedReview(
+                    review=review,
+                    images=(
+                        list(reversed(self._images.get(review.id, [])))
+                        if ReviewExpansion.IMAGES in expand
+                        else None
+                    ),
+                    comments=(
+                        list(reversed(self._comments.get(review.id, [])))[:comments_limit]
+                        if ReviewExpansion.COMMENTS in expand
+                        else None
+                    ),
+                    votes=(
+                        self._vote_counts.get(review.id, (0, 0))
+                        if ReviewExpansion.VOTES in expand
+                        else None
+                    ),
+                )
+                for review in reviews
+            ]
+
+    def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        with self._lock:
+            # Todas las marcas salvo la del listado por vivienda son de una reseña concreta.
+            if (
+                resource is not VersionedResource.RECORD_REVIEWS
+                and resource_id not in self._reviews
+            ):
+                return None
+            return str(self._revisions.get((resource, resource_id), 0))
+
+    def _insert_review(self, review: Review) -> Review:
+        unique = (review.user_id, review.record_id)
+        if unique in self._by_user_record:
+            raise ReviewAlreadyExistsError("User already submitted a review for this record")
+
+        stored = replace(review, rent_amount=_rent(review.rent_amount))
+        key = (stored.created_at, stored.id)
+        self._reviews[stored.id] = stored
+        self._by_user_record[unique] = stored.id
+        insort(self._by_record[stored.record_id], key)
+        insort(self._by_created, key)
+        self._index_terms(stored)
+        self._apply_record_stats(stored.record_id, added=[stored])
+        self._touch(VersionedResource.REVIEW, stored.id)
+        self._touch(VersionedResource.RECORD_REVIEWS, stored.record_id)
+        return stored
+
+    def _insert_image(self, image: ReviewImage) -> ReviewImage:
+        stored = replace(image)
+        insort(self._images[stored.review_id], stored, key=lambda item: (item.uploaded_at, item.id))
+        self._touch(VersionedResource.REVIEW_IMAGES, stored.review_id)
+        return stored
+
+    def _upsert_vote(self, vote: ReviewVote) -> tuple[ReviewVote, bool]:
+        """Retorna el voto guardado y si cambió algo, con la semántica de ``ON CONFLICT``."""
+        votes = self._votes[vote.review_id]
+        existing = votes.get(vote.user_id)
+        if existing is not None and existing.useful == vote.useful:
+            return existing, False
+
+        useful, not_useful = self._vote_counts.get(vote.review_id, (0, 0))
+        if existing is None:
+            stored = replace(vote)
+        else:
+            # Un cambio de sentido conserva id y fecha del voto original.
+            stored = replace(existing, useful=vote.useful)
+            useful, not_useful = (
+                (useful, not_useful - 1) if vote.useful else (useful - 1, not_useful)
+            )
+        votes[vote.user_id] = stored
+        self._vote_counts[vote.review_id] = (
+            (useful + 1, not_useful) if vote.useful else (useful, not_useful + 1)
+        )
+        self._touch(VersionedResource.REVIEW_VOTES, vote.review_id)
+        return stored, True
+
+    def _filtered_ids(self, filters: ReviewFilter) -> list[UUID]:
+        keys = (
+            self._by_record.get(filters.record_id, [])
+            if filters.record_id is not None
+            else self._by_created
+        )
+        start = (
+            0
+            if filters.created_from is None
+            else bisect_left(keys, _naive_utc(filters.created_from), key=lambda key: key[0])
+        )
+        end = (
+            len(keys)
+            if filters.created_to is None
+            else bisect_left(keys, _naive_utc(filters.created_to), key=lambda key: key[0])
+        )
+        return [
+            review_id
+            for _, review_id in keys[start:end]
+            if filters.user_id is None or self._reviews[review_id].user_id == filters.user_id
+        ]
+
+    def _rank(self, review_id: UUID, clauses: Iterable[_SearchClause]) -> float:
+        counts = self._term_counts[review_id]
+        hits = sum(counts[term] for clause in clauses for term in clause.required)
+        return hits / max(counts.total(), 1)
+
+    def _index_terms(self, review: Review) -> None:
+        counts = Counter(_terms(review.review_text))
+        self._term_counts[review.id] = counts
+        for term in counts:
+            self._terms[term].add(review.id)
+
+    def _unindex_terms(self, review_id: UUID) -> None:
+        for term in self._term_counts.pop(review_id, Counter()):
+            postings = self._terms[term]
+            postings.discard(review_id)
+            if not postings:
+                del self._terms[term]
+
+    def _apply_record_stats(
+        self,
+        record_id: UUID,
+        *,
+        added: Sequence[Review] = (),
+        removed: Sequence[Review] = (),
+    ) -> None:
+        stats = self._record_stats.setdefault(record_id, RecordReviewStats(record_id=record_id))
+        for sign, reviews in ((1, added), (-1, removed)):
+            for review in reviews:
+                stats.review_count += sign
+                stats.rating_histogram[review.rating] += sign
+                stats.rating_total += sign * review.rating
+                if review.rent_amount is not None:
+                    stats.rent_total += sign * review.rent_amount
+                    stats.rent_count += sign
+
+    def _require_review(self, review_id: UUID) -> None:
+        if review_id not in self._reviews:
+            raise _not_found(review_id)
+
+    def _touch(self, resource: VersionedResource, resource_id: UUID) -> None:
+        self._revisions[(resource, resource_id)] = next(self._clock)
+
+    @staticmethod
+    def _remove_key(keys: list[_Key], key: _Key) -> None:
+        del keys[bisect_left(keys, key)]
+
+
+class AsyncInMemoryReviewRepository(AsyncReviewRepository):
+    """Fachada asíncrona de ``InMemoryReviewRepository``; ningún método bloquea en E/S.
+
+    Comparte el almacén con la versión síncrona que recibe.
+    """
+
+    def __init__(self, repository: InMemoryReviewRepository) -> None:
+        self._repository = repository
+
+    async def create_review(self, review: Review) -> Review:
+        return self._repository.create_review(review)
+
+    async def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        return self._repository.create_review_with_images(review, images)
+
+    async def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        return self._repository.import_reviews(reviews)
+
+    async def get_review(self, review_id: UUID) -> Review | None:
+        return self._repository.get_review(review_id)
+
+    async def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        return self._repository.get_reviews(review_ids)
+
+    async def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        return self._repository.list_reviews_for_record(
+            record_id, limit=limit, offset=offset, after=after
+        )
+
+    async def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        return self._repository.search_reviews(query, record_id=record_id, limit=limit, after=after)
+
+    async def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReview]]:
+        for batch in self._repository.stream_reviews(filters, expand=expand):
+            yield batch
+
+    async def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        return self._repository.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+
+    async def delete_review(self, review_id: UUID) -> Review:
+        return self._repository.delete_review(review_id)
+
+    async def add_image(self, image: ReviewImage) -> ReviewImage:
+        return self._repository.add_image(image)
+
+    async def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        return self._repository.list_images(review_id)
+
+    async def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        return self._repository.add_comment(comment)
+
+    async def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        return self._repository.list_comments(review_id, limit=limit, offset=offset, after=after)
+
+    async def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        return self._repository.upsert_vote(vote)
+
+    async def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        return self._repository.upsert_votes(votes)
+
+    async def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        return self._repository.get_votes_summary(review_id)
+
+    async def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        return self._repository.get_record_stats(record_id)
+
+    async def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        return self._repository.expand_reviews(reviews, expand, comments_limit=comments_limit)
+
+    async def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return self._repository.get_version(resource, resource_id)
@@ -1,17 +1,13 @@
-from collections.abc import Callable, Sequence
-from typing import TypeVar
+from collections.abc import Callable, Generator, Sequence
+from contextlib import closing
+from decimal import Decimal
+from typing import Any, TypeVar, cast
 from uuid import UUID
 
-from sqlalchemy import (
-    delete,
-    func,
-    insert,
-    select,
-    update,
-)
-from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session
+import psycopg
+from sqlalchemy import Connection
 
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
 from app.features.reviews.domain.entities.review import Review
 from app.features.reviews.domain.entities.review_comment import ReviewComment
 from app.features.reviews.domain.entities.review_image import ReviewImage
@@ -20,75 +16,105 @@ from app.features.reviews.domain.exceptions import (
     ReviewAlreadyExistsError,
     ReviewNotFoundError,
 )
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
 from app.features.reviews.domain.repositories import ReviewRepository
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.errors import review_must_exist
 from app.features.reviews.infrastructure.mappers import (
+    children_of,
     map_comment,
+    map_expanded_reviews,
     map_image,
+    map_import_rejections,
+    map_record_stats,
     map_review,
+    map_review_match,
+    map_version,
     map_vote,
 )
-from app.features.reviews.infrastructure.tables import (
-    review_comments_table,
-    review_images_table,
-    review_votes_table,
-    reviews_table,
-)
+from app.shared.infrastructure.database import DbHandle
 
 T = TypeVar("T")
 
 
+def _connection(session: DbHandle) -> Connection:
+    return session if isinstance(session, Connection) else session.connection()
+
+
 class PostgresReviewRepository(ReviewRepository):
-    """Repositorio concreto para Postgres usando SQLAlchemy Core."""
+    """Repositorio concreto para Postgres usando SQLAlchemy Core.
 
-    def __init__(self, session: Session) -> None:
+    ``session`` puede ser una ``Session`` o una ``Connection`` del engine: solo se usan
+    ``execute``, ``commit`` y ``rollback``.
+    """
+
+    def __init__(self, session: DbHandle) -> None:
         self._session = session
 
     def create_review(self, review: Review) -> Review:
-        def _operation(session: Session) -> Review:
-            self._ensure_user_can_review(session, review.user_id, review.record_id)
-
-            row = (
-                session.execute(
-                    insert(reviews_table)
-                    .values(
-                        {
-                            "id": review.id,
-                            "record_id": review.record_id,
-                            "user_id": review.user_id,
-                            "rent_amount": review.rent_amount,
-                            "review_text": review.review_text,
-                            "rating": review.rating,
-                            "created_at": review.created_at,
-                        }
-                    )
-                    .returning(reviews_table)
-                )
-                .mappings()
-                .one()
-            )
+        def _operation(session: DbHandle) -> Review:
+            return self._insert_review(session, review)
+
+        return self._run_in_transaction(_operation)
+
+    def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        def _operation(session: DbHandle) -> tuple[Review, list[ReviewImage]]:
+            created = self._insert_review(session, review)
+            if not images:
+                return created, []
+
+            rows = session.execute(statements.insert_images(images)).mappings().all()
+            return created, [map_image(row) for row in statements.in_input_order(images, rows)]
+
+        return self._run_in_transaction(_operation)
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        if not reviews:
+            return {}
 
-            return map_review(row)
+        def _operation(session: DbHandle) -> dict[UUID, ImportRejection]:
+            session.execute(statements.create_import_staging())
+            # COPY no pasa por SQLAlchemy: se usa la conexión psycopg de la misma transacción.
+            driver = cast(
+                psycopg.Connection[Any], _connection(session).connection.driver_connection
+            )
+            with (
+                driver.cursor() as cursor,
+                cursor.copy(statements.copy_into_import_staging()) as copy,
+            ):
+                for ordinal, review in enumerate(reviews):
+                    copy.write_row(statements.import_staging_row(ordinal, review))
+            rows = session.execute(statements.merge_import_staging()).all()
+            return map_import_rejections(rows)
 
         return self._run_in_transaction(_operation)
 
     def get_review(self, review_id: UUID) -> Review | None:
-        row = (
-            self._session.execute(select(reviews_table).where(reviews_table.c.id == review_id))
-            .mappings()
-            .first()
-        )
+        row = self._session.execute(*statements.select_review(review_id)).mappings().first()
         return map_review(row) if row else None
 
+    def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        if not review_ids:
+            return {}
+        rows = self._session.execute(*statements.select_reviews_by_id(review_ids)).mappings()
+        return {row["id"]: map_review(row) for row in rows}
+
     def list_reviews_for_record(
-        self, record_id: UUID, *, limit: int, offset: int
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
     ) -> Sequence[Review]:
         rows = (
             self._session.execute(
-                select(reviews_table)
-                .where(reviews_table.c.record_id == record_id)
-                .order_by(reviews_table.c.created_at.desc())
-                .offset(offset)
-                .limit(limit)
+                *statements.select_reviews_for_record(
+                    record_id, limit=limit, offset=offset, after=after
+                )
             )
             .mappings()
             .all()
@@ -96,168 +122,212 @@ class PostgresReviewRepository(ReviewRepository):
 
         return [map_review(row) for row in rows]
 
-    def update_review(self, review: Review) -> Review:
-        def _operation(session: Session) -> Review:
-            row = (
-                session.execute(
-                    update(reviews_table)
-                    .where(reviews_table.c.id == review.id)
-                    .values(
-                        {
-                            "rent_amount": review.rent_amount,
-                            "review_text": review.review_text,
-                            "rating": review.rating,
-                        }
-                    )
-                    .returning(reviews_table)
-                )
-                .mappings()
-                .first()
-            )
+    def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        statement = statements.search_reviews(query, record_id=record_id, limit=limit, after=after)
+        result = self._session.execute(*statement)
+        return [map_review_match(row) for row in result.mappings().all()]
+
+    def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        result = self._session.execute(*statements.select_record_stats(record_id))
+        return map_record_stats(record_id, result.mappings().first())
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReview]]:
+        result = self._session.execute(
+            statements.select_reviews(filters),
+            execution_options={"yield_per": statements.STREAM_BATCH_SIZE},
+        )
+        try:
+            with closing(result):
+                for partition in result.mappings().partitions():
+                    yield self.expand_reviews([map_review(row) for row in partition], expand)
+        finally:
+            # El stream se consume después de que el handler cierra la sesión; terminar aquí
+            # la transacción, que solo leyó, devuelve la conexión al pool al agotarlo.
+            self._session.rollback()
+
+    def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        # Una consulta por recurso para todo el lote; en stream_reviews corre en la misma
+        # conexión del cursor abierto.
+        if not reviews or not expand:
+            return map_expanded_reviews(reviews)
+
+        review_ids = [review.id for review in reviews]
+        images = comments = votes = None
+        if ReviewExpansion.IMAGES in expand:
+            statement = statements.select_images_for_reviews(review_ids)
+            images = self._session.execute(*statement).mappings().all()
+        if ReviewExpansion.COMMENTS in expand:
+            statement = statements.select_comments_for_reviews(review_ids, limit=comments_limit)
+            comments = self._session.execute(*statement).mappings().all()
+        if ReviewExpansion.VOTES in expand:
+            statement = statements.select_vote_counts_for_reviews(review_ids)
+            votes = self._session.execute(*statement).mappings().all()
+        return map_expanded_reviews(reviews, images=images, comments=comments, votes=votes)
+
+    def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        statement = statements.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+
+        def _operation(session: DbHandle) -> Review:
+            # Solo rating y rent_amount mueven los agregados; el bloqueo evita leer valores
+            # previos que otra transacción esté cambiando.
+            previous = None
+            if rating is not None or rent_amount is not None:
+                locked = session.execute(*statements.select_review_for_update(review_id))
+                previous = locked.mappings().first()
+            row = session.execute(*statement).mappings().first()
 
             if row is None:
-                raise ReviewNotFoundError(f"Review {review.id} was not found")
+                raise ReviewNotFoundError(f"Review {review_id} was not found")
 
-            return map_review(row)
+            updated = map_review(row)
+            if previous is not None:
+                self._apply_record_stats(
+                    session, updated.record_id, added=[updated], removed=[map_review(previous)]
+                )
+            return updated
 
         return self._run_in_transaction(_operation)
 
-    def delete_review(self, review_id: UUID) -> None:
-        def _operation(session: Session) -> None:
-            result = session.execute(
-                delete(reviews_table)
-                .where(reviews_table.c.id == review_id)
-                .returning(reviews_table.c.id)
-            )
-
-            deleted_id = result.scalar_one_or_none()
+    def delete_review(self, review_id: UUID) -> Review:
+        def _operation(session: DbHandle) -> Review:
+            row = session.execute(*statements.delete_review(review_id)).mappings().first()
 
-            if deleted_id is None:
+            if row is None:
                 raise ReviewNotFoundError(f"Review {review_id} was not found")
 
-        self._run_in_transaction(_operation)
+            deleted = map_review(row)
+            self._apply_record_stats(session, deleted.record_id, removed=[deleted])
+            return deleted
+
+        return self._run_in_transaction(_operation)
 
     def add_image(self, image: ReviewImage) -> ReviewImage:
-        def _operation(session: Session) -> ReviewImage:
-            row = (
-                session.execute(
-                    insert(review_images_table)
-                    .values(
-                        {
-                            "id": image.id,
-                            "review_id": image.review_id,
-                            "image_url": image.image_url,
-                            "uploaded_at": image.uploaded_at,
-                        }
-                    )
-                    .returning(review_images_table)
-                )
-                .mappings()
-                .one()
-            )
+        def _operation(session: DbHandle) -> ReviewImage:
+            with review_must_exist(image.review_id):
+                row = session.execute(*statements.insert_image(image)).mappings().one()
             return map_image(row)
 
         return self._run_in_transaction(_operation)
 
     def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
-        rows = (
-            self._session.execute(
-                select(review_images_table)
-                .where(review_images_table.c.review_id == review_id)
-                .order_by(review_images_table.c.uploaded_at.desc())
-            )
-            .mappings()
-            .all()
-        )
-        return [map_image(row) for row in rows]
+        rows = self._session.execute(*statements.select_images(review_id)).mappings().all()
+        return [map_image(row) for row in children_of(review_id, rows)]
 
     def add_comment(self, comment: ReviewComment) -> ReviewComment:
-        def _operation(session: Session) -> ReviewComment:
-            row = (
-                session.execute(
-                    insert(review_comments_table)
-                    .values(
-                        {
-                            "id": comment.id,
-                            "review_id": comment.review_id,
-                            "user_id": comment.user_id,
-                            "comment_text": comment.comment_text,
-                            "created_at": comment.created_at,
-                        }
-                    )
-                    .returning(review_comments_table)
-                )
-                .mappings()
-                .one()
-            )
+        def _operation(session: DbHandle) -> ReviewComment:
+            with review_must_exist(comment.review_id):
+                row = session.execute(*statements.insert_comment(comment)).mappings().one()
             return map_comment(row)
 
         return self._run_in_transaction(_operation)
 
-    def list_comments(self, review_id: UUID, *, limit: int, offset: int) -> Sequence[ReviewComment]:
+    def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
         rows = (
             self._session.execute(
-                select(review_comments_table)
-                .where(review_comments_table.c.review_id == review_id)
-                .order_by(review_comments_table.c.created_at.desc())
-                .offset(offset)
-                .limit(limit)
+                *statements.select_comments(review_id, limit=limit, offset=offset, after=after)
             )
             .mappings()
             .all()
         )
-        return [map_comment(row) for row in rows]
+        return [map_comment(row) for row in children_of(review_id, rows)]
 
     def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
-        def _operation(session: Session) -> ReviewVote:
-            row = (
-                session.execute(
-                    pg_insert(review_votes_table)
-                    .values(
-                        {
-                            "id": vote.id,
-                            "review_id": vote.review_id,
-                            "user_id": vote.user_id,
-                            "useful": vote.useful,
-                            "created_at": vote.created_at,
-                        }
-                    )
-                    .on_conflict_do_update(
-                        index_elements=[
-                            review_votes_table.c.review_id,
-                            review_votes_table.c.user_id,
-                        ],
-                        set_={"useful": vote.useful},
-                    )
-                    .returning(review_votes_table)
-                )
-                .mappings()
-                .one()
-            )
+        def _operation(session: DbHandle) -> ReviewVote:
+            with review_must_exist(vote.review_id):
+                row = session.execute(*statements.upsert_vote(vote)).mappings().first()
+
+            if row is None:
+                existing = session.execute(*statements.select_vote(vote.review_id, vote.user_id))
+                return map_vote(existing.mappings().one())
+
+            session.execute(*statements.increment_vote_counts(vote, inserted=row["inserted"]))
             return map_vote(row)
 
         return self._run_in_transaction(_operation)
 
+    def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        if not votes:
+            return VoteBatchResult()
+
+        def _operation(session: DbHandle) -> VoteBatchResult:
+            rows = session.execute(statements.upsert_votes(votes)).all()
+            changed, skipped = statements.split_vote_rows(rows)
+            if changed:
+                deltas = statements.vote_count_deltas(changed)
+                session.execute(statements.increment_vote_counts_many(deltas))
+            return VoteBatchResult(changed=len(changed), skipped=skipped)
+
+        return self._run_in_transaction(_operation)
+
     def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
-        useful, not_useful = self._session.execute(
-            select(
-                func.count().filter(review_votes_table.c.useful.is_(True)),
-                func.count().filter(review_votes_table.c.useful.is_(False)),
-            ).where(review_votes_table.c.review_id == review_id)
-        ).one()
-
-        return int(useful or 0), int(not_useful or 0)
-
-    def _ensure_user_can_review(self, session: Session, user_id: UUID, record_id: UUID) -> None:
-        exists = session.execute(
-            select(reviews_table.c.id).where(
-                (reviews_table.c.user_id == user_id) & (reviews_table.c.record_id == record_id)
-            )
-        ).first()
+        row = self._session.execute(*statements.select_votes_summary(review_id)).first()
+
+        if row is None:
+            raise ReviewNotFoundError(f"Review {review_id} was not found")
+
+        useful, not_useful = row
+        return int(useful), int(not_useful)
+
+    def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        row = self._session.execute(*statements.select_version(resource, resource_id)).first()
+        return map_version(row)
+
+    def _insert_review(self, session: DbHandle, review: Review) -> Review:
+        # ON CONFLICT DO NOTHING no retorna fila cuando ya existe (user_id, record_id).
+        row = session.execute(*statements.insert_review(review)).mappings().first()
 
-        if exists:
+        if row is None:
             raise ReviewAlreadyExistsError("User already submitted a review for this record")
 
-    def _run_in_transaction(self, operation: Callable[[Session], T]) -> T:
-        with self._session.begin():
-            return operation(self._session)
+        created = map_review(row)
+        self._apply_record_stats(session, created.record_id, added=[created])
+        return created
+
+    def _apply_record_stats(
+        self,
+        session: DbHandle,
+        record_id: UUID,
+        *,
+        added: Sequence[Review] = (),
+        removed: Sequence[Review] = (),
+    ) -> None:
+        delta = statements.record_stats_delta(added=added, removed=removed)
+        if any(delta.values()):
+            session.execute(*statements.increment_record_stats(record_id, delta))
+
+    def _run_in_transaction(self, operation: Callable[[DbHandle], T]) -> T:
+        # Una lectura previa en la misma sesión ya abrió la transacción (autobegin),
+        # por eso se confirma explícitamente en lugar de usar ``session.begin()``.
+        try:
+            result = operation(self._session)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return result
@@ -0,0 +1,263 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Connection, Executable, func, select
+from sqlalchemy.sql import ClauseElement
+
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.mappers import map_review
+from app.features.reviews.infrastructure.tables import (
+    review_votes_table,
+    reviews_table,
+)
+
+# Tablas donde un Seq Scan se tolera: una fila por vivienda, pocas páginas incluso en
+# producción, y ahí el planificador prefiere leerla entera antes que usar el índice.
+SEQ_SCAN_EXEMPT_TABLES = frozenset({"record_review_stats"})
+
+
+@dataclass(slots=True, frozen=True)
+class QueryPlan:
+    name: str
+    node_types: tuple[str, ...]
+    execution_ms: float
+    shared_hit_blocks: int
+    shared_read_blocks: int
+    seq_scan_tables: tuple[str, ...] = ()
+
+    @property
+    def has_seq_scan(self) -> bool:
+        """Algún Seq Scan sobre reviews o sus tablas hijas, sin importar su tamaño."""
+        return any(table not in SEQ_SCAN_EXEMPT_TABLES for table in self.seq_scan_tables)
+
+
+@dataclass(slots=True, frozen=True)
+class _Sample:
+    record_id: UUID
+    review: Review
+    cursor: PageCursor
+    voter_id: UUID
+    new_reviewer_id: UUID
+
+
+def _load_sample(connection: Connection) -> _Sample:
+    """Toma de la base sembrada la vivienda con más reseñas y valores reales para los filtros."""
+    record_id = connection.execute(
+        select(reviews_table.c.record_id)
+        .group_by(reviews_table.c.record_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).scalar_one()
+    rows = (
+        connection.execute(
+            *statements.select_reviews_for_record(record_id, limit=20, offset=0, after=None)
+        )
+        .mappings()
+        .all()
+    )
+    review = map_review(rows[0])
+    middle = rows[len(rows) // 2]
+    voter_id = connection.execute(
+        select(review_votes_table.c.user_id)
+        .where(review_votes_table.c.review_id == review.id)
+        .limit(1)
+    ).scalar_one()
+    new_reviewer_id = connection.execute(
+        select(reviews_table.c.user_id)
+        .where(
+            reviews_table.c.user_id.not_in(
+                select(reviews_table.c.user_id).where(reviews_table.c.record_id == record_id)
+            )
+        )
+        .limit(1)
+    ).scalar_one()
+    return _Sample(
+        record_id=record_id,
+        review=review,
+        cursor=PageCursor(created_at=middle["created_at"], id=middle["id"]),
+        voter_id=voter_id,
+        new_reviewer_id=new_reviewer_id,
+    )
+
+
+def _repository_queries(
+    sample: _Sample,
+) -> Iterator[tuple[str, Executable | statements.BoundStatement]]:
+    """Cada sentencia que ejecuta ``PostgresReviewRepository``, con parámetros realistas."""
+    review = sample.review
+    yield (
+        "create_review: insert_review",
+        statements.insert_review(
+            Review(
+                record_id=sample.record_id,
+                user_id=sample.new_reviewer_id,
+                rent_amount=Decimal("900"),
+                review_text="plan check",
+                rating=3,
+            )
+        ),
+    )
+    yield (
+        "create_review: insert_images",
+        statements.insert_images(
+            [
+                ReviewImage(review_id=review.id, image_url=f"https://x/{index}.jpg")
+                for index in range(3)
+            ]
+        ),
+    )
+    yield (
+        "create_review: increment_record_stats",
+        statements.increment_record_stats(
+            sample.record_id, statements.record_stats_delta(added=[review])
+        ),
+    )
+    yield "get_review", statements.select_review(review.id)
+    yield (
+        "get_reviews",
+        statements.select_reviews_by_id([review.id, sample.cursor.id, sample.record_id]),
+    )
+    yield (
+        "list_reviews_for_record: offset",
+        statements.select_reviews_for_record(sample.record_id, limit=21, offset=20, after=None),
+    )
+    yield (
+        "list_reviews_for_record: cursor",
+        statements.select_reviews_for_record(
+            sample.record_id, limit=21, offset=0, after=sample.cursor
+        ),
+    )
+    page_ids = [review.id, sample.cursor.id]
+    yield "expand_reviews: images", statements.select_images_for_reviews(page_ids)
+    yield (
+        "expand_reviews: comments preview",
+        statements.select_comments_for_reviews(page_ids, limit=3),
+    )
+    yield "expand_reviews: votes", statements.select_vote_counts_for_reviews(page_ids)
+    yield "get_record_stats", statements.select_record_stats(sample.record_id)
+    yield "update_review: select_review_for_update", statements.select_review_for_update(review.id)
+    # Término poco frecuente en la base sembrada: con uno presente en todas las reseñas el
+    # Seq Scan sería el plan correcto.
+    yield (
+        "search_reviews",
+        statements.search_reviews("17", record_id=None, limit=21, after=None),
+    )
+    yield (
+        "search_reviews: record",
+        statements.search_reviews("vivienda", record_id=sample.record_id, limit=21, after=None),
+    )
+    yield (
+        "search_reviews: cursor",
+        statements.search_reviews(
+            "17", record_id=None, limit=21, after=SearchCursor(rank=0.05, id=review.id)
+        ),
+    )
+    # La exportación completa lee toda la tabla: solo se revisan las filtradas.
+    created_from = sample.cursor.created_at
+    yield (
+        "stream_reviews: created range",
+        statements.select_reviews(
+            ReviewFilter(created_from=created_from, created_to=created_from + timedelta(hours=1))
+        ),
+    )
+    yield "stream_reviews: user", statements.select_reviews(ReviewFilter(user_id=review.user_id))
+    yield (
+        "stream_reviews: record",
+        statements.select_reviews(ReviewFilter(record_id=sample.record_id)),
+    )
+    yield (
+        "update_review",
+        statements.update_review(review.id, rent_amount=None, review_text="plan", rating=4),
+    )
+    yield (
+        "add_image",
+        statements.insert_image(ReviewImage(review_id=review.id, image_url="https://x/y.jpg")),
+    )
+    yield "list_images", statements.select_images(review.id)
+    yield (
+        "add_comment",
+        statements.insert_comment(
+            ReviewComment(review_id=review.id, user_id=sample.voter_id, comment_text="plan")
+        ),
+    )
+    yield (
+        "list_comments: offset",
+        statements.select_comments(review.id, limit=21, offset=0, after=None),
+    )
+    yield (
+        "list_comments: cursor",
+        statements.select_comments(review.id, limit=21, offset=0, after=sample.cursor),
+    )
+    vote = ReviewVote(review_id=review.id, user_id=sample.voter_id, useful=False)
+    yield "upsert_vote", statements.upsert_vote(vote)
+    yield "upsert_vote: select_vote", statements.select_vote(review.id, sample.voter_id)
+    yield (
+        "upsert_vote: increment_vote_counts",
+        statements.increment_vote_counts(vote, inserted=False),
+    )
+    yield "upsert_votes", statements.upsert_votes([vote])
+    yield (
+        "upsert_votes: increment_vote_counts_many",
+        statements.increment_vote_counts_many({review.id: (1, -1)}),
+    )
+    yield "get_votes_summary", statements.select_votes_summary(review.id)
+    for resource in VersionedResource:
+        resource_id = (
+            sample.record_id if resource is VersionedResource.RECORD_REVIEWS else review.id
+        )
+        yield f"get_version: {resource.value}", statements.select_version(resource, resource_id)
+    yield "delete_review", statements.delete_review(review.id)
+
+
+def _walk(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+def _explain(
+    connection: Connection, name: str, query: Executable | statements.BoundStatement
+) -> QueryPlan:
+    statement, params = query if isinstance(query, statements.BoundStatement) else (query, {})
+    if not isinstance(statement, ClauseElement):
+        raise TypeError(f"{name} is not a compilable statement")
+    # ``column_keys`` arma el VALUES/SET de los INSERT y UPDATE que los toman de los parámetros.
+    compiled = statement.compile(
+        dialect=connection.dialect,
+        column_keys=list(params),
+        compile_kwargs={"render_postcompile": True},
+    )
+    document = connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}", compiled.construct_params(params)
+    ).scalar_one()[0]
+    root = document["Plan"]
+    return QueryPlan(
+        name=name,
+        node_types=tuple(node["Node Type"] for node in _walk(root)),
+        execution_ms=float(document["Execution Time"]),
+        shared_hit_blocks=int(root.get("Shared Hit Blocks", 0)),
+        shared_read_blocks=int(root.get("Shared Read Blocks", 0)),
+        seq_scan_tables=tuple(
+            node["Relation Name"] for node in _walk(root) if node["Node Type"] == "Seq Scan"
+        ),
+    )
+
+
+def explain_repository_queries(connection: Connection) -> list[QueryPlan]:
+    """Ejecuta ``EXPLAIN (ANALYZE, BUFFERS)`` sobre cada consulta y revierte las escrituras."""
+    with connection.begin() as transaction:
+        sample = _load_sample(connection)
+        plans = [_explain(connection, name, stmt) for name, stmt in _repository_queries(sample)]
+        transaction.rollback()
+    return plans
@@ -0,0 +1,328 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Sequence
+from decimal import Decimal
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy import exc
+
+from app.features.reviews.domain.entities.record_review_stats import RecordReviewStats
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.expansion import ExpandedReview, ReviewExpansion
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.repositories import AsyncReviewRepository, ReviewRepository
+from app.features.reviews.domain.search import ReviewMatch
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.shared.infrastructure.replicas import ReplicaLease
+
+T = TypeVar("T")
+
+
+class ReplicaRoutingReviewRepository(ReviewRepository):
+    """Envía las lecturas a una réplica y las escrituras al primario.
+
+    Si una lectura falla en la réplica por un error de conexión, la réplica se reporta caída
+    y la lectura se repite en el primario, igual que el resto de la petición. Cada escritura
+    llama a ``on_write`` para que las lecturas siguientes del mismo cliente vean lo escrito.
+    La exportación no se reintenta: el stream puede haber entregado lotes antes del fallo.
+    """
+
+    def __init__(
+        self,
+        primary: ReviewRepository,
+        replica: ReplicaLease[ReviewRepository] | None,
+        on_write: Callable[[], None],
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._on_write = on_write
+
+    @property
+    def reads_from_replica(self) -> bool:
+        """Si la próxima lectura irá a la réplica; deja de serlo tras una escritura o un fallo."""
+        return self._replica is not None
+
+    def create_review(self, review: Review) -> Review:
+        self._wrote()
+        return self._primary.create_review(review)
+
+    def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        self._wrote()
+        return self._primary.create_review_with_images(review, images)
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        self._wrote()
+        return self._primary.import_reviews(reviews)
+
+    def get_review(self, review_id: UUID) -> Review | None:
+        return self._read(lambda repository: repository.get_review(review_id))
+
+    def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        return self._read(lambda repository: repository.get_reviews(review_ids))
+
+    def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        return self._read(
+            lambda repository: repository.list_reviews_for_record(
+                record_id, limit=limit, offset=offset, after=after
+            )
+        )
+
+    def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        return self._read(
+            lambda repository: repository.search_reviews(
+                query, record_id=record_id, limit=limit, after=after
+            )
+        )
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> Generator[list[ExpandedReview]]:
+        repository = self._primary if self._replica is None else self._replica.value
+        return repository.stream_reviews(filters, expand=expand)
+
+    def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        self._wrote()
+        return self._primary.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+
+    def delete_review(self, review_id: UUID) -> Review:
+        self._wrote()
+        return self._primary.delete_review(review_id)
+
+    def add_image(self, image: ReviewImage) -> ReviewImage:
+        self._wrote()
+        return self._primary.add_image(image)
+
+    def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        return self._read(lambda repository: repository.list_images(review_id))
+
+    def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        self._wrote()
+        return self._primary.add_comment(comment)
+
+    def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        return self._read(
+            lambda repository: repository.list_comments(
+                review_id, limit=limit, offset=offset, after=after
+            )
+        )
+
+    def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        self._wrote()
+        return self._primary.upsert_vote(vote)
+
+    def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        self._wrote()
+        return self._primary.upsert_votes(votes)
+
+    def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        return self._read(lambda repository: repository.get_votes_summary(review_id))
+
+    def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        return self._read(lambda repository: repository.get_record_stats(record_id))
+
+    def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        return self._read(
+            lambda repository: repository.expand_reviews(
+                reviews, expand, comments_limit=comments_limit
+            )
+        )
+
+    def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return self._read(lambda repository: repository.get_version(resource, resource_id))
+
+    def _wrote(self) -> None:
+        self._replica = None
+        self._on_write()
+
+    def _read(self, load: Callable[[ReviewRepository], T]) -> T:
+        replica = self._replica
+        if replica is None:
+            return load(self._primary)
+        try:
+            return load(replica.value)
+        except exc.OperationalError:
+            self._replica = None
+            replica.mark_down()
+        return load(self._primary)
+
+
+class AsyncReplicaRoutingReviewRepository(AsyncReviewRepository):
+    """Par asíncrono de ``ReplicaRoutingReviewRepository``."""
+
+    def __init__(
+        self,
+        primary: AsyncReviewRepository,
+        replica: ReplicaLease[AsyncReviewRepository] | None,
+        on_write: Callable[[], None],
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._on_write = on_write
+
+    @property
+    def reads_from_replica(self) -> bool:
+        return self._replica is not None
+
+    async def create_review(self, review: Review) -> Review:
+        self._wrote()
+        return await self._primary.create_review(review)
+
+    async def create_review_with_images(
+        self, review: Review, images: Sequence[ReviewImage]
+    ) -> tuple[Review, list[ReviewImage]]:
+        self._wrote()
+        return await self._primary.create_review_with_images(review, images)
+
+    async def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        self._wrote()
+        return await self._primary.import_reviews(reviews)
+
+    async def get_review(self, review_id: UUID) -> Review | None:
+        return await self._read(lambda repository: repository.get_review(review_id))
+
+    async def get_reviews(self, review_ids: Sequence[UUID]) -> dict[UUID, Review]:
+        return await self._read(lambda repository: repository.get_reviews(review_ids))
+
+    async def list_reviews_for_record(
+        self, record_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[Review]:
+        return await self._read(
+            lambda repository: repository.list_reviews_for_record(
+                record_id, limit=limit, offset=offset, after=after
+            )
+        )
+
+    async def search_reviews(
+        self,
+        query: str,
+        *,
+        record_id: UUID | None = None,
+        limit: int,
+        after: SearchCursor | None = None,
+    ) -> Sequence[ReviewMatch]:
+        return await self._read(
+            lambda repository: repository.search_reviews(
+                query, record_id=record_id, limit=limit, after=after
+            )
+        )
+
+    def stream_reviews(
+        self, filters: ReviewFilter, *, expand: frozenset[ReviewExpansion] = frozenset()
+    ) -> AsyncGenerator[list[ExpandedReview]]:
+        repository = self._primary if self._replica is None else self._replica.value
+        return repository.stream_reviews(filters, expand=expand)
+
+    async def update_review(
+        self,
+        review_id: UUID,
+        *,
+        rent_amount: Decimal | None = None,
+        review_text: str | None = None,
+        rating: int | None = None,
+    ) -> Review:
+        self._wrote()
+        return await self._primary.update_review(
+            review_id, rent_amount=rent_amount, review_text=review_text, rating=rating
+        )
+
+    async def delete_review(self, review_id: UUID) -> Review:
+        self._wrote()
+        return await self._primary.delete_review(review_id)
+
+    async def add_image(self, image: ReviewImage) -> ReviewImage:
+        self._wrote()
+        return await self._primary.add_image(image)
+
+    async def list_images(self, review_id: UUID) -> Sequence[ReviewImage]:
+        return await self._read(lambda repository: repository.list_images(review_id))
+
+    async def add_comment(self, comment: ReviewComment) -> ReviewComment:
+        self._wrote()
+        return await self._primary.add_comment(comment)
+
+    async def list_comments(
+        self, review_id: UUID, *, limit: int, offset: int = 0, after: PageCursor | None = None
+    ) -> Sequence[ReviewComment]:
+        return await self._read(
+            lambda repository: repository.list_comments(
+                review_id, limit=limit, offset=offset, after=after
+            )
+        )
+
+    async def upsert_vote(self, vote: ReviewVote) -> ReviewVote:
+        self._wrote()
+        return await self._primary.upsert_vote(vote)
+
+    async def upsert_votes(self, votes: Sequence[ReviewVote]) -> VoteBatchResult:
+        self._wrote()
+        return await self._primary.upsert_votes(votes)
+
+    async def get_votes_summary(self, review_id: UUID) -> tuple[int, int]:
+        return await self._read(lambda repository: repository.get_votes_summary(review_id))
+
+    async def get_record_stats(self, record_id: UUID) -> RecordReviewStats:
+        return await self._read(lambda repository: repository.get_record_stats(record_id))
+
+    async def expand_reviews(
+        self,
+        reviews: Sequence[Review],
+        expand: frozenset[ReviewExpansion],
+        *,
+        comments_limit: int | None = None,
+    ) -> list[ExpandedReview]:
+        return await self._read(
+            lambda repository: repository.expand_reviews(
+                reviews, expand, comments_limit=comments_limit
+            )
+        )
+
+    async def get_version(self, resource: VersionedResource, resource_id: UUID) -> str | None:
+        return await self._read(lambda repository: repository.get_version(resource, resource_id))
+
+    def _wrote(self) -> None:
+        self._replica = None
+        self._on_write()
+
+    async def _read(self, load: Callable[[AsyncReviewRepository], Awaitable[T]]) -> T:
+        replica = self._replica
+        if replica is None:
+            return await load(self._primary)
+        try:
+            return await load(replica.value)
+        except exc.OperationalError:
+            self._replica = None
+            replica.mark_down()
+        return await load(self._primary)
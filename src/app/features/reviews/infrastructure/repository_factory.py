@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from functools import lru_cache
+
+from app.features.reviews.domain.repositories import AsyncReviewRepository, ReviewRepository
+from app.features.reviews.infrastructure.async_postgres_repository import (
+    AsyncPostgresReviewRepository,
+)
+from app.features.reviews.infrastructure.cache import get_review_cache
+from app.features.reviews.infrastructure.caching_repository import (
+    AsyncCachingReviewRepository,
+    CachingReviewRepository,
+    ReadRouting,
+)
+from app.features.reviews.infrastructure.memory_repository import (
+    AsyncInMemoryReviewRepository,
+    InMemoryReviewRepository,
+)
+from app.features.reviews.infrastructure.postgres_repository import PostgresReviewRepository
+from app.features.reviews.infrastructure.replica_repository import (
+    AsyncReplicaRoutingReviewRepository,
+    ReplicaRoutingReviewRepository,
+)
+from app.shared.infrastructure.database import AsyncDbHandle, DbHandle
+from app.shared.infrastructure.replicas import ReplicaLease
+from app.shared.infrastructure.settings import settings
+
+# Único lugar que decide qué decoradores envuelven a cada adaptador.
+
+
+def _decorate(repository: ReviewRepository, routing: ReadRouting | None = None) -> ReviewRepository:
+    if settings.cache.enabled:
+        return CachingReviewRepository(repository, get_review_cache(), routing=routing)
+    return repository
+
+
+def _decorate_async(
+    repository: AsyncReviewRepository, routing: ReadRouting | None = None
+) -> AsyncReviewRepository:
+    if settings.cache.enabled:
+        return AsyncCachingReviewRepository(repository, get_review_cache(), routing=routing)
+    return repository
+
+
+@lru_cache(maxsize=1)
+def get_in_memory_repository() -> InMemoryReviewRepository:
+    """Almacén en memoria del proceso, compartido por todas las peticiones."""
+    return InMemoryReviewRepository()
+
+
+def _routes_reads(replica: object, on_write: object) -> bool:
+    # Sin réplicas configuradas no hay nada que enrutar ni ventana read-your-writes que abrir.
+    return bool(settings.database.replica_urls) and (replica is not None or on_write is not None)
+
+
+def _noop() -> None:
+    return None
+
+
+def build_review_repository(
+    session: DbHandle,
+    replica: ReplicaLease[DbHandle] | None = None,
+    *,
+    on_write: Callable[[], None] | None = None,
+) -> ReviewRepository:
+    """Repositorio sobre ``session``; con ``replica``, sus lecturas van a esa réplica."""
+    primary = PostgresReviewRepository(session)
+    if not _routes_reads(replica, on_write):
+        return _decorate(primary)
+    routing = ReplicaRoutingReviewRepository(
+        primary,
+        None
+        if replica is None
+        else ReplicaLease(PostgresReviewRepository(replica.value), replica.mark_down),
+        on_write or _noop,
+    )
+    return _decorate(routing, routing)
+
+
+def build_async_review_repository(
+    session: AsyncDbHandle,
+    replica: ReplicaLease[AsyncDbHandle] | None = None,
+    *,
+    on_write: Callable[[], None] | None = None,
+) -> AsyncReviewRepository:
+    primary = AsyncPostgresReviewRepository(session)
+    if not _routes_reads(replica, on_write):
+        return _decorate_async(primary)
+    routing = AsyncReplicaRoutingReviewRepository(
+        primary,
+        None
+        if replica is None
+        else ReplicaLease(AsyncPostgresReviewRepository(replica.value), replica.mark_down),
+        on_write or _noop,
+    )
+    return _decorate_async(routing, routing)
+
+
+def build_in_memory_review_repository() -> ReviewRepository:
+    return _decorate(get_in_memory_repository())
+
+
+def build_async_in_memory_review_repository() -> AsyncReviewRepository:
+    return _decorate_async(AsyncInMemoryReviewRepository(get_in_memory_repository()))
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Connection, delete, text
+
+from app.features.reviews.infrastructure import statements
+from app.features.reviews.infrastructure.tables import record_review_stats_table
+from app.shared.infrastructure.settings import settings
+
+
+@dataclass(slots=True, frozen=True)
+class SeedSize:
+    records: int = 200
+    users: int = 2_000
+    reviews_per_record: int = 50
+    images_per_review: int = 2
+    comments_per_review: int = 3
+    votes_per_review: int = 10
+
+
+# Los UUID salen de md5(prefijo || n) para que dos corridas generen exactamente los mismos datos.
+_SEED_STATEMENTS = (
+    """
+    INSERT INTO users (id)
+    SELECT md5('user-' || u)::uuid FROM generate_series(1, :users) AS u
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO records (id)
+    SELECT md5('record-' || r)::uuid FROM generate_series(1, :records) AS r
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO reviews (id, record_id, user_id, rent_amount, review_text, rating, created_at)
+    SELECT md5('review-' || r || '-' || k)::uuid,
+           md5('record-' || r)::uuid,
+           md5('user-' || ((r * 7 + k) % :users + 1))::uuid,
+           500 + (r * k) % 1500,
+           'Reseña de prueba ' || k || ' para la vivienda ' || r,
+           1 + (r + k) % 5,
+           timestamp '2024-01-01' + ((r * :reviews_per_record + k) * interval '1 minute')
+    FROM generate_series(1, :records) AS r, generate_series(1, :reviews_per_record) AS k
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO review_images (id, review_id, image_url, uploaded_at)
+    SELECT md5('image-' || rv.id || '-' || i)::uuid,
+           rv.id,
+           'https://images.example.com/' || rv.id || '/' || i || '.jpg',
+           rv.created_at + i * interval '1 second'
+    FROM reviews AS rv, generate_series(1, :images_per_review) AS i
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO review_comments (id, review_id, user_id, comment_text, created_at)
+    SELECT md5('comment-' || rv.id || '-' || c)::uuid,
+           rv.id,
+           md5('user-' || (abs(hashtext(rv.id::text || c)) % :users + 1))::uuid,
+           'Comentario ' || c,
+           rv.created_at + c * interval '1 hour'
+    FROM reviews AS rv, generate_series(1, :comments_per_review) AS c
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO review_votes (id, review_id, user_id, useful, created_at)
+    SELECT md5('vote-' || rv.id || '-' || v)::uuid,
+           rv.id,
+           md5('user-' || ((abs(hashtext(rv.id::text)) + v) % :users + 1))::uuid,
+           (abs(hashtext(rv.id::text || v)) % 4) <> 0,
+           rv.created_at + v * interval '1 minute'
+    FROM reviews AS rv, generate_series(1, :votes_per_review) AS v
+    ON CONFLICT DO NOTHING
+    """,
+)
+
+
+def _ensure_external_tables(connection: Connection) -> None:
+    """Crea ``users`` y ``records`` mínimas en una base local vacía para poder migrar."""
+    connection.execute(text("CREATE TABLE IF NOT EXISTS users (id UUID PRIMARY KEY)"))
+    connection.execute(text("CREATE TABLE IF NOT EXISTS records (id UUID PRIMARY KEY)"))
+
+
+def seed_database(connection: Connection, size: SeedSize, *, alembic_ini: str) -> None:
+    """Migra la base local a ``head`` y la llena con datos sintéticos reproducibles."""
+    if settings.is_production:
+        raise RuntimeError("Refusing to seed a production database")
+    if size.votes_per_review > size.users or size.reviews_per_record > size.users:
+        raise ValueError("users must be >= reviews_per_record and votes_per_review")
+
+    with connection.begin():
+        _ensure_external_tables(connection)
+
+    config = Config(alembic_ini)
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
+    connection.commit()
+
+    params = {
+        "users": size.users,
+        "records": size.records,
+        "reviews_per_record": size.reviews_per_record,
+        "images_per_review": size.images_per_review,
+        "comments_per_review": size.comments_per_review,
+        "votes_per_review": size.votes_per_review,
+    }
+    with connection.begin():
+        for statement in _SEED_STATEMENTS:
+            connection.execute(text(statement), params)
+        connection.execute(
+            text(
+                """
+                INSERT INTO review_vote_counts (review_id, useful_votes, not_useful_votes)
+                SELECT review_id,
+                       count(*) FILTER (WHERE useful),
+                       count(*) FILTER (WHERE NOT useful)
+                FROM review_votes
+                GROUP BY review_id
+                ON CONFLICT (review_id) DO UPDATE
+                SET useful_votes = EXCLUDED.useful_votes,
+                    not_useful_votes = EXCLUDED.not_useful_votes
+                """
+            )
+        )
+        # Las reseñas sembradas no pasan por el repositorio: sus agregados se recalculan.
+        connection.execute(delete(record_review_stats_table))
+        connection.execute(statements.insert_record_stats())
+    connection.execute(text("ANALYZE"))
+    connection.commit()
@@ -0,0 +1,833 @@
+from collections.abc import Iterable, Mapping, Sequence
+from decimal import Decimal
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Executable,
+    Select,
+    Table,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    select,
+    table,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import Insert as PGInsert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import FromClause
+
+from app.features.reviews.domain.entities.review import RATINGS, Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor, SearchCursor
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.infrastructure.tables import (
+    SEARCH_CONFIG,
+    record_review_stats_table,
+    review_comments_table,
+    review_images_table,
+    review_import_staging_table,
+    review_vote_counts_table,
+    review_votes_table,
+    reviews_table,
+)
+
+# Sentencias SQLAlchemy Core compartidas por los repositorios síncrono y asíncrono.
+#
+# Las del camino de una petición se construyen una sola vez al importar el módulo, con
+# ``bindparam`` en lugar de valores, y sus funciones retornan ``(sentencia, parámetros)`` para
+# ``execute(*...)``. Así no se arma el árbol ni se recalcula su clave de caché en cada
+# llamada (SQLAlchemy la memoriza por instancia), y el SQL es el mismo texto en cada
+# ejecución, que psycopg convierte en sentencia preparada tras ``prepare_threshold`` usos.
+# Las de lotes y mantenimiento (importación, exportación, votos en bloque) se siguen armando
+# por llamada: su forma depende del lote y el costo se reparte entre sus filas.
+
+# Filas por FETCH del cursor del servidor en ``stream_reviews`` y por consulta de hijos.
+STREAM_BATCH_SIZE = 1_000
+
+# ``users`` y ``records`` pertenecen a otros módulos; aquí solo se consulta su clave.
+_users = table("users", column("id"))
+_records = table("records", column("id"))
+
+# Columnas que se leen de ``reviews``; ``search_vector`` solo se usa dentro de la consulta.
+_REVIEW_COLUMNS = tuple(column for column in reviews_table.c if column.computed is None)
+
+# Columnas de ``record_review_stats`` que se acumulan por delta, en orden de tabla.
+_RECORD_STATS_COUNTERS = tuple(
+    column.name for column in record_review_stats_table.c if not column.primary_key
+)
+
+_UUID_ARRAY = ARRAY(PGUUID(as_uuid=True))
+
+
+class BoundStatement(NamedTuple):
+    """Sentencia construida una vez y los valores de sus ``bindparam`` para esta llamada."""
+
+    statement: Executable
+    params: dict[str, Any]
+
+
+def _scoped_to_review(children: Select[Any], *order: str) -> Select[Any]:
+    """Envuelve una consulta de hijos en ``reviews LEFT JOIN LATERAL``.
+
+    Si la reseña no existe no vuelve ninguna fila; si existe pero no tiene hijos vuelve una
+    sola fila con ``id`` nulo. Así la existencia se comprueba en la misma ida a la base.
+    Espera el parámetro ``review_id``.
+    """
+    page = children.where(children.selected_columns.review_id == reviews_table.c.id).lateral("page")
+    return (
+        select(page)
+        .select_from(reviews_table.outerjoin(page, true()))
+        .where(reviews_table.c.id == bindparam("review_id"))
+        .order_by(*(page.c[name].desc() for name in order))
+    )
+
+
+def _equals_any(column: ColumnElement[UUID], name: str) -> ColumnElement[bool]:
+    # Un solo parámetro uuid[] en lugar de un IN con un parámetro por id.
+    return column == any_(bindparam(name, type_=_UUID_ARRAY))
+
+
+def _page_after(created_at: ColumnElement[Any], id_: ColumnElement[Any]) -> ColumnElement[bool]:
+    # Keyset ``(created_at, id) < cursor``; espera ``after_created_at`` y ``after_id``.
+    return tuple_(created_at, id_) < tuple_(
+        bindparam("after_created_at", type_=created_at.type),
+        bindparam("after_id", type_=id_.type),
+    )
+
+
+def _page_params(
+    *, limit: int, offset: int, after: PageCursor | None
+) -> tuple[bool, dict[str, Any]]:
+    if after is None:
+        return False, {"limit": limit, "offset": offset}
+    return True, {"limit": limit, "after_created_at": after.created_at, "after_id": after.id}
+
+
+_INSERT_REVIEW = (
+    pg_insert(reviews_table)
+    .on_conflict_do_nothing(index_elements=[reviews_table.c.user_id, reviews_table.c.record_id])
+    .returning(*_REVIEW_COLUMNS)
+)
+
+
+def insert_review(review: Review) -> BoundStatement:
+    """No retorna fila si el usuario ya reseñó la vivienda (``uq_reviews_user_id_record_id``)."""
+    return BoundStatement(
+        _INSERT_REVIEW,
+        {
+            "id": review.id,
+            "record_id": review.record_id,
+            "user_id": review.user_id,
+            "rent_amount": review.rent_amount,
+            "review_text": review.review_text,
+            "rating": review.rating,
+            "created_at": review.created_at,
+        },
+    )
+
+
+def create_import_staging() -> CreateTable:
+    return CreateTable(review_import_staging_table)
+
+
+def copy_into_import_staging() -> str:
+    """``COPY`` en formato texto hacia la tabla temporal; cada fila la arma ``import_staging_row``."""
+    columns = ", ".join(column.name for column in review_import_staging_table.c)
+    return f"COPY {review_import_staging_table.name} ({columns}) FROM STDIN"
+
+
+def import_staging_row(ordinal: int, review: Review) -> tuple[object, ...]:
+    return (
+        ordinal,
+        review.id,
+        review.record_id,
+        review.user_id,
+        review.rent_amount,
+        review.review_text,
+        review.rating,
+        review.created_at,
+    )
+
+
+def merge_import_staging() -> Executable:
+    """Mueve la tabla temporal a ``reviews`` y retorna ``(id, reason)`` de cada fila descartada.
+
+    Dentro del lote gana la primera fila de cada ``(user_id, record_id)``; contra lo ya
+    guardado decide ``uq_reviews_user_id_record_id``. Las filas cuyo usuario o vivienda no
+    existe se filtran antes del INSERT para que la FK no aborte el lote completo. Los
+    agregados por vivienda de las filas insertadas se suman en la misma sentencia.
+    """
+    staging = review_import_staging_table
+    known_record = exists().where(_records.c.id == staging.c.record_id)
+    known_user = exists().where(_users.c.id == staging.c.user_id)
+    columns = ["id", "record_id", "user_id", "rent_amount", "review_text", "rating", "created_at"]
+    source = (
+        select(*(staging.c[name] for name in columns))
+        .where(known_record, known_user)
+        .distinct(staging.c.user_id, staging.c.record_id)
+        .order_by(staging.c.user_id, staging.c.record_id, staging.c.ordinal)
+    )
+    inserted = (
+        pg_insert(reviews_table)
+        .from_select(columns, source)
+        .on_conflict_do_nothing(index_elements=[reviews_table.c.user_id, reviews_table.c.record_id])
+        .returning(
+            reviews_table.c.id,
+            reviews_table.c.record_id,
+            reviews_table.c.rating,
+            reviews_table.c.rent_amount,
+        )
+        .cte("inserted")
+    )
+    record_stats = _accumulate_record_stats(
+        pg_insert(record_review_stats_table).from_select(
+            ["record_id", *_RECORD_STATS_COUNTERS], aggregate_record_stats(inserted)
+        )
+    ).cte("record_stats")
+    reason = case(
+        (~known_record, literal(ImportRejection.UNKNOWN_RECORD.value)),
+        (~known_user, literal(ImportRejection.UNKNOWN_USER.value)),
+        else_=literal(ImportRejection.DUPLICATE.value),
+    )
+    return (
+        select(staging.c.id, reason.label("reason"))
+        .where(~exists().where(inserted.c.id == staging.c.id))
+        .add_cte(record_stats)
+    )
+
+
+_SELECT_REVIEW = select(*_REVIEW_COLUMNS).where(reviews_table.c.id == bindparam("review_id"))
+_SELECT_REVIEW_FOR_UPDATE = _SELECT_REVIEW.with_for_update()
+
+
+def select_review(review_id: UUID) -> BoundStatement:
+    return BoundStatement(_SELECT_REVIEW, {"review_id": review_id})
+
+
+def select_review_for_update(review_id: UUID) -> BoundStatement:
+    """Valores previos de la reseña, bloqueada hasta el fin de la transacción."""
+    return BoundStatement(_SELECT_REVIEW_FOR_UPDATE, {"review_id": review_id})
+
+
+_SELECT_REVIEWS_BY_ID = select(*_REVIEW_COLUMNS).where(
+    _equals_any(reviews_table.c.id, "review_ids")
+)
+
+
+def select_reviews_by_id(review_ids: Sequence[UUID]) -> BoundStatement:
+    return BoundStatement(_SELECT_REVIEWS_BY_ID, {"review_ids": list(review_ids)})
+
+
+_REVIEWS_FOR_RECORD = (
+    select(*_REVIEW_COLUMNS)
+    .where(reviews_table.c.record_id == bindparam("record_id"))
+    .order_by(reviews_table.c.created_at.desc(), reviews_table.c.id.desc())
+    .limit(bindparam("limit"))
+)
+# Por cursor o por offset; indexado por ``after is not None``.
+_REVIEWS_FOR_RECORD_PAGES = (
+    _REVIEWS_FOR_RECORD.offset(bindparam("offset")),
+    _REVIEWS_FOR_RECORD.where(_page_after(reviews_table.c.created_at, reviews_table.c.id)),
+)
+
+
+def select_reviews_for_record(
+    record_id: UUID, *, limit: int, offset: int, after: PageCursor | None
+) -> BoundStatement:
+    keyset, params = _page_params(limit=limit, offset=offset, after=after)
+    return BoundStatement(_REVIEWS_FOR_RECORD_PAGES[keyset], {"record_id": record_id, **params})
+
+
+def _search_statement(*, by_record: bool, keyset: bool) -> Executable:
+    tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), bindparam("query"))
+    rank = func.ts_rank(reviews_table.c.search_vector, tsquery, type_=REAL)
+    statement = (
+        select(*_REVIEW_COLUMNS, rank.label("rank"))
+        .where(reviews_table.c.search_vector.bool_op("@@")(tsquery))
+        .order_by(rank.desc(), reviews_table.c.id.desc())
+        .limit(bindparam("limit"))
+    )
+    if by_record:
+        statement = statement.where(reviews_table.c.record_id == bindparam("record_id"))
+    if keyset:
+        # El rank llega como float4 redondeado; se compara también como real.
+        position = tuple_(
+            cast(bindparam("after_rank"), REAL),
+            bindparam("after_id", type_=reviews_table.c.id.type),
+        )
+        statement = statement.where(tuple_(rank, reviews_table.c.id) < position)
+    return statement
+
+
+# Indexado por ``(record_id is not None, after is not None)``.
+_SEARCH_REVIEWS = {
+    (by_record, keyset): _search_statement(by_record=by_record, keyset=keyset)
+    for by_record in (False, True)
+    for keyset in (False, True)
+}
+
+
+def search_reviews(
+    query: str, *, record_id: UUID | None, limit: int, after: SearchCursor | None
+) -> BoundStatement:
+    """Coincidencias de ``websearch_to_tsquery`` sobre ``ix_reviews_search_vector``.
+
+    El orden por relevancia obliga a puntuar todas las coincidencias antes del ``LIMIT``;
+    filtrar por ``record_id`` acota ese trabajo a una vivienda.
+    """
+    params: dict[str, Any] = {"query": query, "limit": limit}
+    if record_id is not None:
+        params["record_id"] = record_id
+    if after is not None:
+        params |= {"after_rank": after.rank, "after_id": after.id}
+    statement = _SEARCH_REVIEWS[record_id is not None, after is not None]
+    return BoundStatement(statement, params)
+
+
+def select_reviews(filters: ReviewFilter) -> Executable:
+    """Reseñas filtradas en orden ``(created_at, id)``; por vivienda usa el índice del listado."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters.record_id is not None:
+        conditions.append(reviews_table.c.record_id == filters.record_id)
+    if filters.user_id is not None:
+        conditions.append(reviews_table.c.user_id == filters.user_id)
+    if filters.created_from is not None:
+        conditions.append(reviews_table.c.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        conditions.append(reviews_table.c.created_at < filters.created_to)
+    return (
+        select(*_REVIEW_COLUMNS)
+        .where(*conditions)
+        .order_by(reviews_table.c.created_at, reviews_table.c.id)
+    )
+
+
+_IMAGES_FOR_REVIEWS = (
+    select(review_images_table)
+    .where(_equals_any(review_images_table.c.review_id, "review_ids"))
+    .order_by(review_images_table.c.review_id, review_images_table.c.uploaded_at.desc())
+)
+
+
+def select_images_for_reviews(review_ids: Sequence[UUID]) -> BoundStatement:
+    return BoundStatement(_IMAGES_FOR_REVIEWS, {"review_ids": list(review_ids)})
+
+
+def _comments_preview() -> Select[Any]:
+    # Un ``LATERAL`` por id que recorre ``ix_review_comments_review_id_created_at_id`` y se
+    # detiene en ``limit``, sin leer los demás comentarios de la reseña.
+    ids = (
+        func.unnest(bindparam("review_ids", type_=_UUID_ARRAY))
+        .table_valued("review_id")
+        .render_derived()
+        .alias("ids")
+    )
+    preview = (
+        select(review_comments_table)
+        .where(review_comments_table.c.review_id == ids.c.review_id)
+        .order_by(review_comments_table.c.created_at.desc(), review_comments_table.c.id.desc())
+        .limit(bindparam("limit"))
+        .lateral("preview")
+    )
+    return (
+        select(preview)
+        .select_from(ids.join(preview, true()))
+        .order_by(preview.c.review_id, preview.c.created_at.desc(), preview.c.id.desc())
+    )
+
+
+_COMMENTS_FOR_REVIEWS = (
+    select(review_comments_table)
+    .where(_equals_any(review_comments_table.c.review_id, "review_ids"))
+    .order_by(
+        review_comments_table.c.review_id,
+        review_comments_table.c.created_at.desc(),
+        review_comments_table.c.id.desc(),
+    )
+)
+_COMMENTS_PREVIEW_FOR_REVIEWS = _comments_preview()
+
+
+def select_comments_for_reviews(
+    review_ids: Sequence[UUID], *, limit: int | None = None
+) -> BoundStatement:
+    """Comentarios de varias reseñas, del más reciente al más antiguo.
+
+    Con ``limit`` se toman solo los primeros de cada reseña.
+    """
+    if limit is None:
+        return BoundStatement(_COMMENTS_FOR_REVIEWS, {"review_ids": list(review_ids)})
+    return BoundStatement(
+        _COMMENTS_PREVIEW_FOR_REVIEWS, {"review_ids": list(review_ids), "limit": limit}
+    )
+
+
+_VOTE_COUNTS_FOR_REVIEWS = select(review_vote_counts_table).where(
+    _equals_any(review_vote_counts_table.c.review_id, "review_ids")
+)
+
+
+def select_vote_counts_for_reviews(review_ids: Sequence[UUID]) -> BoundStatement:
+    return BoundStatement(_VOTE_COUNTS_FOR_REVIEWS, {"review_ids": list(review_ids)})
+
+
+# El SET sale de las claves de los parámetros además de ``updated_at``; SQLAlchemy compila
+# y cachea una variante por combinación de campos enviados.
+_UPDATE_REVIEW = (
+    update(reviews_table)
+    .where(reviews_table.c.id == bindparam("review_id"))
+    .values(updated_at=func.now())
+    .returning(*_REVIEW_COLUMNS)
+)
+
+
+def update_review(
+    review_id: UUID,
+    *,
+    rent_amount: Decimal | None,
+    review_text: str | None,
+    rating: int | None,
+) -> BoundStatement:
+    """Actualiza solo los campos enviados; no retorna fila si la reseña no existe."""
+    changes = {
+        column: value
+        for column, value in (
+            ("rent_amount", rent_amount),
+            ("review_text", review_text),
+            ("rating", rating),
+        )
+        if value is not None
+    }
+    if not changes:
+        return select_review(review_id)
+    return BoundStatement(_UPDATE_REVIEW, {"review_id": review_id, **changes})
+
+
+_DELETE_REVIEW = (
+    delete(reviews_table)
+    .where(reviews_table.c.id == bindparam("review_id"))
+    .returning(*_REVIEW_COLUMNS)
+)
+
+
+def delete_review(review_id: UUID) -> BoundStatement:
+    return BoundStatement(_DELETE_REVIEW, {"review_id": review_id})
+
+
+_INSERT_IMAGE = insert(review_images_table).returning(review_images_table)
+
+
+def insert_image(image: ReviewImage) -> BoundStatement:
+    return BoundStatement(
+        _INSERT_IMAGE,
+        {
+            "id": image.id,
+            "review_id": image.review_id,
+            "image_url": image.image_url,
+            "uploaded_at": image.uploaded_at,
+        },
+    )
+
+
+def insert_images(images: Sequence[ReviewImage]) -> Executable:
+    """Un único ``INSERT`` multi-fila.
+
+    Postgres no garantiza que ``RETURNING`` siga el orden de ``VALUES``: las filas se
+    reordenan con ``in_input_order`` antes de devolverlas.
+    """
+    return (
+        insert(review_images_table)
+        .values(
+            [
+                {
+                    "id": image.id,
+                    "review_id": image.review_id,
+                    "image_url": image.image_url,
+                    "uploaded_at": image.uploaded_at,
+                }
+                for image in images
+            ]
+        )
+        .returning(review_images_table)
+    )
+
+
+def in_input_order(images: Sequence[ReviewImage], rows: Iterable[RowMapping]) -> list[RowMapping]:
+    """Filas de ``insert_images`` en el mismo orden que ``images``."""
+    by_id = {row["id"]: row for row in rows}
+    return [by_id[image.id] for image in images]
+
+
+_SELECT_IMAGES = _scoped_to_review(
+    select(review_images_table).order_by(review_images_table.c.uploaded_at.desc()),
+    "uploaded_at",
+)
+
+
+def select_images(review_id: UUID) -> BoundStatement:
+    return BoundStatement(_SELECT_IMAGES, {"review_id": review_id})
+
+
+_INSERT_COMMENT = insert(review_comments_table).returning(review_comments_table)
+
+
+def insert_comment(comment: ReviewComment) -> BoundStatement:
+    return BoundStatement(
+        _INSERT_COMMENT,
+        {
+            "id": comment.id,
+            "review_id": comment.review_id,
+            "user_id": comment.user_id,
+            "comment_text": comment.comment_text,
+            "created_at": comment.created_at,
+        },
+    )
+
+
+_COMMENTS = (
+    select(review_comments_table)
+    .order_by(review_comments_table.c.created_at.desc(), review_comments_table.c.id.desc())
+    .limit(bindparam("limit"))
+)
+# Por offset o por cursor; indexado por ``after is not None``.
+_SELECT_COMMENTS = tuple(
+    _scoped_to_review(comments, "created_at", "id")
+    for comments in (
+        _COMMENTS.offset(bindparam("offset")),
+        _COMMENTS.where(
+            _page_after(review_comments_table.c.created_at, review_comments_table.c.id)
+        ),
+    )
+)
+
+
+def select_comments(
+    review_id: UUID, *, limit: int, offset: int, after: PageCursor | None
+) -> BoundStatement:
+    keyset, params = _page_params(limit=limit, offset=offset, after=after)
+    return BoundStatement(_SELECT_COMMENTS[keyset], {"review_id": review_id, **params})
+
+
+def _upsert_vote_statement() -> Executable:
+    statement = pg_insert(review_votes_table)
+    return statement.on_conflict_do_update(
+        index_elements=[
+            review_votes_table.c.review_id,
+            review_votes_table.c.user_id,
+        ],
+        set_={"useful": statement.excluded.useful},
+        where=review_votes_table.c.useful.is_distinct_from(statement.excluded.useful),
+    ).returning(review_votes_table, literal_column("xmax = 0", Boolean).label("inserted"))
+
+
+_UPSERT_VOTE = _upsert_vote_statement()
+
+
+def upsert_vote(vote: ReviewVote) -> BoundStatement:
+    """Inserta o cambia el voto; no retorna fila si el voto ya tenía ese valor.
+
+    ``inserted`` distingue un voto nuevo (``xmax = 0``) de un cambio útil/no útil.
+    """
+    return BoundStatement(
+        _UPSERT_VOTE,
+        {
+            "id": vote.id,
+            "review_id": vote.review_id,
+            "user_id": vote.user_id,
+            "useful": vote.useful,
+            "created_at": vote.created_at,
+        },
+    )
+
+
+_SELECT_VOTE = select(review_votes_table).where(
+    (review_votes_table.c.review_id == bindparam("review_id"))
+    & (review_votes_table.c.user_id == bindparam("user_id"))
+)
+
+
+def select_vote(review_id: UUID, user_id: UUID) -> BoundStatement:
+    return BoundStatement(_SELECT_VOTE, {"review_id": review_id, "user_id": user_id})
+
+
+def upsert_votes(votes: Sequence[ReviewVote]) -> Executable:
+    """Versión multi-fila de ``upsert_vote``; ``votes`` no debe repetir ``(review_id, user_id)``.
+
+    Solo escribe los votos cuya reseña existe: el ``JOIN`` con ``reviews`` (con ``FOR KEY
+    SHARE``, el mismo lock que tomaría la FK) descarta los demás en lugar de abortar el lote
+    con una violación de llave foránea. Las filas se ordenan por clave para que dos lotes
+    concurrentes tomen los locks en el mismo orden.
+
+    Retorna ``(review_id, useful, inserted)`` de cada voto que cambió y ``(review_id, NULL,
+    NULL)`` de cada voto omitido por su reseña.
+    """
+    ordered = sorted(votes, key=lambda vote: (vote.review_id, vote.user_id))
+    incoming = (
+        values(
+            column("id", PGUUID(as_uuid=True)),
+            column("review_id", PGUUID(as_uuid=True)),
+            column("user_id", PGUUID(as_uuid=True)),
+            column("useful", Boolean),
+            column("created_at", review_votes_table.c.created_at.type),
+            name="incoming_votes",
+        )
+        .data(
+            [
+                (vote.id, vote.review_id, vote.user_id, vote.useful, vote.created_at)
+                for vote in ordered
+            ]
+        )
+        .cte("incoming_votes")
+    )
+    existing = (
+        select(incoming)
+        .join(reviews_table, reviews_table.c.id == incoming.c.review_id)
+        .with_for_update(read=True, key_share=True, of=reviews_table)
+        .cte("existing_votes")
+    )
+    columns = ["id", "review_id", "user_id", "useful", "created_at"]
+    statement = pg_insert(review_votes_table).from_select(
+        columns,
+        select(*(existing.c[name] for name in columns)).order_by(
+            existing.c.review_id, existing.c.user_id
+        ),
+    )
+    upserted = (
+        statement.on_conflict_do_update(
+            index_elements=[
+                review_votes_table.c.review_id,
+                review_votes_table.c.user_id,
+            ],
+            set_={"useful": statement.excluded.useful},
+            where=review_votes_table.c.useful.is_distinct_from(statement.excluded.useful),
+        )
+        .returning(
+            review_votes_table.c.review_id,
+            review_votes_table.c.useful,
+            literal_column("xmax = 0", Boolean).label("inserted"),
+        )
+        .cte("upserted_votes")
+    )
+    skipped = select(
+        incoming.c.review_id,
+        cast(null(), Boolean).label("useful"),
+        cast(null(), Boolean).label("inserted"),
+    ).where(incoming.c.review_id.not_in(select(existing.c.review_id)))
+    return select(upserted.c.review_id, upserted.c.useful, upserted.c.inserted).union_all(skipped)
+
+
+def split_vote_rows(
+    rows: Iterable[tuple[UUID, bool | None, bool | None]],
+) -> tuple[list[tuple[UUID, bool, bool]], int]:
+    """Separa las filas de ``upsert_votes``: votos que cambiaron y cuántos se omitieron."""
+    changed: list[tuple[UUID, bool, bool]] = []
+    skipped = 0
+    for review_id, useful, inserted in rows:
+        if useful is None or inserted is None:
+            skipped += 1
+        else:
+            changed.append((review_id, useful, inserted))
+    return changed, skipped
+
+
+def vote_count_deltas(changes: Iterable[tuple[UUID, bool, bool]]) -> dict[UUID, tuple[int, int]]:
+    """Suma por reseña el delta de cada ``(review_id, useful, inserted)``.
+
+    Un voto nuevo suma uno a su lado; un voto que cambió de sentido además resta uno al otro.
+    """
+    deltas: dict[UUID, tuple[int, int]] = {}
+    for review_id, useful, inserted in changes:
+        useful_delta, not_useful_delta = deltas.get(review_id, (0, 0))
+        if useful:
+            deltas[review_id] = (useful_delta + 1, not_useful_delta - (0 if inserted else 1))
+        else:
+            deltas[review_id] = (useful_delta - (0 if inserted else 1), not_useful_delta + 1)
+    return deltas
+
+
+def _vote_count_rows(deltas: Mapping[UUID, tuple[int, int]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "review_id": review_id,
+            "useful_votes": useful_delta,
+            "not_useful_votes": not_useful_delta,
+        }
+        for review_id, (useful_delta, not_useful_delta) in sorted(deltas.items())
+    ]
+
+
+def _accumulate_vote_counts(statement: PGInsert) -> PGInsert:
+    return statement.on_conflict_do_update(
+        index_elements=[review_vote_counts_table.c.review_id],
+        set_={
+            "useful_votes": review_vote_counts_table.c.useful_votes
+            + statement.excluded.useful_votes,
+            "not_useful_votes": review_vote_counts_table.c.not_useful_votes
+            + statement.excluded.not_useful_votes,
+        },
+    )
+
+
+_INCREMENT_VOTE_COUNTS = _accumulate_vote_counts(pg_insert(review_vote_counts_table))
+
+
+def increment_vote_counts(vote: ReviewVote, *, inserted: bool) -> BoundStatement:
+    """Aplica al contador el delta de un voto nuevo o de un voto que cambió de sentido."""
+    deltas = vote_count_deltas([(vote.review_id, vote.useful, inserted)])
+    return BoundStatement(_INCREMENT_VOTE_COUNTS, _vote_count_rows(deltas)[0])
+
+
+def increment_vote_counts_many(deltas: Mapping[UUID, tuple[int, int]]) -> Executable:
+    return _accumulate_vote_counts(
+        pg_insert(review_vote_counts_table).values(_vote_count_rows(deltas))
+    )
+
+
+def _votes_summary(review_id: ColumnElement[Any]) -> Select[Any]:
+    return (
+        select(
+            func.coalesce(review_vote_counts_table.c.useful_votes, 0),
+            func.coalesce(review_vote_counts_table.c.not_useful_votes, 0),
+        )
+        .select_from(
+            reviews_table.outerjoin(
+                review_vote_counts_table,
+                review_vote_counts_table.c.review_id == reviews_table.c.id,
+            )
+        )
+        .where(reviews_table.c.id == review_id)
+    )
+
+
+_SELECT_VOTES_SUMMARY = _votes_summary(bindparam("review_id"))
+
+
+def select_votes_summary(review_id: UUID) -> BoundStatement:
+    """Sin fila si la reseña no existe; ceros si existe pero aún no tiene votos."""
+    return BoundStatement(_SELECT_VOTES_SUMMARY, {"review_id": review_id})
+
+
+def record_stats_delta(
+    *, added: Iterable[Review] = (), removed: Iterable[Review] = ()
+) -> dict[str, Any]:
+    """Cambio de cada contador de ``record_review_stats`` al sumar ``added`` y restar ``removed``."""
+    delta: dict[str, Any] = dict.fromkeys(_RECORD_STATS_COUNTERS, 0)
+    for sign, reviews in ((1, added), (-1, removed)):
+        for review in reviews:
+            delta["review_count"] += sign
+            delta[f"rating_{review.rating}"] += sign
+            delta["rating_total"] += sign * review.rating
+            if review.rent_amount is not None:
+                delta["rent_total"] += sign * review.rent_amount
+                delta["rent_count"] += sign
+    return delta
+
+
+def _accumulate_record_stats(statement: PGInsert) -> PGInsert:
+    # La primera reseña de una vivienda crea la fila; las demás suman sobre la existente.
+    return statement.on_conflict_do_update(
+        index_elements=[record_review_stats_table.c.record_id],
+        set_={
+            name: record_review_stats_table.c[name] + statement.excluded[name]
+            for name in _RECORD_STATS_COUNTERS
+        },
+    )
+
+
+_INCREMENT_RECORD_STATS = _accumulate_record_stats(pg_insert(record_review_stats_table))
+
+
+def increment_record_stats(record_id: UUID, delta: Mapping[str, Any]) -> BoundStatement:
+    return BoundStatement(_INCREMENT_RECORD_STATS, {"record_id": record_id, **delta})
+
+
+def aggregate_record_stats(source: FromClause) -> Select[Any]:
+    """Agregados por ``record_id`` de cualquier origen con ``rating`` y ``rent_amount``."""
+    rating, rent_amount = source.c.rating, source.c.rent_amount
+    return select(
+        source.c.record_id,
+        func.count().label("review_count"),
+        *(func.count().filter(rating == value).label(f"rating_{value}") for value in RATINGS),
+        func.sum(rating).label("rating_total"),
+        func.coalesce(func.sum(rent_amount), 0).label("rent_total"),
+        func.count(rent_amount).label("rent_count"),
+    ).group_by(source.c.record_id)
+
+
+def insert_record_stats() -> Executable:
+    """Recalcula todas las filas desde ``reviews``; espera la tabla vacía."""
+    return (
+        pg_insert(record_review_stats_table)
+        .from_select(["record_id", *_RECORD_STATS_COUNTERS], aggregate_record_stats(reviews_table))
+        .returning(record_review_stats_table.c.record_id)
+    )
+
+
+_SELECT_RECORD_STATS = select(record_review_stats_table).where(
+    record_review_stats_table.c.record_id == bindparam("record_id")
+)
+
+
+def select_record_stats(record_id: UUID) -> BoundStatement:
+    return BoundStatement(_SELECT_RECORD_STATS, {"record_id": record_id})
+
+
+def _children_version(table: Table, marker: ColumnElement[Any]) -> Executable:
+    return (
+        select(func.count(marker), func.max(marker))
+        .select_from(reviews_table.outerjoin(table, table.c.review_id == reviews_table.c.id))
+        .where(reviews_table.c.id == bindparam("resource_id"))
+        .group_by(reviews_table.c.id)
+    )
+
+
+def _version_statement(resource: VersionedResource) -> Executable:
+    match resource:
+        case VersionedResource.REVIEW:
+            return select(reviews_table.c.updated_at).where(
+                reviews_table.c.id == bindparam("resource_id")
+            )
+        case VersionedResource.RECORD_REVIEWS:
+            return select(func.count(), func.max(reviews_table.c.updated_at)).where(
+                reviews_table.c.record_id == bindparam("resource_id")
+            )
+        case VersionedResource.REVIEW_IMAGES:
+            return _children_version(review_images_table, review_images_table.c.uploaded_at)
+        case VersionedResource.REVIEW_COMMENTS:
+            return _children_version(review_comments_table, review_comments_table.c.created_at)
+        case VersionedResource.REVIEW_VOTES:
+            return _votes_summary(bindparam("resource_id"))
+
+
+_SELECT_VERSIONS = {resource: _version_statement(resource) for resource in VersionedResource}
+
+
+def select_version(resource: VersionedResource, resource_id: UUID) -> BoundStatement:
+    """Una fila cuyos valores cambian con cada escritura del recurso; ninguna si la reseña
+    no existe. Todas se resuelven con índices, sin leer ``review_text`` ni mapear filas.
+    """
+    return BoundStatement(_SELECT_VERSIONS[resource], {"resource_id": resource_id})
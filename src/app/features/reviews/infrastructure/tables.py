@@ -2,16 +2,24 @@
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     MetaData,
     Numeric,
     SmallInteger,
     Table,
     Text,
+    func,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
+# Configuración de texto de la búsqueda; cambiarla exige recrear la columna generada.
+SEARCH_CONFIG = "spanish"
+
 metadata = MetaData()
 
 reviews_table = Table(
@@ -24,6 +32,25 @@ reviews_table = Table(
     Column("review_text", Text, nullable=False),
     Column("rating", SmallInteger, nullable=False),
     Column("created_at", DateTime, nullable=False),
+    # Marca de versión para los ETag; la fija Postgres al insertar y update_review al cambiar.
+    Column("updated_at", DateTime, nullable=False, server_default=func.now()),
+    # Léxicos de review_text para la búsqueda; Postgres la recalcula en cada escritura.
+    Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', coalesce(review_text, ''))", persisted=True),
+        nullable=False,
+    ),
+    # Una reseña por usuario y vivienda; también resuelve la verificación de duplicados.
+    Index("uq_reviews_user_id_record_id", "user_id", "record_id", unique=True),
+    # Listado por vivienda ordenado y paginado por keyset (created_at, id).
+    Index("ix_reviews_record_id_created_at_id", "record_id", "created_at", "id"),
+    # Versión del listado por vivienda (count y max(updated_at)).
+    Index("ix_reviews_record_id_updated_at", "record_id", "updated_at"),
+    # Exportación filtrada por rango de created_at, en orden (created_at, id).
+    Index("ix_reviews_created_at_id", "created_at", "id"),
+    # Búsqueda de texto completo (search_vector @@ tsquery).
+    Index("ix_reviews_search_vector", "search_vector", postgresql_using="gin"),
 )
 
 review_images_table = Table(
@@ -33,6 +60,7 @@ review_images_table = Table(
     Column("review_id", PGUUID(as_uuid=True), ForeignKey("reviews.id", ondelete="CASCADE")),
     Column("image_url", Text, nullable=False),
     Column("uploaded_at", DateTime, nullable=False),
+    Index("ix_review_images_review_id_uploaded_at", "review_id", "uploaded_at"),
 )
 
 review_comments_table = Table(
@@ -43,6 +71,8 @@ review_comments_table = Table(
     Column("user_id", PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")),
     Column("comment_text", Text, nullable=False),
     Column("created_at", DateTime, nullable=False),
+    Index("ix_review_comments_review_id_created_at_id", "review_id", "created_at", "id"),
+    Index("ix_review_comments_user_id", "user_id"),
 )
 
 review_votes_table = Table(
@@ -53,4 +83,62 @@ review_votes_table = Table(
     Column("user_id", PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")),
     Column("useful", Boolean, nullable=False),
     Column("created_at", DateTime, nullable=False),
+    # Árbitro del ON CONFLICT de upsert_vote.
+    Index("uq_review_votes_review_id_user_id", "review_id", "user_id", unique=True),
+    Index("ix_review_votes_user_id", "user_id"),
+)
+
+review_vote_counts_table = Table(
+    "review_vote_counts",
+    metadata,
+    Column(
+        "review_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("reviews.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("useful_votes", Integer, nullable=False, server_default="0"),
+    Column("not_useful_votes", Integer, nullable=False, server_default="0"),
+)
+
+# Agregados por vivienda: create/update/delete/import aplican su delta en la misma
+# transacción y ``rebuild-record-stats`` los recalcula desde ``reviews``.
+record_review_stats_table = Table(
+    "record_review_stats",
+    metadata,
+    Column(
+        "record_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("records.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("review_count", Integer, nullable=False, server_default="0"),
+    Column("rating_1", Integer, nullable=False, server_default="0"),
+    Column("rating_2", Integer, nullable=False, server_default="0"),
+    Column("rating_3", Integer, nullable=False, server_default="0"),
+    Column("rating_4", Integer, nullable=False, server_default="0"),
+    Column("rating_5", Integer, nullable=False, server_default="0"),
+    Column("rating_total", Integer, nullable=False, server_default="0"),
+    # Solo las reseñas con rent_amount cuentan para el promedio del arriendo.
+    Column("rent_total", Numeric(16, 2), nullable=False, server_default="0"),
+    Column("rent_count", Integer, nullable=False, server_default="0"),
+)
+
+# Tabla temporal de la carga masiva: fuera de ``metadata`` para que Alembic no la vea. Cada
+# lote la crea, la llena con COPY y la mezcla en ``reviews`` dentro de su transacción.
+import_staging_metadata = MetaData()
+
+review_import_staging_table = Table(
+    "review_import_staging",
+    import_staging_metadata,
+    Column("ordinal", Integer, nullable=False),
+    Column("id", PGUUID(as_uuid=True), nullable=False),
+    Column("record_id", PGUUID(as_uuid=True), nullable=False),
+    Column("user_id", PGUUID(as_uuid=True), nullable=False),
+    Column("rent_amount", Numeric(10, 2)),
+    Column("review_text", Text, nullable=False),
+    Column("rating", SmallInteger, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
 )
@@ -0,0 +1,71 @@
+import functools
+import importlib
+import inspect
+import pkgutil
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.features.reviews.application import usecases
+from app.shared.infrastructure.metrics import USECASE_DURATION
+
+# La capa de aplicación no conoce las métricas: al arrancar con METRICS__ENABLED se envuelve
+# ``execute`` de cada caso de uso. Apagadas, las clases quedan intactas.
+
+
+def _timed(name: str, execute: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(execute)
+    def timed(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        started = time.perf_counter()
+        try:
+            return execute(*args, **kwargs)
+        finally:
+            USECASE_DURATION.observe(time.perf_counter() - started, name)
+
+    return timed
+
+
+def _timed_async(name: str, execute: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+    @functools.wraps(execute)
+    async def timed(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        started = time.perf_counter()
+        try:
+            return await execute(*args, **kwargs)
+        finally:
+            USECASE_DURATION.observe(time.perf_counter() - started, name)
+
+    return timed
+
+
+def instrument_use_cases() -> list[str]:
+    """Mide ``execute`` de cada ``*UseCase`` del paquete; devuelve los nombres envueltos.
+
+    Los que devuelven un generador (la exportación) se omiten: la llamada solo lo crea y
+    el trabajo ocurre al consumirlo, ya medido por la latencia de la ruta.
+    """
+    instrumented: list[str] = []
+    for module_info in pkgutil.iter_modules(usecases.__path__):
+        module = importlib.import_module(f"{usecases.__name__}.{module_info.name}")
+        for name, candidate in vars(module).items():
+            if not (
+                inspect.isclass(candidate)
+                and name.endswith("UseCase")
+                and candidate.__module__ == module.__name__
+            ):
+                continue
+            execute = candidate.__dict__.get("execute")
+            if (
+                execute is None
+                or hasattr(execute, "__wrapped__")
+                or inspect.isgeneratorfunction(execute)
+                or inspect.isasyncgenfunction(execute)
+            ):
+                continue
+            wrapper = (
+                _timed_async(name, execute)
+                if inspect.iscoroutinefunction(execute)
+                else _timed(name, execute)
+            )
+            setattr(candidate, "execute", wrapper)  # noqa: B010
+            instrumented.append(name)
+    return instrumented
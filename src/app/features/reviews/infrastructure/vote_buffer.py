@@ -0,0 +1,269 @@
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import islice
+from uuid import UUID
+
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.exceptions import VoteBacklogFullError
+from app.features.reviews.domain.vote_queue import VoteBatchResult, VoteQueue
+from app.features.reviews.infrastructure.repository_factory import (
+    build_async_review_repository,
+    build_in_memory_review_repository,
+    build_review_repository,
+)
+from app.shared.infrastructure.database import get_async_session_factory, get_session_factory
+from app.shared.infrastructure.logger import logger
+from app.shared.infrastructure.metrics import (
+    VOTE_BUFFER_DEPTH,
+    VOTE_BUFFER_FLUSH,
+    VOTE_BUFFER_VOTES,
+)
+from app.shared.infrastructure.settings import VoteBufferSettings, settings
+
+
+@dataclass(slots=True)
+class VoteBufferStats:
+    depth: int = 0
+    enqueued: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    flushes: int = 0
+    flushed_votes: int = 0
+    dropped_votes: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+
+
+class _PendingVotes:
+    """Votos pendientes coalescidos por ``(review_id, user_id)``; seguro entre hilos.
+
+    Un voto repetido reemplaza al anterior sin ocupar más espacio, así que el límite solo
+    rechaza claves nuevas.
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._votes: dict[tuple[UUID, UUID], ReviewVote] = {}
+        self._stats = VoteBufferStats()
+
+    @property
+    def stats(self) -> VoteBufferStats:
+        with self._lock:
+            return replace(self._stats, depth=len(self._votes))
+
+    def add(self, vote: ReviewVote) -> int:
+        key = (vote.review_id, vote.user_id)
+        with self._lock:
+            if key in self._votes:
+                self._stats.coalesced += 1
+            elif len(self._votes) >= self._max_pending:
+                self._stats.rejected += 1
+                raise VoteBacklogFullError("Too many pending votes, retry later")
+            self._votes[key] = vote
+            self._stats.enqueued += 1
+            return len(self._votes)
+
+    def take(self, limit: int) -> list[ReviewVote]:
+        with self._lock:
+            keys = list(islice(self._votes, limit))
+            return [self._votes.pop(key) for key in keys]
+
+    def record_flush(self, size: int, elapsed_ms: float, dropped: int) -> None:
+        with self._lock:
+            self._stats.flushes += 1
+            self._stats.flushed_votes += size - dropped
+            self._stats.dropped_votes += dropped
+            self._stats.last_flush_ms = elapsed_ms
+            self._stats.max_flush_ms = max(self._stats.max_flush_ms, elapsed_ms)
+        VOTE_BUFFER_FLUSH.observe(elapsed_ms / 1000)
+
+
+def _skipped(result: VoteBatchResult) -> int:
+    # El lote ya se escribió: los votos de reseñas inexistentes no se reintentan uno a uno.
+    if result.skipped:
+        logger.warning("Dropping %s votes for missing reviews", result.skipped)
+    return result.skipped
+
+
+class VoteBuffer(VoteQueue):
+    """Escritura diferida de votos con un hilo que vacía el buffer cada ``flush_interval_ms``
+    o en cuanto se juntan ``max_batch`` votos, usando un solo ``INSERT`` multi-fila por lote.
+    """
+
+    def __init__(
+        self, flush: Callable[[Sequence[ReviewVote]], VoteBatchResult], config: VoteBufferSettings
+    ) -> None:
+        self._flush = flush
+        self._interval = config.flush_interval_ms / 1000
+        self._max_batch = config.max_batch
+        self._pending = _PendingVotes(config.max_pending)
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def stats(self) -> VoteBufferStats:
+        return self._pending.stats
+
+    def enqueue(self, vote: ReviewVote) -> None:
+        if self._pending.add(vote) >= self._max_batch:
+            self._wake.set()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="vote-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el hilo y escribe lo que quede pendiente antes de retornar."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._drain()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        while batch := self._pending.take(self._max_batch):
+            started = time.perf_counter()
+            try:
+                dropped = _skipped(self._flush(batch))
+            except Exception:
+                logger.exception("Vote batch of %s failed, retrying one by one", len(batch))
+                dropped = sum(not self._flush_single(vote) for vote in batch)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._pending.record_flush(len(batch), elapsed_ms, dropped)
+
+    def _flush_single(self, vote: ReviewVote) -> bool:
+        try:
+            return not _skipped(self._flush([vote]))
+        except Exception:
+            logger.warning("Dropping vote for review %s", vote.review_id, exc_info=True)
+            return False
+
+
+class AsyncVoteBuffer(VoteQueue):
+    """Equivalente asíncrono de ``VoteBuffer``: una tarea del event loop hace los flush.
+
+    ``enqueue`` debe llamarse desde el mismo event loop.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Sequence[ReviewVote]], Awaitable[VoteBatchResult]],
+        config: VoteBufferSettings,
+    ) -> None:
+        self._flush = flush
+        self._interval = config.flush_interval_ms / 1000
+        self._max_batch = config.max_batch
+        self._pending = _PendingVotes(config.max_pending)
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def stats(self) -> VoteBufferStats:
+        return self._pending.stats
+
+    def enqueue(self, vote: ReviewVote) -> None:
+        if self._pending.add(vote) >= self._max_batch:
+            self._wake.set()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="vote-buffer")
+
+    async def stop(self) -> None:
+        """Detiene la tarea y escribe lo que quede pendiente antes de retornar."""
+        self._stopping = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+        await self._drain()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._interval)
+            self._wake.clear()
+            await self._drain()
+
+    async def _drain(self) -> None:
+        while batch := self._pending.take(self._max_batch):
+            started = time.perf_counter()
+            try:
+                dropped = _skipped(await self._flush(batch))
+            except Exception:
+                logger.exception("Vote batch of %s failed, retrying one by one", len(batch))
+                dropped = sum([not await self._flush_single(vote) for vote in batch])
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._pending.record_flush(len(batch), elapsed_ms, dropped)
+
+    async def _flush_single(self, vote: ReviewVote) -> bool:
+        try:
+            return not _skipped(await self._flush([vote]))
+        except Exception:
+            logger.warning("Dropping vote for review %s", vote.review_id, exc_info=True)
+            return False
+
+
+def _flush_votes(votes: Sequence[ReviewVote]) -> VoteBatchResult:
+    if settings.database.in_memory:
+        return build_in_memory_review_repository().upsert_votes(votes)
+    with get_session_factory()() as session:
+        return build_review_repository(session).upsert_votes(votes)
+
+
+async def _flush_votes_async(votes: Sequence[ReviewVote]) -> VoteBatchResult:
+    if settings.database.in_memory:
+        return build_in_memory_review_repository().upsert_votes(votes)
+    async with get_async_session_factory()() as session:
+        return await build_async_review_repository(session).upsert_votes(votes)
+
+
+# Etiqueta ``outcome`` de vote_buffer_votes_total y el campo de VoteBufferStats que la lleva.
+_OUTCOMES = {
+    "enqueued": "enqueued",
+    "coalesced": "coalesced",
+    "rejected": "rejected",
+    "flushed": "flushed_votes",
+    "dropped": "dropped_votes",
+}
+
+
+def _stat(buffer: VoteBuffer | AsyncVoteBuffer, field: str) -> float:
+    value: float = getattr(buffer.stats, field)
+    return value
+
+
+def _observe(buffer: VoteBuffer | AsyncVoteBuffer) -> None:
+    # Se leen de ``stats`` al exportar. Un voto para una reseña que no existe (o se borró
+    # antes del flush) ya se respondió con 202: solo queda a la vista como "dropped".
+    VOTE_BUFFER_DEPTH.set_function(function=lambda: buffer.stats.depth)
+    for outcome, field in _OUTCOMES.items():
+        VOTE_BUFFER_VOTES.set_function(outcome, function=partial(_stat, buffer, field))
+
+
+def start_vote_buffer(config: VoteBufferSettings) -> VoteBuffer:
+    buffer = VoteBuffer(_flush_votes, config)
+    if settings.metrics.enabled:
+        _observe(buffer)
+    buffer.start()
+    return buffer
+
+
+def start_async_vote_buffer(config: VoteBufferSettings) -> AsyncVoteBuffer:
+    buffer = AsyncVoteBuffer(_flush_votes_async, config)
+    if settings.metrics.enabled:
+        _observe(buffer)
+    buffer.start()
+    return buffer
@@ -11,5 +11,30 @@ CREATE TABLE IF NOT EXISTS reviews (
         AND 5
     ),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    search_vector TSVECTOR NOT NULL GENERATED ALWAYS AS (
+        to_tsvector('spanish', coalesce(review_text, ''))
+    ) STORED,
     CONSTRAINT unique_review_per_user UNIQUE (user_id, record_id)
 );
+
+CREATE TABLE IF NOT EXISTS review_vote_counts (
+    review_id UUID PRIMARY KEY REFERENCES reviews(id) ON DELETE CASCADE,
+    useful_votes INTEGER NOT NULL DEFAULT 0,
+    not_useful_votes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS ix_reviews_search_vector ON reviews USING gin (search_vector);
+
+CREATE TABLE IF NOT EXISTS record_review_stats (
+    record_id UUID PRIMARY KEY REFERENCES records(id) ON DELETE CASCADE,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    rating_total INTEGER NOT NULL DEFAULT 0,
+    rent_total NUMERIC(16, 2) NOT NULL DEFAULT 0,
+    rent_count INTEGER NOT NULL DEFAULT 0
+);
@@ -1,20 +1,71 @@
 import asyncio
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI
 
+from app.features.reviews.domain.repositories import AsyncReviewRepository
+from app.features.reviews.infrastructure.fastapi import async_controller, controller
 from app.features.reviews.infrastructure.fastapi.router import reviews_router
-from app.shared.infrastructure.database import close_connection_pool, open_connection_pool
+from app.features.reviews.infrastructure.repository_factory import (
+    build_async_in_memory_review_repository,
+    build_in_memory_review_repository,
+)
+from app.features.reviews.infrastructure.usecase_metrics import instrument_use_cases
+from app.features.reviews.infrastructure.vote_buffer import (
+    start_async_vote_buffer,
+    start_vote_buffer,
+)
+from app.shared.infrastructure.database import (
+    close_async_connection_pool,
+    close_connection_pool,
+    open_async_connection_pool,
+    open_connection_pool,
+)
+from app.shared.infrastructure.metrics import MetricsMiddleware, metrics_endpoint
+from app.shared.infrastructure.request_timing import RequestTimingMiddleware
 from app.shared.infrastructure.settings import settings
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):  # noqa: ANN201
+async def lifespan(app: FastAPI):  # noqa: ANN201
+    if settings.database.in_memory:
+        vote_buffer = (
+            start_vote_buffer(settings.vote_buffer) if settings.vote_buffer.enabled else None
+        )
+        app.state.vote_queue = vote_buffer
+        try:
+            yield
+        finally:
+            # ``stop`` espera al hilo del buffer: fuera del event loop para no bloquearlo.
+            if vote_buffer is not None:
+                await anyio.to_thread.run_sync(vote_buffer.stop)
+        return
+
+    if settings.database.is_async:
+        await open_async_connection_pool()
+        async_vote_buffer = (
+            start_async_vote_buffer(settings.vote_buffer) if settings.vote_buffer.enabled else None
+        )
+        app.state.vote_queue = async_vote_buffer
+        try:
+            yield
+        finally:
+            # Los votos pendientes se escriben antes de cerrar el pool.
+            if async_vote_buffer is not None:
+                await async_vote_buffer.stop()
+            await close_async_connection_pool()
+        return
+
     open_connection_pool()
+    vote_buffer = start_vote_buffer(settings.vote_buffer) if settings.vote_buffer.enabled else None
+    app.state.vote_queue = vote_buffer
     try:
         yield
     finally:
+        if vote_buffer is not None:
+            await anyio.to_thread.run_sync(vote_buffer.stop)
         close_connection_pool()
 
 
@@ -28,6 +79,26 @@ app = FastAPI(
 
 app.include_router(reviews_router, prefix=settings.app.api_prefix)
 
+if settings.timing.enabled:
+    app.add_middleware(RequestTimingMiddleware)
+
+if settings.metrics.enabled:
+    instrument_use_cases()
+    app.add_middleware(MetricsMiddleware)
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+
+async def _async_in_memory_repository() -> AsyncReviewRepository:
+    return build_async_in_memory_review_repository()
+
+
+if settings.database.in_memory:
+    # Sin base de datos: las rutas reciben el repositorio en memoria en lugar de abrir sesión.
+    app.dependency_overrides[controller.get_review_repository] = build_in_memory_review_repository
+    app.dependency_overrides[async_controller.get_async_review_repository] = (
+        _async_in_memory_repository
+    )
+
 
 @app.get("/")
 def read_root() -> dict[str, str]:
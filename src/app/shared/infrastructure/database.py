@@ -1,12 +1,122 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Mapping, Sequence
 from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import URL, Connection, CursorResult, Engine, create_engine, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncResult,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.sql.base import Executable
 
+from app.shared.infrastructure.metrics import observe_pool
+from app.shared.infrastructure.request_timing import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+)
 from app.shared.infrastructure.settings import settings
 
 
+class LazyConnection:
+    """``Connection`` del engine que se toma del pool con la primera sentencia.
+
+    Como la ``Session``, la devuelve al pool al terminar la transacción (``commit``,
+    ``rollback`` o ``close``) y toma otra si se sigue usando: una petición que no llega a la
+    base (caché, validación) no ocupa una conexión.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._connection: Connection | None = None
+
+    def connection(self) -> Connection:
+        if self._connection is None:
+            self._connection = self._engine.connect()
+        return self._connection
+
+    def execute(
+        self,
+        statement: Executable,
+        parameters: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        *,
+        execution_options: Mapping[str, Any] | None = None,
+    ) -> CursorResult[Any]:
+        return self.connection().execute(statement, parameters, execution_options=execution_options)
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self.close()
+
+    def rollback(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Cerrar la ``Connection`` deshace la transacción abierta y la devuelve al pool.
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+class AsyncLazyConnection:
+    """Par asíncrono de ``LazyConnection``."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._connection: AsyncConnection | None = None
+
+    async def connection(self) -> AsyncConnection:
+        if self._connection is None:
+            self._connection = await self._engine.connect()
+        return self._connection
+
+    async def execute(
+        self,
+        statement: Executable,
+        parameters: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        *,
+        execution_options: Mapping[str, Any] | None = None,
+    ) -> CursorResult[Any]:
+        connection = await self.connection()
+        return await connection.execute(statement, parameters, execution_options=execution_options)
+
+    async def stream(
+        self,
+        statement: Executable,
+        parameters: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        *,
+        execution_options: Mapping[str, Any] | None = None,
+    ) -> AsyncResult[Any]:
+        connection = await self.connection()
+        return await connection.stream(statement, parameters, execution_options=execution_options)
+
+    async def commit(self) -> None:
+        if self._connection is not None:
+            await self._connection.commit()
+            await self.close()
+
+    async def rollback(self) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+
+# Lo que acepta un repositorio solo Core: ``execute``, ``commit`` y ``rollback`` existen en
+# todos con la misma firma. Qué recibe en cada petición lo decide ``database.execution``.
+type DbHandle = Session | Connection | LazyConnection
+type AsyncDbHandle = AsyncSession | AsyncConnection | AsyncLazyConnection
+
+
 def validate_database_url() -> str:
     """Valida y retorna la URL de la base de datos."""
     db_uri = settings.database.url
@@ -15,16 +125,76 @@ def validate_database_url() -> str:
     return db_uri
 
 
-def _create_engine(db_uri: str) -> Engine:
-    """Crea una instancia Engine lista para reutilizar en todo el proyecto."""
-    return create_engine(
-        db_uri,
+def _observe_pool(engine: Engine, label: str) -> None:
+    observe_pool(
+        engine,
+        label,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        timeout=settings.database.pool_timeout,
+    )
+
+
+def _driver_args(url: URL, connect_args: dict[str, object] | None) -> dict[str, object]:
+    # ``prepare_threshold`` es de psycopg3; ``None`` desactiva las sentencias preparadas.
+    args = dict(connect_args or {})
+    if url.get_driver_name() == "psycopg":
+        database = settings.database
+        args["prepare_threshold"] = (
+            database.prepare_threshold if database.prepared_statements else None
+        )
+    return args
+
+
+def _create_engine(
+    db_uri: str, label: str = "sync", connect_args: dict[str, object] | None = None
+) -> Engine:
+    """Crea una instancia Engine lista para reutilizar en todo el proyecto.
+
+    ``label`` nombra el pool en los logs y en las métricas; ``connect_args`` va al driver.
+    """
+    url = make_url(db_uri)
+    timed = settings.timing.enabled or settings.metrics.enabled
+    engine = create_engine(
+        url,
+        poolclass=TimedQueuePool if timed else QueuePool,
         pool_size=settings.database.pool_size,
         max_overflow=settings.database.max_overflow,
         pool_timeout=settings.database.pool_timeout,
         pool_pre_ping=True,
+        pool_logging_name=label,
+        connect_args=_driver_args(url, connect_args),
         echo=settings.database.echo,
     )
+    if settings.timing.enabled:
+        instrument_engine(engine)
+    if settings.metrics.enabled:
+        _observe_pool(engine, label)
+    return engine
+
+
+def _create_async_engine(
+    db_uri: str, label: str = "async", connect_args: dict[str, object] | None = None
+) -> AsyncEngine:
+    """Crea un AsyncEngine sobre el driver asyncio de psycopg3 con el mismo pool."""
+    url = make_url(db_uri).set(drivername="postgresql+psycopg")
+    timed = settings.timing.enabled or settings.metrics.enabled
+    engine = create_async_engine(
+        url,
+        poolclass=TimedAsyncAdaptedQueuePool if timed else AsyncAdaptedQueuePool,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        pool_timeout=settings.database.pool_timeout,
+        pool_pre_ping=True,
+        pool_logging_name=label,
+        connect_args=_driver_args(url, connect_args),
+        echo=settings.database.echo,
+    )
+    if settings.timing.enabled:
+        instrument_engine(engine.sync_engine)
+    if settings.metrics.enabled:
+        _observe_pool(engine.sync_engine, label)
+    return engine
 
 
 @lru_cache(maxsize=1)
@@ -44,6 +214,45 @@ def get_session_factory() -> sessionmaker[Session]:
     )
 
 
+def _replica_connect_args() -> dict[str, object]:
+    # Una réplica caída debe fallar rápido para que la lectura se repita en el primario.
+    return {"connect_timeout": settings.database.replica_connect_timeout}
+
+
+@lru_cache(maxsize=1)
+def get_replica_engines() -> tuple[Engine, ...]:
+    """Un Engine por réplica configurada, en el orden de ``replica_urls``."""
+    return tuple(
+        _create_engine(url, f"sync-replica-{index}", _replica_connect_args())
+        for index, url in enumerate(settings.database.replica_urls, start=1)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Retorna el AsyncEngine singleton usado en modo asíncrono."""
+    return _create_async_engine(validate_database_url())
+
+
+@lru_cache(maxsize=1)
+def get_async_replica_engines() -> tuple[AsyncEngine, ...]:
+    return tuple(
+        _create_async_engine(url, f"async-replica-{index}", _replica_connect_args())
+        for index, url in enumerate(settings.database.replica_urls, start=1)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Entrega una fábrica de sesiones asíncronas con la misma configuración."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
 def open_connection_pool() -> Engine:
     engine = get_engine()
 
@@ -56,6 +265,24 @@ def open_connection_pool() -> Engine:
 def close_connection_pool() -> None:
     engine = get_engine()
     engine.dispose()
+    for replica in get_replica_engines():
+        replica.dispose()
+
+
+async def open_async_connection_pool() -> AsyncEngine:
+    engine = get_async_engine()
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    return engine
+
+
+async def close_async_connection_pool() -> None:
+    engine = get_async_engine()
+    await engine.dispose()
+    for replica in get_async_replica_engines():
+        await replica.dispose()
 
 
 def get_db() -> Generator[Session]:
@@ -65,3 +292,36 @@ def get_db() -> Generator[Session]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession]:
+    session_factory = get_async_session_factory()
+    async with session_factory() as db:
+        yield db
+
+
+def get_repository_db() -> Generator[DbHandle]:
+    """Sesión o conexión para el repositorio, según ``database.execution``.
+
+    Ninguna de las dos toma una conexión del pool hasta la primera sentencia.
+    """
+    if not settings.database.uses_connections:
+        yield from get_db()
+        return
+    connection = LazyConnection(get_engine())
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+async def get_async_repository_db() -> AsyncGenerator[AsyncDbHandle]:
+    if not settings.database.uses_connections:
+        async with get_async_session_factory()() as session:
+            yield session
+        return
+    connection = AsyncLazyConnection(get_async_engine())
+    try:
+        yield connection
+    finally:
+        await connection.close()
@@ -7,3 +7,9 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
+
+
+def log_event(event: str, **fields: object) -> None:
+    """Línea ``evento clave=valor ...``; los campos van también en ``extra`` para un formatter."""
+    message = " ".join(f"{key}={value}" for key, value in fields.items())
+    logger.info("%s %s", event, message, extra={"event": event, "fields": fields})
@@ -0,0 +1,349 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Registro de métricas en formato de texto de Prometheus, sin dependencias. Cada hilo escribe
+# en su propia copia de las series (en asyncio es una sola) y ``/metrics`` suma las copias al
+# leer: el camino caliente no toma locks; solo se toma uno la primera vez que un hilo usa una
+# métrica. Una lectura concurrente puede ver una observación a medias, nunca perderla.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Segundos; del orden de una consulta por índice al de una exportación completa.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+type Labels = tuple[str, ...]
+type _Series = dict[Labels, list[float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: list[_Series] = []
+        self._shards_lock = threading.Lock()
+
+    def _series(self, labels: Labels, width: int) -> list[float]:
+        try:
+            shard: _Series = self._local.series
+        except AttributeError:
+            shard = self._local.series = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        values = shard.get(labels)
+        if values is None:
+            values = shard[labels] = [0.0] * width
+        return values
+
+    def _merged(self) -> dict[Labels, list[float]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: dict[Labels, list[float]] = {}
+        for shard in shards:
+            for labels, values in list(shard.items()):
+                total = merged.get(labels)
+                if total is None:
+                    merged[labels] = list(values)
+                else:
+                    for index, value in enumerate(values):
+                        total[index] += value
+        return merged
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        pass
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+
+class _ValueMetric(_Metric):
+    """Serie de un solo valor que se acumula en el registro o se lee al exportar.
+
+    ``set_function`` publica un valor que ya lleva otro componente (p. ej. las estadísticas
+    de la caché) sin duplicar la cuenta en el camino caliente.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._functions: dict[Labels, Callable[[], float]] = {}
+
+    def set_function(self, *labels: str, function: Callable[[], float]) -> None:
+        self._functions[labels] = function
+
+    def value(self, *labels: str) -> float:
+        function = self._functions.get(labels)
+        if function is not None:
+            return function()
+        values = self._merged().get(labels)
+        return 0.0 if values is None else values[0]
+
+    def _samples(self) -> Iterator[str]:
+        values = {labels: series[0] for labels, series in self._merged().items()}
+        for labels, function in self._functions.items():
+            values[labels] = function()
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Counter(_ValueMetric):
+    """Contador que se incrementa (``inc``) o se lee de un acumulado monótono (``set_function``)."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._series(labels, 1)[0] += amount
+
+
+class Gauge(_ValueMetric):
+    """Gauge que se mueve por deltas (``inc``/``dec``) o se calcula al leer (``set_function``)."""
+
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._series(labels, 1)[0] += amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._series(labels, 1)[0] -= amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        # Un contador por bucket más el de +Inf y la suma al final; se acumulan al leer.
+        series = self._series(labels, len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def _samples(self) -> Iterator[str]:
+        names = (*self.labelnames, "le")
+        for labels, series in sorted(self._merged().items()):
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), series[:-1], strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(names, (*labels, _format_value(bound)))
+                yield f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+            suffix = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{suffix} {_format_value(series[-1])}"
+            yield f"{self.name}_count{suffix} {_format_value(cumulative)}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register[M: _Metric](self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.render()) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(
+    Counter(
+        "http_requests_total", "Respuestas HTTP por ruta y código.", ("method", "route", "status")
+    )
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Duración de la petición hasta enviar el cuerpo completo.",
+        ("method", "route"),
+    )
+)
+USECASE_DURATION = registry.register(
+    Histogram("usecase_duration_seconds", "Duración de execute() por caso de uso.", ("usecase",))
+)
+POOL_SIZE = registry.register(Gauge("db_pool_size", "pool_size configurado del pool.", ("engine",)))
+POOL_MAX_OVERFLOW = registry.register(
+    Gauge("db_pool_max_overflow", "max_overflow configurado del pool.", ("engine",))
+)
+POOL_TIMEOUT = registry.register(
+    Gauge("db_pool_timeout_seconds", "pool_timeout configurado del pool.", ("engine",))
+)
+POOL_CONNECTIONS = registry.register(
+    Gauge("db_pool_connections", "Conexiones abiertas (en el pool y prestadas).", ("engine",))
+)
+POOL_CHECKED_OUT = registry.register(
+    Gauge("db_pool_checked_out", "Conexiones prestadas en este momento.", ("engine",))
+)
+POOL_OVERFLOW = registry.register(
+    Gauge("db_pool_overflow", "Conexiones abiertas por encima de pool_size.", ("engine",))
+)
+POOL_CHECKOUT_WAIT = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Espera por una conexión del pool, incluido el pre-ping.",
+        ("engine",),
+    )
+)
+POOL_HOLD = registry.register(
+    Histogram(
+        "db_pool_hold_seconds",
+        "Tiempo que una conexión pasa prestada, del checkout al checkin.",
+        ("engine",),
+    )
+)
+POOL_TIMEOUTS = registry.register(
+    Counter(
+        "db_pool_timeouts_total", "Esperas por conexión que superaron pool_timeout.", ("engine",)
+    )
+)
+
+CACHE_HITS = registry.register(
+    Counter("review_cache_hits_total", "Lecturas servidas por la caché de reseñas.", ("tier",))
+)
+CACHE_MISSES = registry.register(
+    Counter("review_cache_misses_total", "Lecturas que no estaban en ningún nivel de la caché.")
+)
+CACHE_EVICTIONS = registry.register(
+    Counter("review_cache_evictions_total", "Entradas desalojadas por el límite de la LRU.")
+)
+CACHE_INVALIDATIONS = registry.register(
+    Counter("review_cache_invalidations_total", "Etiquetas invalidadas por escrituras.")
+)
+CACHE_ENTRIES = registry.register(
+    Gauge("review_cache_entries", "Entradas en el nivel local de la caché.")
+)
+VOTE_BUFFER_DEPTH = registry.register(
+    Gauge("vote_buffer_depth", "Votos aceptados que esperan el próximo flush.")
+)
+VOTE_BUFFER_VOTES = registry.register(
+    Counter(
+        "vote_buffer_votes_total",
+        "Votos del buffer por resultado: enqueued, coalesced, rejected, flushed o dropped.",
+        ("outcome",),
+    )
+)
+VOTE_BUFFER_FLUSH = registry.register(
+    Histogram("vote_buffer_flush_seconds", "Duración de cada flush de un lote de votos.")
+)
+
+
+_CHECKED_OUT_AT = "metrics.checked_out_at"
+
+
+def observe_pool(
+    engine: Engine, label: str, *, pool_size: int, max_overflow: int, timeout: float
+) -> None:
+    """Mantiene los gauges del pool con sus eventos; ``label`` distingue el engine."""
+    POOL_SIZE.set_function(label, function=lambda: pool_size)
+    POOL_MAX_OVERFLOW.set_function(label, function=lambda: max_overflow)
+    POOL_TIMEOUT.set_function(label, function=lambda: timeout)
+    POOL_OVERFLOW.set_function(
+        label, function=lambda: max(POOL_CONNECTIONS.value(label) - pool_size, 0)
+    )
+
+    def on_connect(*_: Any) -> None:  # noqa: ANN401
+        POOL_CONNECTIONS.inc(label)
+
+    def on_close(*_: Any) -> None:  # noqa: ANN401
+        POOL_CONNECTIONS.dec(label)
+
+    def on_checkout(
+        dbapi_connection: Any,  # noqa: ANN401
+        record: ConnectionPoolEntry,
+        proxy: PoolProxiedConnection,
+    ) -> None:
+        POOL_CHECKED_OUT.inc(label)
+        record.info[_CHECKED_OUT_AT] = time.perf_counter()
+
+    def on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:  # noqa: ANN401
+        POOL_CHECKED_OUT.dec(label)
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            POOL_HOLD.observe(time.perf_counter() - checked_out_at, label)
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "close", on_close)
+    event.listen(engine, "close_detached", on_close)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def route_template(scope: Scope) -> str:
+    # Nunca la ruta concreta: cada id sería una serie nueva.
+    route = scope.get("route")
+    return str(getattr(route, "path", "unmatched"))
+
+
+class MetricsMiddleware:
+    """Cuenta cada respuesta y observa su duración por plantilla de ruta."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            method = scope["method"]
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method, route)
+            HTTP_REQUESTS.inc(method, route, str(status_code))
+
+
+async def metrics_endpoint() -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,36 @@
+from alembic import op
+from sqlalchemy import text
+
+from app.shared.infrastructure.logger import logger
+
+# Un CREATE INDEX CONCURRENTLY que falla (p. ej. por un duplicado al crear un índice único
+# o por un timeout) deja el índice creado pero marcado INVALID: no se usa en las consultas,
+# pero sí se mantiene en cada escritura, y ``IF NOT EXISTS`` lo da por existente. Antes de
+# crearlo se revisa ``pg_index.indisvalid`` y, si quedó inválido, se borra y se reconstruye.
+_INDEX_IS_VALID = text(
+    "SELECT i.indisvalid FROM pg_index AS i WHERE i.indexrelid = to_regclass(:name)"
+)
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: list[str],
+    *,
+    unique: bool = False,
+    postgresql_using: str | None = None,
+) -> None:
+    """``op.create_index`` con ``CONCURRENTLY``; debe llamarse dentro de ``autocommit_block``."""
+    valid = op.get_bind().execute(_INDEX_IS_VALID, {"name": name}).scalar()
+    if valid is False:
+        logger.warning("Index %s is INVALID from a failed build, rebuilding it", name)
+        op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+    op.create_index(
+        name,
+        table,
+        columns,
+        unique=unique,
+        postgresql_using=postgresql_using,
+        if_not_exists=True,
+        postgresql_concurrently=True,
+    )
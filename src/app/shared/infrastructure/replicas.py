@@ -0,0 +1,158 @@
+import itertools
+import math
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache, partial
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.shared.infrastructure.database import (
+    AsyncDbHandle,
+    AsyncLazyConnection,
+    DbHandle,
+    LazyConnection,
+    get_async_replica_engines,
+    get_replica_engines,
+)
+from app.shared.infrastructure.logger import log_event
+from app.shared.infrastructure.settings import settings
+
+# Solo GET y HEAD leen de una réplica. En una petición que escribe, sus lecturas (la
+# existencia de la reseña, el ETag del If-Match) son parte de la escritura y van al primario.
+_REPLICA_METHODS = frozenset({"GET", "HEAD"})
+
+# Instante (epoch) hasta el que las lecturas del cliente van al primario. Viaja en una cookie
+# y no en memoria del proceso para que valga con varios workers o réplicas de la app.
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+
+
+@dataclass(slots=True, frozen=True)
+class ReplicaLease[T]:
+    """Algo atado a una réplica (su sesión o un repositorio) y cómo reportarla caída."""
+
+    value: T
+    mark_down: Callable[[], None]
+
+
+class ReplicaSet[S]:
+    """Reparte sesiones o conexiones entre réplicas en round-robin, saltando las que fallaron.
+
+    Una réplica que falla queda fuera ``retry_seconds``; después vuelve a la rotación y la
+    siguiente lectura sirve de chequeo. Sin réplicas sanas ``lease`` retorna ``None`` y la
+    petición lee del primario.
+    """
+
+    def __init__(
+        self,
+        factories: Sequence[Callable[[], S]],
+        *,
+        names: Sequence[str],
+        retry_seconds: float,
+    ) -> None:
+        self._factories = list(factories)
+        self._names = list(names)
+        self._retry_seconds = retry_seconds
+        self._down_until = [0.0] * len(self._factories)
+        self._turns = itertools.count()
+
+    def lease(self) -> ReplicaLease[S] | None:
+        now = time.monotonic()
+        for _ in self._factories:
+            index = next(self._turns) % len(self._factories)
+            if self._down_until[index] <= now:
+                return ReplicaLease(self._factories[index](), partial(self._mark_down, index))
+        return None
+
+    def _mark_down(self, index: int) -> None:
+        self._down_until[index] = time.monotonic() + self._retry_seconds
+        log_event("replica_down", replica=self._names[index], retry_seconds=self._retry_seconds)
+
+
+@lru_cache(maxsize=1)
+def get_replica_set() -> ReplicaSet[DbHandle] | None:
+    engines = get_replica_engines()
+    if not engines:
+        return None
+    factories: list[Callable[[], DbHandle]] = [
+        partial(LazyConnection, engine)
+        if settings.database.uses_connections
+        else sessionmaker(bind=engine, class_=Session, autoflush=False, expire_on_commit=False)
+        for engine in engines
+    ]
+    return ReplicaSet(
+        factories,
+        names=[str(engine.pool.logging_name) for engine in engines],
+        retry_seconds=settings.database.replica_retry_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_replica_set() -> ReplicaSet[AsyncDbHandle] | None:
+    engines = get_async_replica_engines()
+    if not engines:
+        return None
+    factories: list[Callable[[], AsyncDbHandle]] = [
+        partial(AsyncLazyConnection, engine)
+        if settings.database.uses_connections
+        else async_sessionmaker(
+            bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+        for engine in engines
+    ]
+    return ReplicaSet(
+        factories,
+        names=[str(engine.sync_engine.pool.logging_name) for engine in engines],
+        retry_seconds=settings.database.replica_retry_seconds,
+    )
+
+
+def replica_allowed(request: Request) -> bool:
+    """Si la petición puede leer de una réplica: es de lectura y no cae en read-your-writes."""
+    if request.method not in _REPLICA_METHODS:
+        return False
+    raw = request.cookies.get(PRIMARY_UNTIL_COOKIE)
+    if raw is None:
+        return True
+    try:
+        return time.time() >= float(raw)
+    except ValueError:
+        return True
+
+
+def pin_reads_to_primary(response: Response) -> None:
+    """Abre la ventana read-your-writes del cliente que acaba de escribir."""
+    window = settings.database.read_your_writes_seconds
+    if window <= 0:
+        return
+    response.set_cookie(
+        PRIMARY_UNTIL_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=math.ceil(window),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def get_replica_db(request: Request) -> Generator[ReplicaLease[DbHandle] | None]:
+    replicas = get_replica_set()
+    lease = replicas.lease() if replicas is not None and replica_allowed(request) else None
+    try:
+        yield lease
+    finally:
+        if lease is not None:
+            lease.value.close()
+
+
+async def get_async_replica_db(
+    request: Request,
+) -> AsyncGenerator[ReplicaLease[AsyncDbHandle] | None]:
+    replicas = get_async_replica_set()
+    lease = replicas.lease() if replicas is not None and replica_allowed(request) else None
+    try:
+        yield lease
+    finally:
+        if lease is not None:
+            await lease.value.close()
@@ -0,0 +1,216 @@
+import logging
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+    QueuePool,
+)
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.infrastructure.logger import log_event
+from app.shared.infrastructure.metrics import POOL_CHECKOUT_WAIT, POOL_TIMEOUTS
+
+# Con la instrumentación apagada no se registra ningún listener, el pool es el de siempre y
+# no hay middleware: el costo es cero. Encendida, fuera de una petición (CLI, tareas en
+# segundo plano) cada hook se reduce a leer una ContextVar vacía.
+
+_QUERY_STARTED = "_request_timing_started"
+_CHECKOUT = "request_timing.checkout"
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """Acumulado de base de datos de una petición.
+
+    Es mutable a propósito: la ContextVar se copia al threadpool y a los greenlets de
+    SQLAlchemy, pero todas las copias apuntan a este mismo objeto.
+    """
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    pool_hold_seconds: float = 0.0
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def _timed_checkout(
+    connect: Callable[[], PoolProxiedConnection], engine: str
+) -> PoolProxiedConnection:
+    started = time.perf_counter()
+    try:
+        return connect()
+    except exc.TimeoutError:
+        POOL_TIMEOUTS.inc(engine)
+        raise
+    finally:
+        waited = time.perf_counter() - started
+        POOL_CHECKOUT_WAIT.observe(waited, engine)
+        timing = _current.get()
+        if timing is not None:
+            timing.pool_wait_seconds += waited
+
+
+class TimedQueuePool(QueuePool):
+    """``QueuePool`` que mide la espera por una conexión y cuenta los ``pool_timeout``.
+
+    La espera se suma a la petición en curso y a ``db_pool_checkout_wait_seconds``: SQLAlchemy
+    no tiene un evento previo al checkout que permita medirla desde fuera.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        return _timed_checkout(super().connect, self.logging_name or "sync")
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Par de ``TimedQueuePool`` para el ``AsyncEngine``."""
+
+    def connect(self) -> PoolProxiedConnection:
+        return _timed_checkout(super().connect, self.logging_name or "async")
+
+
+# SQLAlchemy nombra el logger de cada pool según el módulo de su clase y solo silencia los
+# que cuelgan de "sqlalchemy"; sin esto cada dispose del pool saldría en INFO.
+for _pool_class in (TimedQueuePool, TimedAsyncAdaptedQueuePool):
+    logging.getLogger(f"{__name__}.{_pool_class.__name__}").setLevel(logging.WARNING)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    # El inicio viaja en el ExecutionContext de la sentencia: si falla, se descarta con ella
+    # en vez de quedar apilado en la conexión.
+    if context is not None and _current.get() is not None:
+        setattr(context, _QUERY_STARTED, time.perf_counter())
+
+
+def _record_query(context: ExecutionContext | None) -> None:
+    timing = _current.get()
+    started: float | None = getattr(context, _QUERY_STARTED, None)
+    if timing is None or started is None:
+        return
+    delattr(context, _QUERY_STARTED)
+    timing.queries += 1
+    timing.db_seconds += time.perf_counter() - started
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    _record_query(context)
+
+
+def _on_error(exception_context: ExceptionContext) -> None:
+    # Una sentencia que falla (p. ej. la FK que se traduce a 404) también ocupó la base.
+    _record_query(exception_context.execution_context)
+
+
+def _on_checkout(
+    dbapi_connection: Any,  # noqa: ANN401
+    record: ConnectionPoolEntry,
+    proxy: PoolProxiedConnection,
+) -> None:
+    # La petición viaja con la conexión: el checkin puede correr fuera de su contexto.
+    timing = _current.get()
+    if timing is not None:
+        record.info[_CHECKOUT] = (time.perf_counter(), timing)
+
+
+def _on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:  # noqa: ANN401
+    checkout = record.info.pop(_CHECKOUT, None)
+    if checkout is not None:
+        checked_out_at, timing = checkout
+        timing.pool_hold_seconds += time.perf_counter() - checked_out_at
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Cronometra cada sentencia y cuánto retiene la petición cada conexión del pool.
+
+    Para un ``AsyncEngine`` se pasa ``sync_engine``.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _on_error)
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}"
+
+
+def server_timing(timing: RequestTiming, elapsed_seconds: float) -> str:
+    return (
+        f'db;dur={_ms(timing.db_seconds)};desc="{timing.queries} queries", '
+        f"pool;dur={_ms(timing.pool_wait_seconds)}, "
+        f"hold;dur={_ms(timing.pool_hold_seconds)}, "
+        f"app;dur={_ms(elapsed_seconds)}"
+    )
+
+
+class RequestTimingMiddleware:
+    """Publica lo acumulado en ``Server-Timing`` y en una línea de log por petición.
+
+    La cabecera refleja el trabajo hecho antes de responder; el log se escribe cuando termina
+    el cuerpo e incluye también las consultas de las respuestas en streaming (exportación).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing", server_timing(timing, time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            log_event(
+                "request",
+                method=scope["method"],
+                route=getattr(route, "path", scope["path"]),
+                status=status_code,
+                duration_ms=_ms(time.perf_counter() - started),
+                db_queries=timing.queries,
+                db_ms=_ms(timing.db_seconds),
+                pool_wait_ms=_ms(timing.pool_wait_seconds),
+                pool_hold_ms=_ms(timing.pool_hold_seconds),
+            )
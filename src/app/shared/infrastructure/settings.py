@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, StrEnum
 from functools import lru_cache
 
 from pydantic import (
@@ -17,6 +17,26 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+class DatabaseMode(StrEnum):
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class DatabaseBackend(Enum):
+    POSTGRES = "postgres"
+    MEMORY = "memory"
+
+
+class DatabaseExecution(Enum):
+    SESSION = "session"
+    CONNECTION = "connection"
+
+
+class SharedCacheBackend(Enum):
+    NONE = "none"
+    MEMORY = "memory"
+
+
 class AppSettings(BaseModel):
     name: str = Field(default="Arrendamos")
     version: str = Field(default="0.1.0")
@@ -79,6 +99,77 @@ class DatabaseSettings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("DATABASE_ECHO", "DATABASE__ECHO"),
     )
+    mode: DatabaseMode = Field(
+        default=DatabaseMode.SYNC,
+        validation_alias=AliasChoices("DATABASE_MODE", "DATABASE__MODE"),
+    )
+    # ``memory`` sirve las rutas desde un repositorio en memoria, sin abrir el pool.
+    backend: DatabaseBackend = Field(
+        default=DatabaseBackend.POSTGRES,
+        validation_alias=AliasChoices("DATABASE_BACKEND", "DATABASE__BACKEND"),
+    )
+    # Lo que recibe el repositorio Postgres por petición: una ``Session`` del ORM o una
+    # ``Connection`` del engine. El repositorio es solo Core, así que la sesión no le aporta
+    # nada; ``connection`` se ahorra su estado (identity map, unit of work, eventos).
+    execution: DatabaseExecution = Field(
+        default=DatabaseExecution.SESSION,
+        validation_alias=AliasChoices("DATABASE_EXECUTION", "DATABASE__EXECUTION"),
+    )
+
+    # Sentencias preparadas en el servidor (solo psycopg3): una consulta se prepara al llegar a
+    # ``prepare_threshold`` ejecuciones en la misma conexión; 0 la prepara desde la primera.
+    # Se apagan detrás de un PgBouncer en modo transacción.
+    prepared_statements: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "DATABASE_PREPARED_STATEMENTS", "DATABASE__PREPARED_STATEMENTS"
+        ),
+    )
+    prepare_threshold: int = Field(
+        default=5,
+        ge=0,
+        validation_alias=AliasChoices("DATABASE_PREPARE_THRESHOLD", "DATABASE__PREPARE_THRESHOLD"),
+    )
+    # Réplicas de lectura como lista JSON; vacía, todo va al primario.
+    replica_urls: list[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("DATABASE_REPLICA_URLS", "DATABASE__REPLICA_URLS"),
+    )
+    # Tras una escritura, las lecturas del mismo cliente van al primario durante esta ventana.
+    read_your_writes_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_READ_YOUR_WRITES_SECONDS", "DATABASE__READ_YOUR_WRITES_SECONDS"
+        ),
+    )
+    # Una réplica que falla queda fuera de la rotación este tiempo antes de reintentarla.
+    replica_retry_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_RETRY_SECONDS", "DATABASE__REPLICA_RETRY_SECONDS"
+        ),
+    )
+    replica_connect_timeout: int = Field(
+        default=2,
+        ge=1,
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_CONNECT_TIMEOUT", "DATABASE__REPLICA_CONNECT_TIMEOUT"
+        ),
+    )
+
+    @property
+    def is_async(self) -> bool:
+        return self.mode is DatabaseMode.ASYNC
+
+    @property
+    def in_memory(self) -> bool:
+        return self.backend is DatabaseBackend.MEMORY
+
+    @property
+    def uses_connections(self) -> bool:
+        return self.execution is DatabaseExecution.CONNECTION
 
 
 class CorsSettings(BaseModel):
@@ -88,6 +179,36 @@ class CorsSettings(BaseModel):
     allow_headers: list[str] = Field(default_factory=lambda: ["*"])
 
 
+class CacheSettings(BaseModel):
+    enabled: bool = Field(default=False)
+    ttl_seconds: float = Field(default=30.0, gt=0)
+    max_entries: int = Field(default=10_000, ge=1)
+    # Nivel compartido detrás de la LRU local; "memory" es InMemorySharedCache.
+    shared: SharedCacheBackend = Field(default=SharedCacheBackend.NONE)
+
+
+class VoteBufferSettings(BaseModel):
+    enabled: bool = Field(default=False)
+    flush_interval_ms: int = Field(default=100, ge=1)
+    max_batch: int = Field(default=500, ge=1)
+    max_pending: int = Field(default=10_000, ge=1)
+
+
+class SerializationSettings(BaseModel):
+    # Serializa los DTO del router de reseñas sin pasar por los modelos de respuesta.
+    fast: bool = Field(default=False)
+
+
+class TimingSettings(BaseModel):
+    # Server-Timing y log por petición con consultas, tiempo en la base y espera del pool.
+    enabled: bool = Field(default=False)
+
+
+class MetricsSettings(BaseModel):
+    # /metrics en formato Prometheus: latencia por ruta, pool y duración de casos de uso.
+    enabled: bool = Field(default=False)
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=(".env", ".env.prod"),
@@ -107,6 +228,11 @@ class Settings(BaseSettings):
     app: AppSettings = Field(default_factory=AppSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     cors: CorsSettings = Field(default_factory=CorsSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    vote_buffer: VoteBufferSettings = Field(default_factory=VoteBufferSettings)
+    serialization: SerializationSettings = Field(default_factory=SerializationSettings)
+    timing: TimingSettings = Field(default_factory=TimingSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
     @property
     def is_production(self) -> bool:
@@ -0,0 +1,6 @@
+import os
+
+# La configuración se lee al importar la app: las pruebas corren en modo asíncrono sobre el
+# repositorio en memoria, sin base de datos.
+os.environ.setdefault("DATABASE_BACKEND", "memory")
+os.environ.setdefault("DATABASE_MODE", "async")
@@ -0,0 +1,67 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+from uuid import UUID, uuid4
+
+import anyio.to_thread
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+PREFIX = "/api/v1/reviews"
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def threadpool_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    # ``run_in_threadpool`` de Starlette (y así FastAPI) termina en ``anyio.to_thread``.
+    calls: list[str] = []
+    run_sync = anyio.to_thread.run_sync
+
+    async def counting_run_sync(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        calls.append(getattr(func, "__qualname__", repr(func)))
+        return await run_sync(func, *args, **kwargs)
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", counting_run_sync)
+    return calls
+
+
+def _create_review(client: TestClient, record_id: UUID) -> str:
+    response = client.post(
+        f"{PREFIX}/",
+        json={
+            "record_id": str(record_id),
+            "user_id": str(uuid4()),
+            "rent_amount": "1200.00",
+            "review_text": "Luminosa y tranquila",
+            "rating": 4,
+        },
+    )
+    assert response.status_code == 201, response.text
+    review_id: str = response.json()["id"]
+    return review_id
+
+
+def test_async_routes_do_not_use_the_threadpool(
+    client: TestClient, threadpool_calls: list[str]
+) -> None:
+    record_id = uuid4()
+    review_id = _create_review(client, record_id)
+
+    responses = [
+        client.get(f"{PREFIX}/record/{record_id}", params={"expand": "images,votes"}),
+        client.get(f"{PREFIX}/{review_id}"),
+        client.get(f"{PREFIX}/search", params={"q": "tranquila"}),
+        client.get(f"{PREFIX}/record/{record_id}/stats"),
+        client.post(f"{PREFIX}:batchGet", json={"ids": [review_id]}),
+        client.put(f"{PREFIX}/{review_id}", json={"rating": 5}),
+        client.post(f"{PREFIX}/{review_id}/votes", json={"user_id": str(uuid4()), "useful": True}),
+    ]
+
+    assert all(response.is_success for response in responses), [r.text for r in responses]
+    assert threadpool_calls == []
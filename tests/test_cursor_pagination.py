@@ -0,0 +1,123 @@
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.features.reviews.application.pagination import decode_cursor, encode_cursor
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.exceptions import InvalidCursorError
+from app.features.reviews.domain.pagination import PageCursor
+from app.features.reviews.infrastructure.memory_repository import InMemoryReviewRepository
+from app.main import app
+
+PREFIX = "/api/v1/reviews"
+# Todas las reseñas en el mismo instante: el orden y los cortes dependen solo del id.
+SAME_INSTANT = "2024-03-01T10:00:00"
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+def _import_tied_reviews(client: TestClient, record_id: str, count: int) -> None:
+    lines = [
+        json.dumps(
+            {
+                "record_id": record_id,
+                "user_id": str(uuid4()),
+                "review_text": f"Reseña {index}",
+                "rating": 1 + index % 5,
+                "created_at": SAME_INSTANT,
+            }
+        )
+        for index in range(count)
+    ]
+    response = client.post(f"{PREFIX}/import", content="\n".join(lines))
+    assert response.json()["imported"] == count, response.text
+
+
+def _walk(client: TestClient, url: str, limit: int) -> list[list[str]]:
+    pages: list[list[str]] = []
+    params: dict[str, str | int] = {"limit": limit}
+    while True:
+        response = client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        pages.append([item["id"] for item in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+        params = {"limit": limit, "cursor": cursor}
+
+
+def test_cursor_round_trips() -> None:
+    cursor = PageCursor(created_at=datetime(2024, 3, 1, 10, 0, 0, 123456), id=uuid4())
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "no-es-base64!", "MjAyNC0wMy0wMQ"])
+def test_malformed_cursor_is_rejected(token: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_malformed_cursor_is_a_400(client: TestClient) -> None:
+    response = client.get(f"{PREFIX}/record/{uuid4()}", params={"cursor": "no-es-base64!"})
+
+    assert response.status_code == 400
+
+
+def test_pages_break_ties_on_created_at_by_id(client: TestClient) -> None:
+    record_id = str(uuid4())
+    _import_tied_reviews(client, record_id, 7)
+
+    pages = _walk(client, f"{PREFIX}/record/{record_id}", limit=3)
+    ids = [review_id for page in pages for review_id in page]
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert ids == sorted(ids, key=UUID, reverse=True)
+
+
+def test_cursor_ignores_offset(client: TestClient) -> None:
+    record_id = str(uuid4())
+    _import_tied_reviews(client, record_id, 4)
+    first = client.get(f"{PREFIX}/record/{record_id}", params={"limit": 2})
+    cursor = first.headers["x-next-cursor"]
+
+    with_offset = client.get(
+        f"{PREFIX}/record/{record_id}", params={"limit": 2, "cursor": cursor, "offset": 3}
+    )
+    without_offset = client.get(
+        f"{PREFIX}/record/{record_id}", params={"limit": 2, "cursor": cursor}
+    )
+
+    assert with_offset.json() == without_offset.json()
+    assert len(with_offset.json()) == 2
+
+
+def test_comment_pages_break_ties_by_id() -> None:
+    repository = InMemoryReviewRepository()
+    review = repository.create_review(
+        Review(record_id=uuid4(), user_id=uuid4(), rent_amount=None, review_text="x", rating=3)
+    )
+    instant = datetime.fromisoformat(SAME_INSTANT)
+    for index in range(5):
+        repository.add_comment(
+            ReviewComment(
+                review_id=review.id, user_id=uuid4(), comment_text=str(index), created_at=instant
+            )
+        )
+
+    first = repository.list_comments(review.id, limit=2)
+    after = PageCursor(created_at=first[-1].created_at, id=first[-1].id)
+    rest = repository.list_comments(review.id, limit=10, after=after)
+    ids = [comment.id for comment in [*first, *rest]]
+
+    assert len(ids) == len(set(ids)) == 5
+    assert ids == sorted(ids, reverse=True)
@@ -0,0 +1,131 @@
+from collections.abc import Callable, Iterator
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from app.main import app
+
+PREFIX = "/api/v1/reviews"
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+def _create_review(client: TestClient, record_id: str) -> str:
+    response = client.post(
+        f"{PREFIX}/",
+        json={
+            "record_id": record_id,
+            "user_id": str(uuid4()),
+            "rent_amount": "800.00",
+            "review_text": "Buena luz",
+            "rating": 4,
+        },
+    )
+    assert response.status_code == 201, response.text
+    review_id: str = response.json()["id"]
+    return review_id
+
+
+# (ruta del GET, escritura que cambia su contenido) a partir de (record_id, review_id).
+RESOURCES: dict[str, tuple[str, Callable[[TestClient, str, str], Response]]] = {
+    "review": (
+        "/{review}",
+        lambda client, _, review: client.put(f"{PREFIX}/{review}", json={"rating": 2}),
+    ),
+    "record_reviews": (
+        "/record/{record}?limit=5",
+        lambda client, record, _: client.post(
+            f"{PREFIX}/",
+            json={
+                "record_id": record,
+                "user_id": str(uuid4()),
+                "review_text": "Otra",
+                "rating": 3,
+            },
+        ),
+    ),
+    "images": (
+        "/{review}/images",
+        lambda client, _, review: client.post(
+            f"{PREFIX}/{review}/images", json={"image_url": "https://img.example.com/a.jpg"}
+        ),
+    ),
+    "comments": (
+        "/{review}/comments?limit=5",
+        lambda client, _, review: client.post(
+            f"{PREFIX}/{review}/comments", json={"user_id": str(uuid4()), "comment_text": "Sí"}
+        ),
+    ),
+    "votes": (
+        "/{review}/votes/summary",
+        lambda client, _, review: client.post(
+            f"{PREFIX}/{review}/votes", json={"user_id": str(uuid4()), "useful": True}
+        ),
+    ),
+}
+
+
+@pytest.mark.parametrize("resource", RESOURCES)
+def test_if_none_match_returns_304_until_a_write(client: TestClient, resource: str) -> None:
+    path, write = RESOURCES[resource]
+    record_id = str(uuid4())
+    review_id = _create_review(client, record_id)
+    url = PREFIX + path.format(record=record_id, review=review_id)
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+    cached = client.get(url, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    assert write(client, record_id, review_id).is_success
+    changed = client.get(url, headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json() != first.json()
+
+
+def test_if_none_match_uses_weak_comparison(client: TestClient) -> None:
+    review_id = _create_review(client, str(uuid4()))
+    etag = client.get(f"{PREFIX}/{review_id}").headers["etag"]
+
+    for header in (etag.removeprefix("W/"), f'"otro", {etag}', "*"):
+        response = client.get(f"{PREFIX}/{review_id}", headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+
+
+def test_pagination_parameters_are_part_of_the_etag(client: TestClient) -> None:
+    record_id = str(uuid4())
+    for _ in range(3):
+        _create_review(client, record_id)
+
+    first = client.get(f"{PREFIX}/record/{record_id}", params={"limit": 2})
+    second = client.get(
+        f"{PREFIX}/record/{record_id}",
+        params={"limit": 2, "cursor": first.headers["x-next-cursor"]},
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_expanded_listing_has_no_etag(client: TestClient) -> None:
+    record_id = str(uuid4())
+    _create_review(client, record_id)
+
+    response = client.get(f"{PREFIX}/record/{record_id}", params={"expand": "votes"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
@@ -0,0 +1,135 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.features.reviews.application.dtos.import_report_dto import ImportReportDTO
+from app.features.reviews.application.usecases import import_reviews
+from app.features.reviews.application.usecases.import_reviews import (
+    MAX_IMPORT_LINE_BYTES,
+    AsyncImportReviewsUseCase,
+    ImportReviewsUseCase,
+)
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.infrastructure.memory_repository import (
+    AsyncInMemoryReviewRepository,
+    InMemoryReviewRepository,
+)
+
+RECORD_ID = uuid4()
+
+
+class _KnownRecordsRepository(InMemoryReviewRepository):
+    """En memoria toda vivienda existe; aquí solo ``RECORD_ID``, como la FK de Postgres."""
+
+    def import_reviews(self, reviews: Sequence[Review]) -> dict[UUID, ImportRejection]:
+        known = [review for review in reviews if review.record_id == RECORD_ID]
+        rejected = super().import_reviews(known)
+        for review in reviews:
+            if review.record_id != RECORD_ID:
+                rejected[review.id] = ImportRejection.UNKNOWN_RECORD
+        return rejected
+
+
+def _row(**overrides: Any) -> str:  # noqa: ANN401
+    row = {
+        "record_id": str(RECORD_ID),
+        "user_id": str(uuid4()),
+        "review_text": "Buen barrio",
+        "rating": 4,
+        "rent_amount": "1500.50",
+    }
+    row.update(overrides)
+    return json.dumps(row)
+
+
+def _errors(report: ImportReportDTO) -> dict[int, str]:
+    return {error.line: error.error for error in report.errors}
+
+
+def test_each_invalid_row_is_reported_on_its_line() -> None:
+    duplicated_user = str(uuid4())
+    lines = [
+        _row(user_id=duplicated_user),
+        "",
+        "{no es json",
+        _row(rating=9),
+        _row(review_text=None),
+        _row(rent_amount="99999999.995"),
+        _row(rent_amount=1e12),
+        _row(review_text="a\u0000b"),
+        "[1, 2]",
+        _row(user_id=duplicated_user),
+        _row(record_id=str(uuid4())),
+        _row(review_text="x" * (MAX_IMPORT_LINE_BYTES + 1)),
+        _row(),
+    ]
+
+    report = ImportReviewsUseCase(_KnownRecordsRepository(), batch_size=3).execute(lines)
+
+    assert (report.received, report.imported, report.failed) == (12, 2, 10)
+    assert _errors(report) == {
+        3: _errors(report)[3],  # mensaje del parser JSON
+        4: "Rating must be between 1 and 5",
+        5: "Missing field review_text",
+        6: "rent_amount must have at most 2 decimal places",
+        7: "rent_amount must be below 100000000",
+        8: "review_text must not contain NUL characters",
+        9: "Row must be a JSON object",
+        10: "User already submitted a review for this record",
+        11: "Record does not exist",
+        12: f"Row must not exceed {MAX_IMPORT_LINE_BYTES} bytes",
+    }
+
+
+def test_rows_already_stored_are_reported_as_duplicates() -> None:
+    repository = InMemoryReviewRepository()
+    user_id = str(uuid4())
+    ImportReviewsUseCase(repository).execute([_row(user_id=user_id)])
+
+    report = ImportReviewsUseCase(repository).execute([_row(), _row(user_id=user_id)])
+
+    assert report.imported == 1
+    assert _errors(report) == {2: "User already submitted a review for this record"}
+
+
+def test_reported_errors_are_capped_but_all_are_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(import_reviews, "MAX_REPORTED_ERRORS", 3)
+
+    report = ImportReviewsUseCase(InMemoryReviewRepository()).execute(["[]"] * 10)
+
+    assert report.failed == 10
+    assert [error.line for error in report.errors] == [1, 2, 3]
+
+
+def test_created_at_with_offset_is_stored_as_naive_utc() -> None:
+    repository = InMemoryReviewRepository()
+
+    ImportReviewsUseCase(repository).execute([_row(created_at="2024-05-01T10:00:00-03:00")])
+
+    (stored,) = repository.list_reviews_for_record(RECORD_ID, limit=1)
+    assert stored.created_at == datetime(2024, 5, 1, 13, 0, 0)
+    assert stored.rent_amount is not None and str(stored.rent_amount) == "1500.50"
+
+
+def test_async_use_case_reports_the_same_rows() -> None:
+    lines = [_row(), "{", _row(rating=0), "", _row(rent_amount="1.234")]
+
+    async def stream() -> AsyncIterator[str]:
+        for line in lines:
+            yield line
+
+    sync_report = ImportReviewsUseCase(InMemoryReviewRepository()).execute(lines)
+    async_report = asyncio.run(
+        AsyncImportReviewsUseCase(
+            AsyncInMemoryReviewRepository(InMemoryReviewRepository())
+        ).execute(stream())
+    )
+
+    assert async_report.errors == sync_report.errors
+    assert (async_report.received, async_report.imported, async_report.failed) == (4, 1, 3)
@@ -0,0 +1,195 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.exceptions import ReviewAlreadyExistsError, ReviewNotFoundError
+from app.features.reviews.domain.filters import ReviewFilter
+from app.features.reviews.domain.imports import ImportRejection
+from app.features.reviews.domain.pagination import PageCursor
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.domain.vote_queue import VoteBatchResult
+from app.features.reviews.infrastructure.memory_repository import (
+    AsyncInMemoryReviewRepository,
+    InMemoryReviewRepository,
+)
+
+# Las 12:00 en UTC-3 son las 15:00 UTC, que es como quedan en la columna TIMESTAMP.
+UTC_MINUS_3 = timezone(timedelta(hours=-3))
+
+
+def _review(
+    record_id: UUID,
+    *,
+    rating: int = 3,
+    rent_amount: Decimal | None = None,
+    created_at: datetime | None = None,
+) -> Review:
+    return Review(
+        record_id=record_id,
+        user_id=uuid4(),
+        rent_amount=rent_amount,
+        review_text="Cerca del metro",
+        rating=rating,
+        created_at=created_at or datetime.now(),
+    )
+
+
+@pytest.fixture
+def repository() -> InMemoryReviewRepository:
+    return InMemoryReviewRepository()
+
+
+def test_one_review_per_user_and_record(repository: InMemoryReviewRepository) -> None:
+    review = repository.create_review(_review(uuid4()))
+    again = Review(
+        record_id=review.record_id,
+        user_id=review.user_id,
+        rent_amount=None,
+        review_text="Otra vez",
+        rating=1,
+    )
+
+    with pytest.raises(ReviewAlreadyExistsError):
+        repository.create_review(again)
+    assert repository.import_reviews([again]) == {again.id: ImportRejection.DUPLICATE}
+    assert repository.get_record_stats(review.record_id).review_count == 1
+
+
+# Como en Postgres: las lecturas de una reseña inexistente no encuentran nada y las
+# escrituras, o los listados de sus hijos, fallan con ReviewNotFoundError.
+MISSING_REVIEW_CALLS: dict[str, Callable[[InMemoryReviewRepository, UUID], object]] = {
+    "update_review": lambda repo, missing: repo.update_review(missing, rating=2),
+    "delete_review": lambda repo, missing: repo.delete_review(missing),
+    "add_image": lambda repo, missing: repo.add_image(
+        ReviewImage(review_id=missing, image_url="https://img.example.com/1.jpg")
+    ),
+    "list_images": lambda repo, missing: repo.list_images(missing),
+    "add_comment": lambda repo, missing: repo.add_comment(
+        ReviewComment(review_id=missing, user_id=uuid4(), comment_text="Hola")
+    ),
+    "list_comments": lambda repo, missing: repo.list_comments(missing, limit=1),
+    "upsert_vote": lambda repo, missing: repo.upsert_vote(
+        ReviewVote(review_id=missing, user_id=uuid4(), useful=True)
+    ),
+    "get_votes_summary": lambda repo, missing: repo.get_votes_summary(missing),
+}
+
+
+@pytest.mark.parametrize("call", MISSING_REVIEW_CALLS)
+def test_missing_review_is_not_found(repository: InMemoryReviewRepository, call: str) -> None:
+    with pytest.raises(ReviewNotFoundError):
+        MISSING_REVIEW_CALLS[call](repository, uuid4())
+
+
+def test_missing_review_reads_return_nothing(repository: InMemoryReviewRepository) -> None:
+    missing = uuid4()
+
+    assert repository.get_review(missing) is None
+    assert repository.get_reviews([missing]) == {}
+    assert repository.get_version(VersionedResource.REVIEW, missing) is None
+
+
+def test_votes_are_idempotent_and_a_change_moves_the_count(
+    repository: InMemoryReviewRepository,
+) -> None:
+    review = repository.create_review(_review(uuid4()))
+    user_id = uuid4()
+
+    first = repository.upsert_vote(ReviewVote(review_id=review.id, user_id=user_id, useful=True))
+    repeated = repository.upsert_vote(ReviewVote(review_id=review.id, user_id=user_id, useful=True))
+    assert repository.get_votes_summary(review.id) == (1, 0)
+
+    flipped = repository.upsert_vote(ReviewVote(review_id=review.id, user_id=user_id, useful=False))
+    assert repository.get_votes_summary(review.id) == (0, 1)
+    assert first.id == repeated.id == flipped.id
+    assert first.created_at == flipped.created_at
+
+
+def test_vote_batches_skip_missing_reviews(repository: InMemoryReviewRepository) -> None:
+    review = repository.create_review(_review(uuid4()))
+    user_id = uuid4()
+    votes = [
+        ReviewVote(review_id=review.id, user_id=user_id, useful=True),
+        ReviewVote(review_id=review.id, user_id=user_id, useful=True),
+        ReviewVote(review_id=review.id, user_id=uuid4(), useful=False),
+        ReviewVote(review_id=uuid4(), user_id=uuid4(), useful=True),
+    ]
+
+    assert repository.upsert_votes(votes) == VoteBatchResult(changed=2, skipped=1)
+    assert repository.get_votes_summary(review.id) == (1, 1)
+
+
+def test_rent_is_stored_with_two_decimals(repository: InMemoryReviewRepository) -> None:
+    review = repository.create_review(_review(uuid4(), rent_amount=Decimal("1500.5")))
+    updated = repository.update_review(review.id, rent_amount=Decimal(900))
+
+    assert str(review.rent_amount) == "1500.50"
+    assert str(updated.rent_amount) == "900.00"
+
+
+def test_record_stats_follow_every_write(repository: InMemoryReviewRepository) -> None:
+    record_id = uuid4()
+    kept = repository.create_review(_review(record_id, rating=5, rent_amount=Decimal(1000)))
+    removed = repository.create_review(_review(record_id, rating=1))
+    repository.update_review(kept.id, rating=4, rent_amount=Decimal(1200))
+    repository.delete_review(removed.id)
+
+    stats = repository.get_record_stats(record_id)
+
+    assert (stats.review_count, stats.rating_total) == (1, 4)
+    assert stats.rating_histogram == {1: 0, 2: 0, 3: 0, 4: 1, 5: 0}
+    assert (stats.rent_count, stats.average_rent) == (1, Decimal("1200.00"))
+    assert repository.get_record_stats(uuid4()).review_count == 0
+
+
+def test_aware_filters_and_cursors_compare_in_utc(repository: InMemoryReviewRepository) -> None:
+    record_id = uuid4()
+    # Guardadas sin zona, en UTC: 14:00, 15:00 y 16:00.
+    reviews = [
+        repository.create_review(_review(record_id, created_at=datetime(2024, 5, 1, hour)))
+        for hour in (14, 15, 16)
+    ]
+    noon = datetime(2024, 5, 1, 12, tzinfo=UTC_MINUS_3)
+
+    exported = [
+        expanded.review
+        for batch in repository.stream_reviews(
+            ReviewFilter(
+                record_id=record_id, created_from=noon, created_to=noon + timedelta(hours=1)
+            )
+        )
+        for expanded in batch
+    ]
+    after = PageCursor(created_at=noon, id=reviews[1].id)
+    page = repository.list_reviews_for_record(record_id, limit=10, after=after)
+
+    assert exported == [reviews[1]]
+    assert page == [reviews[0]]
+
+
+def test_async_facade_shares_the_store_and_the_errors(
+    repository: InMemoryReviewRepository,
+) -> None:
+    facade = AsyncInMemoryReviewRepository(repository)
+    review = _review(uuid4())
+
+    async def scenario() -> None:
+        created = await facade.create_review(review)
+        with pytest.raises(ReviewAlreadyExistsError):
+            await facade.create_review(replace(review, id=uuid4()))
+        with pytest.raises(ReviewNotFoundError):
+            await facade.delete_review(uuid4())
+        assert await facade.get_review(created.id) == repository.get_review(created.id)
+        vote = ReviewVote(review_id=uuid4(), user_id=uuid4(), useful=True)
+        assert await facade.upsert_votes([vote]) == VoteBatchResult(skipped=1)
+
+    asyncio.run(scenario())
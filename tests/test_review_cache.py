@@ -0,0 +1,171 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.features.reviews.domain.entities.review import Review
+from app.features.reviews.domain.entities.review_comment import ReviewComment
+from app.features.reviews.domain.entities.review_image import ReviewImage
+from app.features.reviews.domain.entities.review_vote import ReviewVote
+from app.features.reviews.domain.versions import VersionedResource
+from app.features.reviews.infrastructure.cache import ReviewCache
+from app.features.reviews.infrastructure.caching_repository import CachingReviewRepository
+from app.features.reviews.infrastructure.memory_repository import InMemoryReviewRepository
+
+
+@dataclass(slots=True)
+class _Routing:
+    reads_from_replica: bool = False
+
+
+def _review(record_id: UUID, rating: int = 3) -> Review:
+    return Review(
+        record_id=record_id,
+        user_id=uuid4(),
+        rent_amount=None,
+        review_text="Cerca del metro",
+        rating=rating,
+    )
+
+
+@pytest.fixture
+def store() -> InMemoryReviewRepository:
+    return InMemoryReviewRepository()
+
+
+@pytest.fixture
+def cache() -> ReviewCache:
+    return ReviewCache(max_entries=1_000, ttl_seconds=60)
+
+
+@pytest.fixture
+def repository(store: InMemoryReviewRepository, cache: ReviewCache) -> CachingReviewRepository:
+    return CachingReviewRepository(store, cache)
+
+
+# (escritura, lectura que debe verla) sobre una reseña ya creada.
+type _Case = tuple[
+    Callable[[CachingReviewRepository, Review], object],
+    Callable[[CachingReviewRepository, Review], object],
+]
+
+WRITE_PATHS: dict[str, _Case] = {
+    "create_review": (
+        lambda repo, review: repo.create_review(_review(review.record_id)),
+        lambda repo, review: len(repo.list_reviews_for_record(review.record_id, limit=10)),
+    ),
+    "create_review_with_images": (
+        lambda repo, review: repo.create_review_with_images(_review(review.record_id), []),
+        lambda repo, review: repo.get_record_stats(review.record_id).review_count,
+    ),
+    "import_reviews": (
+        lambda repo, review: repo.import_reviews([_review(review.record_id)]),
+        lambda repo, review: len(repo.list_reviews_for_record(review.record_id, limit=10)),
+    ),
+    "update_review": (
+        lambda repo, review: repo.update_review(review.id, rating=5),
+        lambda repo, review: getattr(repo.get_review(review.id), "rating", None),
+    ),
+    "delete_review": (
+        lambda repo, review: repo.delete_review(review.id),
+        lambda repo, review: repo.get_review(review.id),
+    ),
+    "add_image": (
+        lambda repo, review: repo.add_image(
+            ReviewImage(review_id=review.id, image_url="https://img.example.com/1.jpg")
+        ),
+        lambda repo, review: len(repo.list_images(review.id)),
+    ),
+    "add_comment": (
+        lambda repo, review: repo.add_comment(
+            ReviewComment(review_id=review.id, user_id=uuid4(), comment_text="Coincido")
+        ),
+        lambda repo, review: len(repo.list_comments(review.id, limit=10)),
+    ),
+    "upsert_vote": (
+        lambda repo, review: repo.upsert_vote(
+            ReviewVote(review_id=review.id, user_id=uuid4(), useful=True)
+        ),
+        lambda repo, review: repo.get_votes_summary(review.id),
+    ),
+    "upsert_votes": (
+        lambda repo, review: repo.upsert_votes(
+            [ReviewVote(review_id=review.id, user_id=uuid4(), useful=False)]
+        ),
+        lambda repo, review: repo.get_votes_summary(review.id),
+    ),
+}
+
+
+@pytest.mark.parametrize("write", WRITE_PATHS)
+def test_every_write_path_invalidates_what_it_changed(
+    repository: CachingReviewRepository, store: InMemoryReviewRepository, write: str
+) -> None:
+    apply, read = WRITE_PATHS[write]
+    review = repository.create_review(_review(uuid4()))
+    before = read(repository, review)
+    assert read(repository, review) == before  # la segunda lectura sale de la caché
+
+    apply(repository, review)
+
+    uncached = CachingReviewRepository(store, ReviewCache(max_entries=1, ttl_seconds=60))
+    assert read(repository, review) == read(uncached, review) != before
+
+
+def test_versions_share_the_tag_of_their_data(repository: CachingReviewRepository) -> None:
+    review = repository.create_review(_review(uuid4()))
+    version = repository.get_version(VersionedResource.REVIEW, review.id)
+
+    repository.update_review(review.id, review_text="Ruidosa de noche")
+
+    assert repository.get_version(VersionedResource.REVIEW, review.id) != version
+
+
+def test_a_read_that_crossed_a_write_is_not_stored(cache: ReviewCache) -> None:
+    generation = cache.generation("review:1")
+    cache.invalidate("review:1")  # la escritura se confirma mientras la lectura corría
+
+    cache.set("review:1", "", "fila anterior", generation=generation)
+
+    assert cache.get("review:1") is None
+
+
+def test_replica_reads_are_served_but_never_stored(
+    store: InMemoryReviewRepository, cache: ReviewCache
+) -> None:
+    routing = _Routing(reads_from_replica=True)
+    repository = CachingReviewRepository(store, cache, routing=routing)
+    review = store.create_review(_review(uuid4()))
+
+    assert repository.get_review(review.id) == review
+    assert repository.get_reviews([review.id]) == {review.id: review}
+    assert cache.stats.size == 0
+
+    # Lo que sí guardó una lectura del primario se atiende a las de réplica.
+    routing.reads_from_replica = False
+    repository.get_review(review.id)
+    routing.reads_from_replica = True
+    hits = cache.stats.hits
+    repository.get_review(review.id)
+    assert cache.stats.hits == hits + 1
+
+
+def test_primary_bound_reads_skip_cache_lookups(
+    store: InMemoryReviewRepository, cache: ReviewCache
+) -> None:
+    routing = _Routing(reads_from_replica=True)
+    repository = CachingReviewRepository(store, cache, routing=routing)
+    review = repository.create_review(_review(uuid4(), rating=2))
+    routing.reads_from_replica = False
+    repository.get_review(review.id)
+    # Una escritura de otro proceso: el nivel local de este no se entera.
+    store.update_review(review.id, rating=4)
+
+    routing.reads_from_replica = True
+    stale = repository.get_review(review.id)
+    routing.reads_from_replica = False
+    fresh = repository.get_review(review.id)
+
+    assert stale is not None and stale.rating == 2
+    assert fresh is not None and fresh.rating == 4
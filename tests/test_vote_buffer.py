@@ -0,0 +1,58 @@
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.features.reviews.infrastructure.vote_buffer import VoteBuffer
+from app.main import app
+from app.shared.infrastructure.metrics import registry
+from app.shared.infrastructure.settings import VoteBufferSettings, settings
+
+PREFIX = "/api/v1/reviews"
+
+
+@pytest.fixture(autouse=True)
+def buffered_votes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "vote_buffer", VoteBufferSettings(enabled=True))
+    monkeypatch.setattr(settings.metrics, "enabled", True)
+
+
+def _create_review(client: TestClient) -> str:
+    response = client.post(
+        f"{PREFIX}/",
+        json={
+            "record_id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "rent_amount": "950.00",
+            "review_text": "Buena ubicación",
+            "rating": 3,
+        },
+    )
+    assert response.status_code == 201, response.text
+    review_id: str = response.json()["id"]
+    return review_id
+
+
+def _delete_review(client: TestClient) -> str:
+    review_id = _create_review(client)
+    assert client.delete(f"{PREFIX}/{review_id}").status_code == 204
+    return review_id
+
+
+@pytest.mark.parametrize("review", ["missing", "deleted"])
+def test_vote_for_unknown_review_is_accepted_then_dropped(review: str) -> None:
+    # Al cerrar la app el buffer escribe lo pendiente: ahí se descubre que la reseña no existe.
+    with TestClient(app) as client:
+        review_id = str(uuid4()) if review == "missing" else _delete_review(client)
+        response = client.post(
+            f"{PREFIX}/{review_id}/votes", json={"user_id": str(uuid4()), "useful": True}
+        )
+        buffer = app.state.vote_queue
+
+    assert response.status_code == 202, response.text
+    assert isinstance(buffer, VoteBuffer)
+    assert buffer.stats.dropped_votes == 1
+    assert buffer.stats.flushed_votes == 0
+    assert buffer.stats.depth == 0
+    assert 'vote_buffer_votes_total{outcome="dropped"} 1' in registry.render()
+    assert UUID(response.json()["review_id"]) == UUID(review_id)